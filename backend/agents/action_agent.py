@@ -3,23 +3,34 @@ ActionAgent - Intelligent agent for complete action extraction and saving
 Handles the complete flow: raw_records -> actions (extract + save)
 """
 
+import asyncio
 import base64
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from core.db import get_db
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
-from perception.image_manager import get_image_manager
-from processing.image import get_image_compressor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.db import get_db
+from ..core.json_parser import parse_json_from_response
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
+from ..perception.image_manager import get_image_manager
+from ..processing.image import get_image_compressor
 
 logger = get_logger(__name__)
 
+# Bound once to skip the enum attribute lookup on every record
+SCREENSHOT = RecordType.SCREENSHOT_RECORD
+
+# How long (seconds) a language lookup is reused before re-reading settings
+LANGUAGE_CACHE_TTL = 5.0
+
+# Screenshots at or below this decoded size (bytes, ~3400 tokens) are sent as-is
+SKIP_COMPRESSION_BELOW_BYTES = 40 * 1024
+
 
 class ActionAgent:
     """
@@ -52,6 +63,12 @@ class ActionAgent:
             )
             self.image_compressor = None
 
+        # Cached language setting: (monotonic time of lookup, language)
+        self._lang_cache: Optional[Tuple[float, str]] = None
+
+        # Prompt resources per (language, category), built once and reused
+        self._prompt_cache: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+
         # Statistics
         self.stats: Dict[str, Any] = {
             "actions_extracted": 0,
@@ -63,7 +80,40 @@ class ActionAgent:
 
     def _get_language(self) -> str:
         """Get current language setting from config with caching"""
-        return self.settings.get_language()
+        now = time.monotonic()
+        if self._lang_cache and now - self._lang_cache[0] < LANGUAGE_CACHE_TTL:
+            return self._lang_cache[1]
+
+        language = self.settings.get_language()
+        self._lang_cache = (now, language)
+        return language
+
+    def _get_prompt_bundle(
+        self, language: str, category: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Get system prompt and LLM config params for a prompt category
+
+        Both are resolved once per (language, category) and reused by later
+        extractions instead of being rebuilt on every call.
+
+        Args:
+            language: Language code
+            category: Prompt category (e.g. "action_from_scenes")
+
+        Returns:
+            Tuple of (system prompt, config params)
+        """
+        key = (language, category)
+        bundle = self._prompt_cache.get(key)
+        if bundle is None:
+            prompt_manager = get_prompt_manager(language)
+            bundle = (
+                prompt_manager.get_system_prompt(category),
+                dict(prompt_manager.get_config_params(category)),
+            )
+            self._prompt_cache[key] = bundle
+        return bundle
 
     async def extract_and_save_actions(
         self,
@@ -103,51 +153,56 @@ class ActionAgent:
 
             # Step 2: Validate and resolve screenshot hashes
             screenshot_records = [
-                r for r in records if r.type == RecordType.SCREENSHOT_RECORD
+                r for r in records if r.type == SCREENSHOT
+            ]
+            earliest_ts = min((r.timestamp for r in screenshot_records), default=None)
+            screenshot_hashes = [
+                str((r.data or {}).get("hash") or "") for r in screenshot_records
             ]
 
             resolved_actions: List[Dict[str, Any]] = []
             for action_data in actions:
                 action_hashes = self._resolve_action_screenshot_hashes(
-                    action_data, records
+                    action_data, screenshot_hashes
                 )
                 if not action_hashes:
                     logger.warning(
                         "Dropping action: invalid image_index in action '%s'",
                         action_data.get("title", "<no title>"),
                     )
-                    self.stats["actions_filtered"] += 1
                     continue
 
                 resolved_actions.append({"data": action_data, "hashes": action_hashes})
 
-            # Step 3: Save actions to database
-            saved_count = 0
+            # Update filter statistics once per batch
+            self.stats["actions_filtered"] += len(actions) - len(resolved_actions)
+
+            # Step 3: Save actions to database (single bulk insert)
+            rows: List[Dict[str, Any]] = []
             for resolved in resolved_actions:
                 action_data = resolved["data"]
-                action_hashes = resolved["hashes"]
-                action_id = str(uuid.uuid4())
 
                 # Calculate timestamp specific to this action
                 image_indices = action_data.get("image_index") or action_data.get(
                     "imageIndex", []
                 )
                 action_timestamp = self._calculate_action_timestamp(
-                    image_indices, screenshot_records
+                    image_indices, screenshot_records, earliest_ts
                 )
 
-                # Save action to database
-                await self.db.actions.save(
-                    action_id=action_id,
-                    title=action_data["title"],
-                    description=action_data["description"],
-                    keywords=action_data.get("keywords", []),
-                    timestamp=action_timestamp.isoformat(),
-                    screenshots=action_hashes,
+                rows.append(
+                    {
+                        "action_id": str(uuid.uuid4()),
+                        "title": action_data["title"],
+                        "description": action_data["description"],
+                        "keywords": action_data.get("keywords", []),
+                        "timestamp": action_timestamp.isoformat(),
+                        "screenshots": resolved["hashes"],
+                    }
                 )
 
-                saved_count += 1
-                self.stats["actions_saved"] += 1
+            saved_count = await self._save_action_rows(rows)
+            self.stats["actions_saved"] += saved_count
 
             logger.debug(f"ActionAgent: Saved {saved_count} actions to database")
             return saved_count
@@ -156,6 +211,41 @@ class ActionAgent:
             logger.error(f"ActionAgent: Failed to process actions: {e}", exc_info=True)
             return 0
 
+    async def _save_action_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Persist action rows, preferring a single bulk insert
+
+        If the bulk insert fails (e.g. one malformed row aborts the whole
+        transaction), fall back to independent per-action saves, so the valid
+        actions are still stored.
+
+        Args:
+            rows: Action rows accepted by ActionsRepository.save()
+
+        Returns:
+            Number of actions saved
+        """
+        if not rows:
+            return 0
+
+        try:
+            return await self.db.actions.save_many(rows)
+        except Exception as exc:
+            logger.warning(
+                f"ActionAgent: Bulk save failed, saving {len(rows)} actions individually: {exc}"
+            )
+
+        saved_count = 0
+        for row in rows:
+            try:
+                await self.db.actions.save(**row)
+                saved_count += 1
+            except Exception as exc:
+                logger.error(
+                    f"ActionAgent: Failed to save action {row['action_id']}: {exc}"
+                )
+        return saved_count
+
     async def _extract_actions(
         self,
         records: List[RawRecord],
@@ -189,9 +279,9 @@ class ActionAgent:
             )
 
             # Get configuration parameters
-            language = self._get_language()
-            prompt_manager = get_prompt_manager(language)
-            config_params = prompt_manager.get_config_params("action_extraction")
+            _, config_params = self._get_prompt_bundle(
+                self._get_language(), "action_extraction"
+            )
 
             # Call LLM directly
             response = await self.llm_manager.chat_completion(messages, **config_params)
@@ -220,15 +310,17 @@ class ActionAgent:
             logger.error(f"ActionAgent: Failed to extract actions: {e}", exc_info=True)
             return []
 
+    @staticmethod
     def _resolve_action_screenshot_hashes(
-        self, action_data: Dict[str, Any], records: List[RawRecord]
+        action_data: Dict[str, Any], screenshot_hashes: List[str]
     ) -> Optional[List[str]]:
         """
         Resolve screenshot hashes based on image_index from LLM response
 
         Args:
             action_data: Action data containing image_index (or imageIndex)
-            records: All raw records (screenshots)
+            screenshot_hashes: Hash of each screenshot record ("" if missing),
+                precomputed once by the caller
 
         Returns:
             List of screenshot hashes filtered by image_index
@@ -236,37 +328,29 @@ class ActionAgent:
         # Get image_index from action data (support both snake_case and camelCase)
         image_indices = action_data.get("image_index") or action_data.get("imageIndex")
 
-        # Extract screenshot records
-        screenshot_records = [
-            r for r in records if r.type == RecordType.SCREENSHOT_RECORD
-        ]
-
         # If image_index is provided and valid
         if isinstance(image_indices, list) and image_indices:
-            normalized_hashes: List[str] = []
-            seen = set()
+            # Insertion-ordered dict doubles as the dedup set
+            seen_hashes: Dict[str, None] = {}
 
             for idx in image_indices:
                 try:
                     # Indices are zero-based per prompt
                     idx_int = int(idx)
-                    if 0 <= idx_int < len(screenshot_records):
-                        record = screenshot_records[idx_int]
-                        data = record.data or {}
-                        img_hash = data.get("hash")
+                    if 0 <= idx_int < len(screenshot_hashes):
+                        img_hash = screenshot_hashes[idx_int]
 
-                        # Add hash if valid and not duplicate
-                        if img_hash and str(img_hash) not in seen:
-                            seen.add(str(img_hash))
-                            normalized_hashes.append(str(img_hash))
+                        if img_hash:
+                            seen_hashes.setdefault(img_hash, None)
 
                             # Limit to 6 screenshots per action
-                            if len(normalized_hashes) >= 6:
+                            if len(seen_hashes) >= 6:
                                 break
                 except (ValueError, TypeError):
                     logger.warning(f"Invalid image_index value: {idx}")
                     return None
 
+            normalized_hashes = list(seen_hashes)
             if normalized_hashes:
                 logger.debug(
                     f"Resolved {len(normalized_hashes)} screenshot hashes from image_index {image_indices}"
@@ -276,8 +360,11 @@ class ActionAgent:
         logger.warning("Action missing valid image_index: %s", image_indices)
         return None
 
+    @staticmethod
     def _calculate_action_timestamp(
-        self, image_indices: List[int], screenshot_records: List[RawRecord]
+        image_indices: List[int],
+        screenshot_records: List[RawRecord],
+        earliest_ts: Optional[datetime],
     ) -> datetime:
         """
         Calculate action timestamp as earliest time among referenced screenshots
@@ -285,6 +372,7 @@ class ActionAgent:
         Args:
             image_indices: Screenshot indices from LLM (e.g., [0, 1, 2])
             screenshot_records: List of screenshot RawRecords
+            earliest_ts: Earliest screenshot timestamp (precomputed once per batch)
 
         Returns:
             Earliest timestamp among referenced screenshots
@@ -292,26 +380,33 @@ class ActionAgent:
         if not image_indices:
             # Fallback: use earliest screenshot overall
             logger.warning("Action has empty image_index, using earliest screenshot")
-            return min(r.timestamp for r in screenshot_records)
+            return earliest_ts or datetime.now()
 
-        # Validate indices
+        # Validate indices and track the earliest referenced time in one pass
         max_idx = len(screenshot_records) - 1
-        valid_indices = [i for i in image_indices if 0 <= i <= max_idx]
-
-        if not valid_indices:
+        earliest: Optional[datetime] = None
+        invalid: List[int] = []
+
+        for i in image_indices:
+            if 0 <= i <= max_idx:
+                ts = screenshot_records[i].timestamp
+                if earliest is None or ts < earliest:
+                    earliest = ts
+            else:
+                invalid.append(i)
+
+        if earliest is None:
             logger.warning(
                 f"Action has invalid image_indices {image_indices}, "
                 f"max valid index is {max_idx}. Using earliest screenshot."
             )
-            return min(r.timestamp for r in screenshot_records)
+            return earliest_ts or datetime.now()
 
-        if len(valid_indices) < len(image_indices):
-            invalid = set(image_indices) - set(valid_indices)
-            logger.warning(f"Ignoring invalid image indices: {invalid}")
+        if invalid:
+            logger.warning(f"Ignoring invalid image indices: {set(invalid)}")
 
-        # Return earliest timestamp among referenced screenshots
-        referenced_times = [screenshot_records[i].timestamp for i in valid_indices]
-        return min(referenced_times)
+        # Earliest timestamp among referenced screenshots
+        return earliest
 
     async def _validate_with_supervisor(
         self, actions: List[Dict[str, Any]]
@@ -366,55 +461,81 @@ class ActionAgent:
                 logger.debug("ActionAgent: No actions extracted from scenes")
                 return 0
 
-            # Step 2: Resolve screenshot hashes from scene_index
-            resolved_actions: List[Dict[str, Any]] = []
-            for action_data in actions:
-                action_hashes = self._resolve_action_screenshot_hashes_from_scenes(
-                    action_data, scenes
-                )
-                if not action_hashes:
-                    logger.warning(
-                        "Dropping action: invalid scene_index in action '%s'",
-                        action_data.get("title", "<no title>"),
-                    )
-                    self.stats["actions_filtered"] += 1
-                    continue
+            # Steps 2-3: Resolve screenshot hashes and save
+            return await self._save_scene_actions(scenes, actions)
 
-                resolved_actions.append({"data": action_data, "hashes": action_hashes})
+        except Exception as e:
+            logger.error(f"ActionAgent: Failed to process actions from scenes: {e}", exc_info=True)
+            return 0
 
-            # Step 3: Save actions to database
-            saved_count = 0
+    async def _save_scene_actions(
+        self, scenes: List[Dict[str, Any]], actions: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Resolve extracted actions against their scenes and save them
 
-            for resolved in resolved_actions:
-                action_data = resolved["data"]
-                action_hashes = resolved["hashes"]
-                action_id = str(uuid.uuid4())
+        Args:
+            scenes: Scene description dictionaries the actions were extracted from
+            actions: Actions returned by the LLM
 
-                # Calculate timestamp from scene_index
-                scene_indices = action_data.get("scene_index", [])
-                action_timestamp = self._calculate_action_timestamp_from_scenes(
-                    scene_indices, scenes
+        Returns:
+            Number of actions saved
+        """
+        # Precompute per-scene columns once (SoA) so every action
+        # resolves hashes/timestamps by plain indexing
+        scene_hashes = [str(scene.get("screenshot_hash") or "") for scene in scenes]
+        scene_times = [
+            self._parse_scene_timestamp(scene, idx)
+            for idx, scene in enumerate(scenes)
+        ]
+        parsed_times = [t for t in scene_times if t is not None]
+        earliest_scene_time = min(parsed_times) if parsed_times else None
+
+        # Step 2: Resolve screenshot hashes from scene_index
+        resolved_actions: List[Dict[str, Any]] = []
+        for action_data in actions:
+            action_hashes = self._resolve_action_screenshot_hashes_from_scenes(
+                action_data, scene_hashes
+            )
+            if not action_hashes:
+                logger.warning(
+                    "Dropping action: invalid scene_index in action '%s'",
+                    action_data.get("title", "<no title>"),
                 )
+                continue
 
-                # Save action to database
-                await self.db.actions.save(
-                    action_id=action_id,
-                    title=action_data["title"],
-                    description=action_data["description"],
-                    keywords=action_data.get("keywords", []),
-                    timestamp=action_timestamp.isoformat(),
-                    screenshots=action_hashes,
-                )
+            resolved_actions.append({"data": action_data, "hashes": action_hashes})
 
-                saved_count += 1
-                self.stats["actions_saved"] += 1
+        # Update filter statistics once per batch
+        self.stats["actions_filtered"] += len(actions) - len(resolved_actions)
 
-            logger.debug(f"ActionAgent: Saved {saved_count} actions to database")
-            return saved_count
+        # Step 3: Save actions to database (single bulk insert)
+        rows: List[Dict[str, Any]] = []
+        for resolved in resolved_actions:
+            action_data = resolved["data"]
 
-        except Exception as e:
-            logger.error(f"ActionAgent: Failed to process actions from scenes: {e}", exc_info=True)
-            return 0
+            # Calculate timestamp from scene_index
+            scene_indices = action_data.get("scene_index", [])
+            action_timestamp = self._calculate_action_timestamp_from_scenes(
+                scene_indices, scene_times, earliest_scene_time
+            )
+
+            rows.append(
+                {
+                    "action_id": str(uuid.uuid4()),
+                    "title": action_data["title"],
+                    "description": action_data["description"],
+                    "keywords": action_data.get("keywords", []),
+                    "timestamp": action_timestamp.isoformat(),
+                    "screenshots": resolved["hashes"],
+                }
+            )
+
+        saved_count = await self._save_action_rows(rows)
+        self.stats["actions_saved"] += saved_count
+
+        logger.debug(f"ActionAgent: Saved {saved_count} actions to database")
+        return saved_count
 
     async def _extract_actions_from_scenes(
         self,
@@ -450,9 +571,9 @@ class ActionAgent:
             )
 
             # Get configuration parameters
-            language = self._get_language()
-            prompt_manager = get_prompt_manager(language)
-            config_params = prompt_manager.get_config_params("action_from_scenes")
+            _, config_params = self._get_prompt_bundle(
+                self._get_language(), "action_from_scenes"
+            )
 
             # Call LLM directly
             response = await self.llm_manager.chat_completion(messages, **config_params)
@@ -480,15 +601,37 @@ class ActionAgent:
             logger.error(f"ActionAgent: Failed to extract actions from scenes: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def _parse_scene_timestamp(scene: Dict[str, Any], idx: int) -> Optional[datetime]:
+        """
+        Parse a scene's ISO timestamp once
+
+        Args:
+            scene: Scene description dictionary
+            idx: Scene position (for logging)
+
+        Returns:
+            Parsed datetime, or None if missing/invalid
+        """
+        timestamp_str = scene.get("timestamp")
+        if not timestamp_str:
+            return None
+        try:
+            return datetime.fromisoformat(timestamp_str)
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid timestamp format in scene {idx}: {timestamp_str}")
+            return None
+
+    @staticmethod
     def _resolve_action_screenshot_hashes_from_scenes(
-        self, action_data: Dict[str, Any], scenes: List[Dict[str, Any]]
+        action_data: Dict[str, Any], scene_hashes: List[str]
     ) -> Optional[List[str]]:
         """
         Resolve screenshot hashes based on scene_index from LLM response
 
         Args:
             action_data: Action data containing scene_index
-            scenes: List of scene description dictionaries
+            scene_hashes: Screenshot hash of each scene ("" if missing)
 
         Returns:
             List of screenshot hashes filtered by scene_index
@@ -498,29 +641,27 @@ class ActionAgent:
 
         # If scene_index is provided and valid
         if isinstance(scene_indices, list) and scene_indices:
-            normalized_hashes: List[str] = []
-            seen = set()
+            # Insertion-ordered dict doubles as the dedup set
+            seen_hashes: Dict[str, None] = {}
 
             for idx in scene_indices:
                 try:
                     # Indices are zero-based
                     idx_int = int(idx)
-                    if 0 <= idx_int < len(scenes):
-                        scene = scenes[idx_int]
-                        screenshot_hash = scene.get("screenshot_hash", "")
+                    if 0 <= idx_int < len(scene_hashes):
+                        screenshot_hash = scene_hashes[idx_int]
 
-                        # Add hash if valid and not duplicate
-                        if screenshot_hash and str(screenshot_hash) not in seen:
-                            seen.add(str(screenshot_hash))
-                            normalized_hashes.append(str(screenshot_hash))
+                        if screenshot_hash:
+                            seen_hashes.setdefault(screenshot_hash, None)
 
                             # Limit to 6 screenshots per action
-                            if len(normalized_hashes) >= 6:
+                            if len(seen_hashes) >= 6:
                                 break
-                except (ValueError, TypeError, KeyError):
+                except (ValueError, TypeError):
                     logger.warning(f"Invalid scene_index value: {idx}")
                     return None
 
+            normalized_hashes = list(seen_hashes)
             if normalized_hashes:
                 logger.debug(
                     f"Resolved {len(normalized_hashes)} screenshot hashes from scene_index {scene_indices}"
@@ -530,15 +671,19 @@ class ActionAgent:
         logger.warning("Action missing valid scene_index: %s", scene_indices)
         return None
 
+    @staticmethod
     def _calculate_action_timestamp_from_scenes(
-        self, scene_indices: List[int], scenes: List[Dict[str, Any]]
+        scene_indices: List[int],
+        scene_times: List[Optional[datetime]],
+        earliest_scene_time: Optional[datetime],
     ) -> datetime:
         """
         Calculate action timestamp as earliest time among referenced scenes
 
         Args:
             scene_indices: Scene indices from LLM (e.g., [0, 1, 2])
-            scenes: List of scene description dictionaries
+            scene_times: Pre-parsed timestamp of each scene (None if missing/invalid)
+            earliest_scene_time: Earliest timestamp over all scenes (precomputed)
 
         Returns:
             Earliest timestamp among referenced scenes
@@ -546,44 +691,35 @@ class ActionAgent:
         if not scene_indices:
             # Fallback: use earliest scene overall
             logger.warning("Action has empty scene_index, using earliest scene")
-            timestamps = [
-                datetime.fromisoformat(scene.get("timestamp", datetime.now().isoformat()))
-                for scene in scenes
-                if scene.get("timestamp")
-            ]
-            return min(timestamps) if timestamps else datetime.now()
-
-        # Validate indices
-        max_idx = len(scenes) - 1
-        valid_indices = [i for i in scene_indices if 0 <= i <= max_idx]
-
-        if not valid_indices:
+            return earliest_scene_time or datetime.now()
+
+        # Validate indices and track the earliest referenced time in one pass
+        max_idx = len(scene_times) - 1
+        earliest: Optional[datetime] = None
+        has_valid = False
+        invalid: List[int] = []
+
+        for i in scene_indices:
+            if 0 <= i <= max_idx:
+                has_valid = True
+                ts = scene_times[i]
+                if ts is not None and (earliest is None or ts < earliest):
+                    earliest = ts
+            else:
+                invalid.append(i)
+
+        if not has_valid:
             logger.warning(
                 f"Action has invalid scene_indices {scene_indices}, "
                 f"max valid index is {max_idx}. Using earliest scene."
             )
-            timestamps = [
-                datetime.fromisoformat(scene.get("timestamp", datetime.now().isoformat()))
-                for scene in scenes
-                if scene.get("timestamp")
-            ]
-            return min(timestamps) if timestamps else datetime.now()
+            return earliest_scene_time or datetime.now()
 
-        if len(valid_indices) < len(scene_indices):
-            invalid = set(scene_indices) - set(valid_indices)
-            logger.warning(f"Ignoring invalid scene indices: {invalid}")
+        if invalid:
+            logger.warning(f"Ignoring invalid scene indices: {set(invalid)}")
 
-        # Return earliest timestamp among referenced scenes
-        referenced_times = []
-        for i in valid_indices:
-            timestamp_str = scenes[i].get("timestamp")
-            if timestamp_str:
-                try:
-                    referenced_times.append(datetime.fromisoformat(timestamp_str))
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid timestamp format in scene {i}: {timestamp_str}")
-
-        return min(referenced_times) if referenced_times else datetime.now()
+        # Earliest timestamp among referenced scenes
+        return earliest or datetime.now()
 
     async def _build_action_extraction_messages(
         self,
@@ -607,7 +743,7 @@ class ActionAgent:
         # Get system prompt
         language = self._get_language()
         prompt_manager = get_prompt_manager(language)
-        system_prompt = prompt_manager.get_system_prompt("action_extraction")
+        system_prompt, _ = self._get_prompt_bundle(language, "action_extraction")
 
         # Get user prompt template and format
         user_prompt_base = prompt_manager.get_user_prompt(
@@ -637,7 +773,7 @@ class ActionAgent:
 
         # Build screenshot list with timestamps
         screenshot_records = [
-            r for r in records if r.type == RecordType.SCREENSHOT_RECORD
+            r for r in records if r.type == SCREENSHOT
         ]
         screenshot_list_lines = [
             f"Image {i} captured at {self._format_timestamp(r.timestamp)}"
@@ -668,23 +804,36 @@ class ActionAgent:
         content_items.append({"type": "text", "text": user_prompt})
 
         # Add screenshots (legacy code path - new architecture uses scenes)
-        screenshot_count = 0
         max_screenshots = 8  # Optimized: reduced from 20 to match config
-        for record in records:
-            if (
-                record.type == RecordType.SCREENSHOT_RECORD
-                and screenshot_count < max_screenshots
-            ):
-                is_first_image = screenshot_count == 0
-                img_data = self._get_record_image_data(record, is_first=is_first_image)
-                if img_data:
-                    content_items.append(
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": f"data:image/jpeg;base64,{img_data}"},
-                        }
-                    )
-                    screenshot_count += 1
+        # Repeated screenshots (same hash) are fetched and compressed once;
+        # records without a hash are always processed on their own
+        keys: List[Any] = []
+        unique_records: Dict[Any, RawRecord] = {}
+        for record in screenshot_records[:max_screenshots]:
+            key = (record.data or {}).get("hash") or id(record)
+            keys.append(key)
+            unique_records.setdefault(key, record)
+
+        # Decode/compress/encode runs in worker threads, so prepare all
+        # screenshots concurrently instead of blocking the loop one by one
+        optimized = await asyncio.gather(
+            *(
+                self._get_record_image_data(record, is_first=i == 0)
+                for i, record in enumerate(unique_records.values())
+            )
+        )
+        image_by_key = dict(zip(unique_records, optimized))
+        images = [image_by_key[key] for key in keys]
+        screenshot_count = 0
+        for img_data in images:
+            if img_data:
+                content_items.append(
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/jpeg;base64,{img_data}"},
+                    }
+                )
+                screenshot_count += 1
 
         logger.debug(f"Built extraction messages: {screenshot_count} screenshots")
 
@@ -714,7 +863,7 @@ class ActionAgent:
         # Get system prompt
         language = self._get_language()
         prompt_manager = get_prompt_manager(language)
-        system_prompt = prompt_manager.get_system_prompt("action_from_scenes")
+        system_prompt, _ = self._get_prompt_bundle(language, "action_from_scenes")
 
         # Format scenes as text
         scenes_text_parts = []
@@ -791,30 +940,36 @@ class ActionAgent:
 
         return "\n".join(context_parts) if context_parts else "No keyboard/mouse activity data available."
 
-    def _get_record_image_data(
+    async def _get_record_image_data(
         self, record: RawRecord, *, is_first: bool = False
     ) -> Optional[str]:
-        """Get screenshot record's base64 data and perform necessary compression"""
+        """
+        Get screenshot record's base64 data and perform necessary compression
+
+        Disk reads and the CPU-bound base64/PIL work run in a worker thread
+        so they do not block the event loop.
+        """
         try:
             data = record.data or {}
             # Directly read base64 carried in the record
             img_data = data.get("img_data")
-            if img_data:
-                return self._optimize_image_base64(img_data, is_first=is_first)
-            img_hash = data.get("hash")
-            if not img_hash:
-                return None
-
-            # Priority read from memory cache
-            cached = self.image_manager.get_from_cache(img_hash)
-            if cached:
-                return self._optimize_image_base64(cached, is_first=is_first)
-
-            # Fallback to read thumbnail
-            thumbnail = self.image_manager.load_thumbnail_base64(img_hash)
-            if thumbnail:
-                return self._optimize_image_base64(thumbnail, is_first=is_first)
-            return None
+            if not img_data:
+                img_hash = data.get("hash")
+                if not img_hash:
+                    return None
+
+                # Priority read from memory cache, fallback to read thumbnail
+                img_data = self.image_manager.get_from_cache(
+                    img_hash
+                ) or await asyncio.to_thread(
+                    self.image_manager.load_thumbnail_base64, img_hash
+                )
+                if not img_data:
+                    return None
+
+            return await asyncio.to_thread(
+                self._optimize_image_base64, img_data, is_first=is_first
+            )
         except Exception as e:
             logger.debug(f"Failed to get screenshot data: {e}")
             return None
@@ -824,18 +979,35 @@ class ActionAgent:
         if not base64_data or not self.image_compressor:
             return base64_data
 
+        # Small images gain little from a PIL re-encode; estimate the decoded
+        # size from the base64 length to avoid decoding them at all
+        if len(base64_data) * 3 // 4 <= SKIP_COMPRESSION_BELOW_BYTES:
+            return base64_data
+
         try:
             img_bytes = base64.b64decode(base64_data)
             optimized_bytes, meta = self.image_compressor.compress(img_bytes)
 
-            if optimized_bytes and optimized_bytes != img_bytes:
-                # Calculate token estimates
-                original_tokens = int(len(img_bytes) / 1024 * 85)
-                optimized_tokens = int(len(optimized_bytes) / 1024 * 85)
-                logger.debug(
-                    f"ActionAgent: Image compression completed "
-                    f"{original_tokens} → {optimized_tokens} tokens"
+            # Nothing changed (compressor fell back to the input): reuse the
+            # original string instead of paying for another encode pass.
+            # Compare lengths first so differing outputs skip the full scan.
+            if (
+                not optimized_bytes
+                or optimized_bytes is img_bytes
+                or (
+                    len(optimized_bytes) == len(img_bytes)
+                    and optimized_bytes == img_bytes
                 )
+            ):
+                return base64_data
+
+            # Calculate token estimates
+            original_tokens = int(len(img_bytes) / 1024 * 85)
+            optimized_tokens = int(len(optimized_bytes) / 1024 * 85)
+            logger.debug(
+                f"ActionAgent: Image compression completed "
+                f"{original_tokens} → {optimized_tokens} tokens"
+            )
             return base64.b64encode(optimized_bytes).decode("utf-8")
         except Exception as exc:
             logger.debug(
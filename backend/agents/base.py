@@ -6,7 +6,7 @@ Defines BaseAgent and registration mechanism
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
-from core.models import AgentTask
+from ..core.models import AgentTask
 
 
 class TaskResult:
@@ -50,16 +50,27 @@ class AgentFactory:
 
     def __init__(self):
         self._agents: Dict[str, type] = {}
+        # Agents hold no per-task state, so one instance per type is reused
+        self._instances: Dict[str, BaseAgent] = {}
 
     def register_agent(self, agent_type: str, agent_class: type):
         """Register agent class"""
         self._agents[agent_type] = agent_class
+        self._instances.pop(agent_type, None)
 
     def create_agent(self, agent_type: str) -> Optional[BaseAgent]:
         """Create agent instance"""
-        if agent_type in self._agents:
-            return self._agents[agent_type](agent_type)
-        return None
+        agent_class = self._agents.get(agent_type)
+        return agent_class(agent_type) if agent_class else None
+
+    def get_agent(self, agent_type: str) -> Optional[BaseAgent]:
+        """Get the shared agent instance, creating it on first use"""
+        agent = self._instances.get(agent_type)
+        if agent is None:
+            agent = self.create_agent(agent_type)
+            if agent is not None:
+                self._instances[agent_type] = agent
+        return agent
 
     def get_available_agents(self) -> list:
         """Get list of available agent types"""
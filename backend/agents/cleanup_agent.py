@@ -10,9 +10,9 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
-from core.db import get_db
-from core.logger import get_logger
-from perception.image_manager import ImageManager
+from ..core.db import get_db
+from ..core.logger import get_logger
+from ..perception.image_manager import ImageManager
 
 logger = get_logger(__name__)
 
@@ -55,6 +55,11 @@ class CleanupAgent:
         self.is_paused = False
         self.cleanup_task: Optional[asyncio.Task] = None
 
+        # Wakes the cleanup loop early (see trigger_now)
+        self._wakeup = asyncio.Event()
+        # Set when a scheduled cleanup was skipped because the agent was paused
+        self._cleanup_pending = False
+
         # Statistics
         self.stats: Dict[str, Any] = {
             "total_cleanups": 0,
@@ -62,6 +67,7 @@ class CleanupAgent:
             "last_cleanup_counts": {},
             "total_orphaned_images_cleaned": 0,
             "last_orphaned_images_count": 0,
+            "next_cleanup_at": None,
         }
 
         logger.debug(
@@ -120,23 +126,53 @@ class CleanupAgent:
         self.is_paused = False
         logger.debug("CleanupAgent resumed")
 
+        # Catch up on a cleanup that came due while paused
+        if self._cleanup_pending:
+            self.trigger_now()
+
+    def trigger_now(self):
+        """Run a cleanup as soon as possible instead of waiting for the next interval"""
+        if not self.is_running:
+            return
+
+        self._wakeup.set()
+        logger.debug("CleanupAgent cleanup triggered")
+
     async def _periodic_cleanup(self):
         """Scheduled task: cleanup soft-deleted records periodically"""
+        loop = asyncio.get_running_loop()
+        next_cleanup = loop.time() + self.cleanup_interval
+
         while self.is_running:
             try:
-                await asyncio.sleep(self.cleanup_interval)
+                remaining = max(0.0, next_cleanup - loop.time())
+                self.stats["next_cleanup_at"] = (
+                    datetime.now() + timedelta(seconds=remaining)
+                ).isoformat()
+
+                # Sleep until the next scheduled cleanup or an explicit trigger
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
 
                 # Skip processing if paused (system sleep)
                 if self.is_paused:
                     logger.debug("CleanupAgent paused, skipping cleanup")
+                    self._cleanup_pending = True
+                    next_cleanup = loop.time() + self.cleanup_interval
                     continue
 
+                self._cleanup_pending = False
                 await self._cleanup_old_data()
+                next_cleanup = loop.time() + self.cleanup_interval
             except asyncio.CancelledError:
                 logger.debug("Cleanup task cancelled")
                 break
             except Exception as e:
                 logger.error(f"Cleanup task exception: {e}", exc_info=True)
+                next_cleanup = loop.time() + self.cleanup_interval
 
     async def _cleanup_old_data(self):
         """Clean up old soft-deleted records and orphaned images"""
@@ -171,10 +207,12 @@ class CleanupAgent:
                     def get_referenced_hashes():
                         return self.db.actions.get_all_referenced_image_hashes()
 
-                    # Clean up orphaned images
-                    cleaned_images = self.image_manager.cleanup_orphaned_images(
+                    # Clean up orphaned images in a worker thread: the directory
+                    # scan and per-file unlinks are blocking syscalls
+                    cleaned_images = await asyncio.to_thread(
+                        self.image_manager.cleanup_orphaned_images,
                         get_referenced_hashes,
-                        safety_window_minutes=self.image_cleanup_safety_window_minutes
+                        safety_window_minutes=self.image_cleanup_safety_window_minutes,
                     )
 
                     # Update statistics
@@ -4,20 +4,45 @@ Aggregates actions into events using LLM
 """
 
 import asyncio
+import contextlib
 import json
+import time
 import uuid
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from core.db import get_db
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
+from ..core.db import get_db
+from ..core.json_parser import parse_json_from_response
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
+from .supervisor import EventSupervisor
 
 logger = get_logger(__name__)
 
+# How long (seconds) a language lookup is reused before re-reading settings
+LANGUAGE_CACHE_TTL = 5.0
+
+# Actions are sent to the LLM in time-contiguous chunks of at most this size
+AGGREGATION_CHUNK_SIZE = 32
+# An idle gap this long (seconds) between consecutive actions starts a new chunk
+AGGREGATION_SPLIT_GAP = 600
+# Maximum number of concurrent LLM aggregation calls
+AGGREGATION_MAX_CONCURRENCY = 8
+# How long (seconds) stop() lets an in-flight aggregation finish before cancelling
+STOP_GRACE_PERIOD = 1.0
+
+
+@dataclass(slots=True)
+class EventStats:
+    """EventAgent counters"""
+
+    events_created: int = 0
+    actions_aggregated: int = 0
+    last_aggregation_time: Optional[datetime] = None
+
 
 class EventAgent:
     """
@@ -33,6 +58,7 @@ class EventAgent:
         self,
         aggregation_interval: int = 600,  # 10 minutes
         time_window_hours: int = 1,  # Look back 1 hour for unaggregated actions
+        on_events_created: Optional[Callable[[int], None]] = None,
     ):
         """
         Initialize EventAgent
@@ -40,26 +66,32 @@ class EventAgent:
         Args:
             aggregation_interval: How often to run aggregation (seconds, default 10min)
             time_window_hours: Time window to look back for unaggregated actions (hours)
+            on_events_created: Callback receiving the number of events saved by each aggregation
         """
         self.aggregation_interval = aggregation_interval
         self.time_window_hours = time_window_hours
+        self.on_events_created_callback = on_events_created
 
         # Initialize components
         self.db = get_db()
         self.llm_manager = get_llm_manager()
         self.settings = get_settings()
 
+        # Cached language setting: (monotonic time of lookup, language)
+        self._lang_cache: Optional[Tuple[float, str]] = None
+
+        # Supervisors are stateless per language, so build each one once
+        self._supervisors: Dict[str, EventSupervisor] = {}
+
         # Running state
         self.is_running = False
         self.is_paused = False
         self.aggregation_task: Optional[asyncio.Task] = None
+        # Set by stop() so an idle aggregation loop exits without cancellation
+        self._stop_event = asyncio.Event()
 
         # Statistics
-        self.stats: Dict[str, Any] = {
-            "events_created": 0,
-            "actions_aggregated": 0,
-            "last_aggregation_time": None,
-        }
+        self.stats = EventStats()
 
         logger.debug(
             f"EventAgent initialized (interval: {aggregation_interval}s, "
@@ -68,7 +100,22 @@ class EventAgent:
 
     def _get_language(self) -> str:
         """Get current language setting from config with caching"""
-        return self.settings.get_language()
+        now = time.monotonic()
+        if self._lang_cache and now - self._lang_cache[0] < LANGUAGE_CACHE_TTL:
+            return self._lang_cache[1]
+
+        language = self.settings.get_language()
+        self._lang_cache = (now, language)
+        return language
+
+    def _get_supervisor(self) -> EventSupervisor:
+        """Get the supervisor for the current language, building it on first use"""
+        language = self._get_language()
+        supervisor = self._supervisors.get(language)
+        if supervisor is None:
+            supervisor = EventSupervisor(language=language)
+            self._supervisors[language] = supervisor
+        return supervisor
 
     async def start(self):
         """Start the event agent"""
@@ -77,6 +124,7 @@ class EventAgent:
             return
 
         self.is_running = True
+        self._stop_event.clear()
 
         # Start aggregation task
         self.aggregation_task = asyncio.create_task(self._periodic_event_aggregation())
@@ -93,13 +141,18 @@ class EventAgent:
         self.is_running = False
         self.is_paused = False
 
-        # Cancel aggregation task
+        # Wake the aggregation loop; only an aggregation that is still in
+        # flight after the grace period gets cancelled
+        self._stop_event.set()
         if self.aggregation_task:
-            self.aggregation_task.cancel()
-            try:
-                await self.aggregation_task
-            except asyncio.CancelledError:
-                pass
+            done, _ = await asyncio.wait(
+                {self.aggregation_task}, timeout=STOP_GRACE_PERIOD
+            )
+            if not done:
+                self.aggregation_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self.aggregation_task
+            self.aggregation_task = None
 
         logger.info("EventAgent stopped")
 
@@ -123,7 +176,13 @@ class EventAgent:
         """Scheduled task: aggregate events every N minutes"""
         while self.is_running:
             try:
-                await asyncio.sleep(self.aggregation_interval)
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=self.aggregation_interval
+                    )
+                    break  # Stop requested
+                except asyncio.TimeoutError:
+                    pass
 
                 # Skip processing if paused (system sleep)
                 if self.is_paused:
@@ -164,7 +223,9 @@ class EventAgent:
                 logger.debug("No events generated from action aggregation")
                 return
 
-            # Save events and update statistics
+            # Build event rows, then save them together
+            now = datetime.now()
+            rows: List[Dict[str, Any]] = []
             for event_data in events:
                 event_id = event_data.get("id")
                 if not event_id:
@@ -176,44 +237,99 @@ class EventAgent:
                     logger.warning(f"Event {event_id} has no source actions, skipping")
                     continue
 
-                # Convert timestamps
-                start_time = event_data.get("start_time", datetime.now())
-                end_time = event_data.get("end_time", start_time)
+                # Convert timestamps (single-action events share one value)
+                start_value = event_data.get("start_time") or now
+                end_value = event_data.get("end_time") or start_value
 
                 start_time = (
-                    start_time.isoformat()
-                    if isinstance(start_time, datetime)
-                    else str(start_time)
-                )
-                end_time = (
-                    end_time.isoformat()
-                    if isinstance(end_time, datetime)
-                    else str(end_time)
+                    start_value.isoformat()
+                    if isinstance(start_value, datetime)
+                    else str(start_value)
                 )
+                if end_value == start_value:
+                    end_time = start_time
+                else:
+                    end_time = (
+                        end_value.isoformat()
+                        if isinstance(end_value, datetime)
+                        else str(end_value)
+                    )
 
-                # Save event
-                await self.db.events.save(
-                    event_id=event_id,
-                    title=event_data.get("title", ""),
-                    description=event_data.get("description", ""),
-                    start_time=start_time,
-                    end_time=end_time,
-                    source_action_ids=[str(aid) for aid in source_action_ids if aid],
+                # Ids come from the actions table and are already non-empty
+                # strings; only rebuild the list when that does not hold
+                if not all(isinstance(aid, str) and aid for aid in source_action_ids):
+                    source_action_ids = [str(aid) for aid in source_action_ids if aid]
+
+                rows.append(
+                    {
+                        "event_id": event_id,
+                        "title": event_data.get("title", ""),
+                        "description": event_data.get("description", ""),
+                        "start_time": start_time,
+                        "end_time": end_time,
+                        "source_action_ids": source_action_ids,
+                    }
                 )
 
-                self.stats["events_created"] += 1
-                self.stats["actions_aggregated"] += len(source_action_ids)
+            saved_rows = await self._save_event_rows(rows)
+            saved_count = len(saved_rows)
+
+            # Let the downstream session aggregation know new events exist
+            if saved_count and self.on_events_created_callback:
+                try:
+                    self.on_events_created_callback(saved_count)
+                except Exception as e:
+                    logger.error(f"Failed to notify about created events: {e}")
 
-            self.stats["last_aggregation_time"] = datetime.now()
+            self.stats.events_created += saved_count
+            self.stats.actions_aggregated += sum(
+                len(row["source_action_ids"]) for row in saved_rows
+            )
+            self.stats.last_aggregation_time = now
 
             logger.debug(
-                f"Event aggregation completed: created {len(events)} events "
-                f"from {self.stats['actions_aggregated']} actions"
+                f"Event aggregation completed: created {saved_count} events "
+                f"from {self.stats.actions_aggregated} actions"
             )
 
         except Exception as e:
             logger.error(f"Failed to aggregate events: {e}", exc_info=True)
 
+    async def _save_event_rows(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Persist event rows, preferring a single bulk insert
+
+        If the bulk insert fails, fall back to independent per-event saves,
+        so the valid events are still stored.
+
+        Args:
+            rows: Event rows accepted by EventsRepository.save()
+
+        Returns:
+            The rows that were saved
+        """
+        if not rows:
+            return []
+
+        try:
+            await self.db.events.save_many(rows)
+            return rows
+        except Exception as exc:
+            logger.warning(
+                f"Bulk event save failed, saving {len(rows)} events individually: {exc}"
+            )
+
+        saved_rows = []
+        for row in rows:
+            try:
+                await self.db.events.save(**row)
+                saved_rows.append(row)
+            except Exception as exc:
+                logger.error(f"Failed to save event {row['event_id']}: {exc}")
+        return saved_rows
+
     async def _get_unaggregated_actions(
         self, since: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
@@ -231,47 +347,26 @@ class EventAgent:
             start_time = since or datetime.now() - timedelta(hours=self.time_window_hours)
             end_time = datetime.now()
 
-            # Get actions in timeframe
-            actions = await self.db.actions.get_in_timeframe(
+            # Get actions in timeframe that no event references yet
+            actions = await self.db.actions.get_unaggregated_in_timeframe(
                 start_time.isoformat(), end_time.isoformat()
             )
 
-            # Get all source action IDs that are already aggregated
-            aggregated_ids = set(await self.db.events.get_all_source_action_ids())
-
-            # Filter out already aggregated actions
-            result: List[Dict[str, Any]] = []
-            filtered_count = 0
-
-            for action in actions:
-                action_id = action.get("id")
-                if action_id in aggregated_ids:
-                    filtered_count += 1
-                    continue
-
-                # Normalize timestamp
-                timestamp_value = action.get("timestamp")
-                if isinstance(timestamp_value, str):
-                    try:
-                        timestamp_value = datetime.fromisoformat(timestamp_value)
-                    except ValueError:
-                        timestamp_value = datetime.now()
-
-                result.append(
-                    {
-                        "id": action_id,
-                        "title": action.get("title"),
-                        "description": action.get("description"),
-                        "keywords": action.get("keywords", []),
-                        "timestamp": timestamp_value,
-                        "created_at": action.get("created_at"),
-                    }
-                )
+            # Timestamps stay as stored ISO strings; only event bounds are
+            # parsed later, in _aggregate_actions_llm
+            result: List[Dict[str, Any]] = [
+                {
+                    "id": action.get("id"),
+                    "title": action.get("title"),
+                    "description": action.get("description"),
+                    "keywords": action.get("keywords", []),
+                    "timestamp": action.get("timestamp"),
+                    "created_at": action.get("created_at"),
+                }
+                for action in actions
+            ]
 
-            logger.debug(
-                f"Action filtering: {len(actions)} total, {filtered_count} already aggregated, "
-                f"{len(result)} remaining"
-            )
+            logger.debug(f"Found {len(result)} unaggregated actions")
 
             return result
 
@@ -297,8 +392,32 @@ class EventAgent:
         try:
             logger.debug(f"Aggregating {len(actions)} actions into events")
 
-            # Call LLM to aggregate
-            events = await self._aggregate_actions_llm(actions)
+            chunks = self._split_into_chunks(actions)
+
+            if len(chunks) == 1:
+                return await self._aggregate_actions_llm(chunks[0])
+
+            semaphore = asyncio.Semaphore(AGGREGATION_MAX_CONCURRENCY)
+
+            async def aggregate_chunk(
+                chunk: List[Dict[str, Any]],
+            ) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    try:
+                        return await self._aggregate_actions_llm(chunk)
+                    except Exception as e:
+                        # Keep one failed chunk from cancelling its siblings
+                        logger.error(f"Chunk aggregation failed: {e}", exc_info=True)
+                        return []
+
+            # The task group cancels every in-flight chunk if the aggregation
+            # task itself is cancelled (e.g. on stop())
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(aggregate_chunk(chunk)) for chunk in chunks]
+
+            events: List[Dict[str, Any]] = []
+            for task in tasks:
+                events.extend(task.result())
 
             logger.debug(
                 f"Aggregation completed: generated {len(events)} events (after validation)"
@@ -310,6 +429,46 @@ class EventAgent:
             logger.error(f"Failed to aggregate actions to events: {e}", exc_info=True)
             return []
 
+    def _split_into_chunks(
+        self, actions: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Pre-cluster actions into time-contiguous chunks for aggregation
+
+        Actions arrive ordered by timestamp. A new chunk starts at every idle
+        gap longer than AGGREGATION_SPLIT_GAP (actions on either side of a
+        break rarely belong to the same event) or when a chunk reaches
+        AGGREGATION_CHUNK_SIZE, so each LLM call only sees related actions.
+
+        Args:
+            actions: Action dictionaries ordered by timestamp
+
+        Returns:
+            List of action chunks
+        """
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        previous: Optional[datetime] = None
+
+        for action in actions:
+            timestamp = self._parse_timestamp(action.get("timestamp"))
+            gap_break = (
+                timestamp is not None
+                and previous is not None
+                and (timestamp - previous).total_seconds() > AGGREGATION_SPLIT_GAP
+            )
+            if current and (gap_break or len(current) >= AGGREGATION_CHUNK_SIZE):
+                chunks.append(current)
+                current = []
+            current.append(action)
+            if timestamp is not None:
+                previous = timestamp
+
+        if current:
+            chunks.append(current)
+
+        return chunks
+
     async def _aggregate_actions_llm(
         self, actions: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -363,6 +522,7 @@ class EventAgent:
             events_data = result.get("events", [])
 
             # Convert to complete event objects
+            now = datetime.now()
             events = []
             for event_data in events_data:
                 # Normalize and deduplicate the LLM provided source indexes
@@ -385,21 +545,21 @@ class EventAgent:
                 if not source_actions:
                     continue
 
-                # Get timestamps
-                start_time = None
-                end_time = None
-                for a in source_actions:
-                    timestamp = a.get("timestamp")
-                    if timestamp:
-                        if isinstance(timestamp, str):
-                            timestamp = datetime.fromisoformat(timestamp)
-                        if start_time is None or timestamp < start_time:
-                            start_time = timestamp
-                        if end_time is None or timestamp > end_time:
-                            end_time = timestamp
+                # Get timestamps: stored ISO strings share one format, so
+                # lexicographic order is chronological and only the bounds
+                # need to be parsed
+                timestamps = [
+                    a["timestamp"] for a in source_actions if a.get("timestamp")
+                ]
+                start_time = (
+                    self._parse_timestamp(min(timestamps)) if timestamps else None
+                )
+                end_time = (
+                    self._parse_timestamp(max(timestamps)) if timestamps else None
+                )
 
                 if not start_time:
-                    start_time = datetime.now()
+                    start_time = now
                 if not end_time:
                     end_time = start_time
 
@@ -410,7 +570,7 @@ class EventAgent:
                     "start_time": start_time,
                     "end_time": end_time,
                     "source_action_ids": source_action_ids,
-                    "created_at": datetime.now(),
+                    "created_at": now,
                 }
 
                 events.append(event)
@@ -428,6 +588,25 @@ class EventAgent:
             logger.error(f"Failed to aggregate events: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def _parse_timestamp(value: Any) -> Optional[datetime]:
+        """
+        Parse an action timestamp
+
+        Args:
+            value: ISO timestamp string or datetime
+
+        Returns:
+            Parsed datetime, or None if the value is invalid
+        """
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid action timestamp: {value}")
+            return None
+
     def _normalize_source_indexes(
         self, source_value: Any, max_index: int
     ) -> List[int]:
@@ -482,9 +661,7 @@ class EventAgent:
             return events
 
         try:
-            from agents.supervisor import EventSupervisor
-
-            supervisor = EventSupervisor(language=self._get_language())
+            supervisor = self._get_supervisor()
 
             # Prepare events for validation (only title and description)
             events_for_validation = [
@@ -566,5 +743,5 @@ class EventAgent:
             "aggregation_interval": self.aggregation_interval,
             "time_window_hours": self.time_window_hours,
             "language": self._get_language(),
-            "stats": self.stats.copy(),
+            "stats": asdict(self.stats),
         }
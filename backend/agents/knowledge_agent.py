@@ -5,20 +5,33 @@ Extracts knowledge from screenshots and merges related knowledge periodically
 
 import asyncio
 import json
+import time
 import uuid
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from core.db import get_db
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.models import RawRecord
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
+from ..core.db import get_db
+from ..core.json_parser import parse_json_from_response
+from ..core.logger import get_logger
+from ..core.models import RawRecord
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
+from .supervisor import KnowledgeSupervisor
 
 logger = get_logger(__name__)
 
+# How long (seconds) a language lookup is reused before re-reading settings
+LANGUAGE_CACHE_TTL = 5.0
+
+
+@dataclass(slots=True)
+class KnowledgeStats:
+    """KnowledgeAgent counters"""
+
+    knowledge_extracted: int = 0
+
 
 class KnowledgeAgent:
     """
@@ -42,16 +55,35 @@ class KnowledgeAgent:
         self.llm_manager = get_llm_manager()
         self.settings = get_settings()
 
+        # Cached language setting: (monotonic time of lookup, language)
+        self._lang_cache: Optional[Tuple[float, str]] = None
+
+        # Supervisors are stateless per language, so build each one once
+        self._supervisors: Dict[str, KnowledgeSupervisor] = {}
+
         # Statistics
-        self.stats: Dict[str, Any] = {
-            "knowledge_extracted": 0,
-        }
+        self.stats = KnowledgeStats()
 
         logger.debug("KnowledgeAgent initialized")
 
     def _get_language(self) -> str:
         """Get current language setting from config with caching"""
-        return self.settings.get_language()
+        now = time.monotonic()
+        if self._lang_cache and now - self._lang_cache[0] < LANGUAGE_CACHE_TTL:
+            return self._lang_cache[1]
+
+        language = self.settings.get_language()
+        self._lang_cache = (now, language)
+        return language
+
+    def _get_supervisor(self) -> KnowledgeSupervisor:
+        """Get the supervisor for the current language, building it on first use"""
+        language = self._get_language()
+        supervisor = self._supervisors.get(language)
+        if supervisor is None:
+            supervisor = KnowledgeSupervisor(language=language)
+            self._supervisors[language] = supervisor
+        return supervisor
 
     async def _validate_with_supervisor(
         self, knowledge_list: List[Dict[str, Any]]
@@ -66,10 +98,7 @@ class KnowledgeAgent:
             Validated/revised knowledge list
         """
         try:
-            from agents.supervisor import KnowledgeSupervisor
-
-            language = self._get_language()
-            supervisor = KnowledgeSupervisor(language=language)
+            supervisor = self._get_supervisor()
 
             result = await supervisor.validate(knowledge_list)
 
@@ -103,7 +132,7 @@ class KnowledgeAgent:
         """Get statistics information"""
         return {
             "language": self._get_language(),
-            "stats": self.stats.copy(),
+            "stats": asdict(self.stats),
         }
 
     # ============ Scene-Based Extraction (Memory-Only) ============
@@ -151,24 +180,25 @@ class KnowledgeAgent:
                 knowledge_list = await self._validate_with_supervisor(knowledge_list)
 
             # Step 3: Save knowledge items to database
-            saved_count = 0
-            for knowledge_data in knowledge_list:
-                knowledge_id = str(uuid.uuid4())
-
-                # Calculate timestamp from scenes
-                scene_timestamp = self._calculate_knowledge_timestamp_from_scenes(scenes)
-
-                await self.db.knowledge.save(
-                    knowledge_id=knowledge_id,
-                    title=knowledge_data.get("title", ""),
-                    description=knowledge_data.get("description", ""),
-                    keywords=knowledge_data.get("keywords", []),
-                    created_at=scene_timestamp.isoformat(),
-                    source_action_id=source_action_id,  # Link to action if provided
-                )
-                saved_count += 1
-
-            self.stats["knowledge_extracted"] += saved_count
+            # All items share the scenes' earliest timestamp, so compute it once
+            created_at = self._calculate_knowledge_timestamp_from_scenes(
+                scenes
+            ).isoformat()
+            rows = [
+                {
+                    "knowledge_id": str(uuid.uuid4()),
+                    "title": knowledge_data.get("title", ""),
+                    "description": knowledge_data.get("description", ""),
+                    "keywords": knowledge_data.get("keywords", []),
+                    "created_at": created_at,
+                    "source_action_id": source_action_id,  # Link to action if provided
+                }
+                for knowledge_data in knowledge_list
+            ]
+
+            saved_count = await self.db.knowledge.save_many(rows)
+
+            self.stats.knowledge_extracted += saved_count
 
             logger.debug(
                 f"KnowledgeAgent: Extracted and saved {saved_count} knowledge items from scenes"
@@ -366,19 +396,18 @@ class KnowledgeAgent:
         Returns:
             Earliest timestamp among scenes
         """
-        if not scenes:
-            return datetime.now()
-
-        timestamps = []
+        earliest: Optional[datetime] = None
         for scene in scenes:
             timestamp_str = scene.get("timestamp")
-            if timestamp_str:
-                try:
-                    timestamps.append(datetime.fromisoformat(timestamp_str))
-                except (ValueError, TypeError):
-                    logger.warning(
-                        f"Invalid timestamp format in scene: {timestamp_str}"
-                    )
-
-        return min(timestamps) if timestamps else datetime.now()
+            if not timestamp_str:
+                continue
+            try:
+                timestamp = datetime.fromisoformat(timestamp_str)
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid timestamp format in scene: {timestamp_str}")
+                continue
+            if earliest is None or timestamp < earliest:
+                earliest = timestamp
+
+        return earliest or datetime.now()
 
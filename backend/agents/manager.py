@@ -4,11 +4,14 @@ Responsible for managing Agent task creation, execution and status updates
 """
 
 import asyncio
+import itertools
+import sys
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from core.logger import get_logger
-from core.models import AgentConfig, AgentTask, AgentTaskStatus
+from ..core.logger import get_logger
+from ..core.models import AgentConfig, AgentTask, AgentTaskStatus
 
 from .base import AgentFactory
 from .simple_agent import (
@@ -21,15 +24,102 @@ from .simple_agent import (
 
 logger = get_logger(__name__)
 
+# The agent registry is static, so share one immutable snapshot with callers
+_AVAILABLE_AGENTS: Tuple[AgentConfig, ...] = tuple(AVAILABLE_AGENTS)
+
+
+class _TaskUpdateBatcher:
+    """
+    Coalesce agent task update events before sending them to the frontend
+
+    Updates are buffered per task id (the latest state wins) and sent as a
+    single event after ``flush_interval`` seconds, or immediately once
+    ``max_batch`` distinct tasks are pending. Outside a running event loop
+    updates are sent right away.
+    """
+
+    def __init__(self, flush_interval: float = 0.1, max_batch: int = 50):
+        """
+        Initialize batcher
+
+        Args:
+            flush_interval: Delay (seconds) before buffered updates are sent
+            max_batch: Number of pending tasks that triggers an immediate flush
+        """
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # emit_agent_task_updates, imported on first flush
+        self._emit: Optional[Callable[..., Any]] = None
+
+    def add(self, task_id: str, **update: Any) -> None:
+        """Buffer an update for a task, replacing any pending one"""
+        self._pending.pop(task_id, None)
+        self._pending[task_id] = update
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Send all buffered updates"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            emit = self._emit
+            if emit is None:
+                from ..core.events import emit_agent_task_updates
+
+                emit = self._emit = emit_agent_task_updates
+
+            emit(
+                [
+                    {"task_id": task_id, **update}
+                    for task_id, update in pending.items()
+                ]
+            )
+        except Exception as e:
+            logger.error(f"Failed to send task update events: {str(e)}")
+
 
 class AgentTaskManager:
     """Agent task manager"""
 
-    def __init__(self):
+    def __init__(self, max_parallel: int = 4, max_tasks: int = 5000):
+        """
+        Initialize task manager
+
+        Args:
+            max_parallel: Maximum number of agent tasks executing at the same time
+            max_tasks: Number of tasks kept in memory before the oldest finished
+                       ones are evicted
+        """
         self.tasks: Dict[str, AgentTask] = {}
+        self.max_tasks = max_tasks
+        # Disambiguates task ids created within the same clock tick
+        self._id_counter = itertools.count()
         self.factory = AgentFactory()
         self._register_agents()
         self._running_tasks: Dict[str, asyncio.Task] = {}
+        self.max_parallel = max_parallel
+        # Bounds concurrent agent executions; extra tasks wait for a free slot
+        self._semaphore = asyncio.Semaphore(max_parallel)
+        # Coalesces status change events sent to the frontend
+        self._update_batcher = _TaskUpdateBatcher()
 
     def _register_agents(self):
         """Register all available agents"""
@@ -43,25 +133,46 @@ class AgentTaskManager:
         self, agent: str, plan_description: str, scheduled_date: Optional[str] = None
     ) -> AgentTask:
         """Create new agent task"""
-        task_id = f"task_{int(datetime.now().timestamp() * 1000)}"
+        task_id = f"task_{time.monotonic_ns()}_{next(self._id_counter)}"
 
         # Default status is PENDING (in inbox), unless scheduled_date is provided
         status = AgentTaskStatus.TODO if scheduled_date else AgentTaskStatus.PENDING
 
+        # Agent names and dates repeat across tasks, so share one string each
         task = AgentTask(
             id=task_id,
-            agent=agent,
+            agent=sys.intern(agent),
             plan_description=plan_description,
             status=status,
             created_at=datetime.now(),
-            scheduled_date=scheduled_date,
+            scheduled_date=sys.intern(scheduled_date) if scheduled_date else None,
         )
 
         self.tasks[task_id] = task
         logger.debug(f"Created task: {task_id} - {agent} (status: {status.value})")
 
+        if len(self.tasks) > self.max_tasks:
+            self._evict_finished_tasks()
+
         return task
 
+    def _evict_finished_tasks(self):
+        """Drop the oldest finished (done/failed) tasks until under max_tasks"""
+        excess = len(self.tasks) - self.max_tasks
+        evicted = []
+        for task_id, task in self.tasks.items():
+            if len(evicted) >= excess:
+                break
+            if task.status in (AgentTaskStatus.DONE, AgentTaskStatus.FAILED):
+                evicted.append(task_id)
+
+        for task_id in evicted:
+            del self.tasks[task_id]
+            self._running_tasks.pop(task_id, None)
+
+        if evicted:
+            logger.debug(f"Evicted {len(evicted)} finished tasks (cap: {self.max_tasks})")
+
     def get_task(self, task_id: str) -> Optional[AgentTask]:
         """Get task"""
         return self.tasks.get(task_id)
@@ -70,23 +181,25 @@ class AgentTaskManager:
         self, limit: int = 50, status: Optional[str] = None
     ) -> List[AgentTask]:
         """Get task list"""
-        tasks = list(self.tasks.values())
-
-        if status:
-            tasks = [task for task in tasks if task.status.value == status]
-
-        # Sort by creation time in descending order
-        tasks.sort(key=lambda x: x.created_at, reverse=True)
+        # Tasks are inserted as they are created, so walking the dict backwards
+        # yields them newest first without sorting
+        tasks: List[AgentTask] = []
+        for task in reversed(self.tasks.values()):
+            if len(tasks) >= limit:
+                break
+            if status and task.status.value != status:
+                continue
+            tasks.append(task)
 
-        return tasks[:limit]
+        return tasks
 
     def delete_task(self, task_id: str) -> bool:
         """Delete task"""
         if task_id in self.tasks:
             # If task is running, stop it first
-            if task_id in self._running_tasks:
-                self._running_tasks[task_id].cancel()
-                del self._running_tasks[task_id]
+            running = self._running_tasks.pop(task_id, None)
+            if running:
+                running.cancel()
 
             del self.tasks[task_id]
             logger.debug(f"Deleted task: {task_id}")
@@ -106,8 +219,8 @@ class AgentTaskManager:
             )
             return False
 
-        # Create agent instance
-        agent_instance = self.factory.create_agent(task.agent)
+        # Get agent instance (shared by all tasks of the same agent type)
+        agent_instance = self.factory.get_agent(task.agent)
         if not agent_instance:
             logger.error(f"Cannot create agent: {task.agent}")
             self._update_task_status(
@@ -123,14 +236,17 @@ class AgentTaskManager:
             )
             return False
 
-        # Update task status to processing
-        self._update_task_status(
-            task_id, AgentTaskStatus.PROCESSING, started_at=datetime.now()
-        )
+        if task_id in self._running_tasks:
+            logger.warning(f"Task is already queued for execution: {task_id}")
+            return False
 
-        # Create async task
+        # Create async task; the record is dropped once it finishes, however
+        # it ends (stop/delete may already have removed it)
         async_task = asyncio.create_task(self._run_task(task, agent_instance))
         self._running_tasks[task_id] = async_task
+        async_task.add_done_callback(
+            lambda _: self._running_tasks.pop(task_id, None)
+        )
 
         logger.debug(f"Starting task execution: {task_id}")
         return True
@@ -138,8 +254,12 @@ class AgentTaskManager:
     async def _run_task(self, task: AgentTask, agent_instance):
         """Run task"""
         try:
-            # Execute task
-            result = await agent_instance.execute(task)
+            # Execute task once a slot is free; it stays TODO while waiting
+            async with self._semaphore:
+                self._update_task_status(
+                    task.id, AgentTaskStatus.PROCESSING, started_at=datetime.now()
+                )
+                result = await agent_instance.execute(task)
 
             if result.success:
                 # Task completed successfully
@@ -166,19 +286,17 @@ class AgentTaskManager:
                 logger.error(f"Task execution failed: {task.id} - {result.message}")
 
         except asyncio.CancelledError:
-            # Task was cancelled
-            self._update_task_status(
-                task.id, AgentTaskStatus.FAILED, error="Task was cancelled"
-            )
+            # stop_task() already recorded why the task ended
+            if task.status == AgentTaskStatus.PROCESSING:
+                self._update_task_status(
+                    task.id, AgentTaskStatus.FAILED, error="Task was cancelled"
+                )
             logger.debug(f"Task was cancelled: {task.id}")
+            raise
         except Exception as e:
             # Task execution exception
             self._update_task_status(task.id, AgentTaskStatus.FAILED, error=str(e))
             logger.error(f"Task execution exception: {task.id} - {str(e)}")
-        finally:
-            # Clean up running task record
-            if task.id in self._running_tasks:
-                del self._running_tasks[task.id]
 
     def _update_task_status(self, task_id: str, status: AgentTaskStatus, **kwargs):
         """Update task status"""
@@ -199,29 +317,28 @@ class AgentTaskManager:
 
             logger.debug(f"Updated task status: {task_id} - {status.value}")
 
-            # Send task update event to frontend
-            try:
-                from core.events import emit_agent_task_update
+            # Queue task update event for the frontend
+            self._update_batcher.add(
+                task_id,
+                status=status.value,
+                progress=kwargs.get("duration"),
+                result=kwargs.get("result"),
+                error=kwargs.get("error"),
+            )
 
-                emit_agent_task_update(
-                    task_id=task_id,
-                    status=status.value,
-                    progress=kwargs.get("duration"),
-                    result=kwargs.get("result"),
-                    error=kwargs.get("error"),
-                )
-            except Exception as e:
-                logger.error(f"Failed to send task update event: {str(e)}")
+    def flush_updates(self) -> None:
+        """Send any buffered task update events right away (e.g. on shutdown)"""
+        self._update_batcher.flush()
 
-    def get_available_agents(self) -> List[AgentConfig]:
-        """Get available agent list"""
-        return AVAILABLE_AGENTS.copy()
+    def get_available_agents(self) -> Tuple[AgentConfig, ...]:
+        """Get available agent list (read-only; copy it before mutating)"""
+        return _AVAILABLE_AGENTS
 
     def stop_task(self, task_id: str) -> bool:
         """Stop task"""
-        if task_id in self._running_tasks:
-            self._running_tasks[task_id].cancel()
-            del self._running_tasks[task_id]
+        running = self._running_tasks.pop(task_id, None)
+        if running:
+            running.cancel()
             self._update_task_status(
                 task_id, AgentTaskStatus.FAILED, error="Task was manually stopped"
             )
@@ -243,7 +360,7 @@ class AgentTaskManager:
             )
             return False
 
-        task.scheduled_date = scheduled_date
+        task.scheduled_date = sys.intern(scheduled_date)
         task.status = AgentTaskStatus.TODO
         logger.debug(f"Scheduled task {task_id} to {scheduled_date}")
         return True
@@ -269,27 +386,42 @@ class AgentTaskManager:
 
     def get_tasks_by_date(self, scheduled_date: str) -> List[AgentTask]:
         """Get tasks scheduled for a specific date"""
-        tasks = [
+        # Oldest first: insertion order is creation order
+        return [
             task
             for task in self.tasks.values()
             if task.scheduled_date == scheduled_date
-            and task.status in [AgentTaskStatus.TODO, AgentTaskStatus.PROCESSING]
+            and task.status in (AgentTaskStatus.TODO, AgentTaskStatus.PROCESSING)
         ]
-        # Sort by creation time
-        tasks.sort(key=lambda x: x.created_at)
-        return tasks
 
     def get_pending_tasks(self) -> List[AgentTask]:
         """Get all pending tasks (not scheduled yet)"""
-        tasks = [
+        # Newest first: reverse insertion (creation) order
+        return [
             task
-            for task in self.tasks.values()
+            for task in reversed(self.tasks.values())
             if task.status == AgentTaskStatus.PENDING
         ]
-        # Sort by creation time in descending order
-        tasks.sort(key=lambda x: x.created_at, reverse=True)
-        return tasks
 
 
 # Global task manager instance
-task_manager = AgentTaskManager()
+_task_manager: Optional[AgentTaskManager] = None
+
+
+def get_task_manager() -> AgentTaskManager:
+    """
+    Get the global agent task manager instance (created on first use)
+
+    Returns:
+        AgentTaskManager singleton
+    """
+    global _task_manager
+    if _task_manager is None:
+        _task_manager = AgentTaskManager()
+    return _task_manager
+
+
+def flush_task_updates() -> None:
+    """Send buffered agent task updates, if the task manager has been created"""
+    if _task_manager is not None:
+        _task_manager.flush_updates()
@@ -3,20 +3,46 @@ RawAgent - Extract structured scene descriptions from screenshots (memory-only)
 Processes raw screenshots once, outputs structured text data for reuse by other agents
 """
 
-from typing import Any, Dict, List, Optional
-
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import PromptManager
-from perception.image_manager import get_image_manager
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.json_parser import parse_json_from_response_async
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import PromptManager
+from ..perception.image_manager import get_image_manager
 
 # Image processing now handled by ProcessingPipeline's ImageFilter
 
 logger = get_logger(__name__)
 
+# Data URL prefix of the (JPEG) screenshots sent to the LLM
+_IMAGE_URL_PREFIX = "data:image/jpeg;base64,"
+
+# Maximum number of concurrent LLM requests when a round spans several batches
+SCENE_EXTRACTION_MAX_CONCURRENCY = 4
+
+# Text fields every scene carries (missing ones default to "")
+_SCENE_TEXT_FIELDS = (
+    "visual_summary",
+    "detected_text",
+    "ui_elements",
+    "application_context",
+    "inferred_activity",
+    "focus_areas",
+)
+
+
+@dataclass(slots=True)
+class RawStats:
+    """RawAgent counters"""
+
+    scenes_extracted: int = 0
+    extraction_rounds: int = 0
+
 
 class RawAgent:
     """
@@ -37,7 +63,7 @@ class RawAgent:
         Initialize RawAgent
 
         Args:
-            max_screenshots: Maximum number of screenshots to send to LLM per extraction
+            max_screenshots: Maximum number of screenshots to send to LLM per request
         """
         self.llm_manager = get_llm_manager()
         self.settings = get_settings()
@@ -52,10 +78,7 @@ class RawAgent:
         self.image_manager = get_image_manager()
 
         # Statistics
-        self.stats: Dict[str, Any] = {
-            "scenes_extracted": 0,
-            "extraction_rounds": 0,
-        }
+        self.stats = RawStats()
 
         logger.debug(f"RawAgent initialized (max_screenshots: {max_screenshots})")
 
@@ -107,95 +130,153 @@ class RawAgent:
         try:
             logger.debug(f"RawAgent: Extracting scenes from {len(records)} records")
 
+            screenshot_records = [
+                r for r in records if r.type == RecordType.SCREENSHOT_RECORD
+            ]
+            if not screenshot_records:
+                logger.debug("RawAgent: No screenshots to extract scenes from")
+                return []
+
             # Refresh prompt manager if language changed
             self._refresh_prompt_manager()
 
             # Build input usage hint from keyboard/mouse records
             input_usage_hint = self._build_input_usage_hint(keyboard_records, mouse_records)
 
-            # Build messages (including screenshots)
-            messages = await self._build_scene_extraction_messages(
-                records, input_usage_hint
-            )
-
             # Get configuration parameters
             config_params = self.prompt_manager.get_config_params("raw_extraction")
 
-            # Call LLM directly
-            response = await self.llm_manager.chat_completion(messages, **config_params)
-            content = response.get("content", "").strip()
+            # Send at most max_screenshots per LLM request; oversized rounds are
+            # split into batches whose requests run concurrently
+            batch_size = max(1, self.max_screenshots)
+            semaphore = asyncio.Semaphore(SCENE_EXTRACTION_MAX_CONCURRENCY)
+
+            async def extract_batch(offset: int) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    try:
+                        return await self._extract_batch_scenes(
+                            screenshot_records[offset : offset + batch_size],
+                            offset,
+                            input_usage_hint,
+                            config_params,
+                        )
+                    except Exception as e:
+                        # Keep one failed batch from discarding the others
+                        logger.error(
+                            f"RawAgent: Scene extraction batch at {offset} failed: {e}",
+                            exc_info=True,
+                        )
+                        return []
 
-            # Parse JSON
-            result = parse_json_from_response(content)
+            batch_results = await asyncio.gather(
+                *(
+                    extract_batch(offset)
+                    for offset in range(0, len(screenshot_records), batch_size)
+                )
+            )
+            enriched_scenes = [scene for scenes in batch_results for scene in scenes]
 
-            if not isinstance(result, dict):
-                logger.warning(f"LLM returned incorrect format: {content[:200]}")
-                return []
+            self.stats.scenes_extracted += len(enriched_scenes)
+            self.stats.extraction_rounds += 1
 
-            scenes = result.get("scenes", [])
+            logger.debug(f"RawAgent: Extracted {len(enriched_scenes)} scene descriptions")
+            return enriched_scenes
 
-            # Enrich scene data with screenshot hashes and timestamps
-            screenshot_records = [
-                r for r in records if r.type == RecordType.SCREENSHOT_RECORD
-            ]
+        except Exception as e:
+            logger.error(f"RawAgent: Failed to extract scenes: {e}", exc_info=True)
+            return []
 
-            enriched_scenes = []
-            for scene in scenes:
-                # Validate scene is a dictionary
-                if not isinstance(scene, dict):
-                    logger.warning(f"Scene is not a dict (got {type(scene).__name__}): {scene}")
-                    continue
+    async def _extract_batch_scenes(
+        self,
+        screenshot_records: List[RawRecord],
+        offset: int,
+        input_usage_hint: str,
+        config_params: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract scene descriptions for one batch of screenshots
 
-                try:
-                    screenshot_index = scene.get("screenshot_index", 0)
+        Args:
+            screenshot_records: Screenshot records of this batch
+            offset: Index of the batch's first screenshot in the whole round
+            input_usage_hint: Keyboard/mouse activity hint
+            config_params: LLM configuration parameters
 
-                    # Validate index
-                    if 0 <= screenshot_index < len(screenshot_records):
-                        screenshot_record = screenshot_records[screenshot_index]
-                        screenshot_hash = screenshot_record.data.get("hash", "")
-                        timestamp = screenshot_record.timestamp.isoformat()
-
-                        enriched_scenes.append(
-                            {
-                                "screenshot_index": screenshot_index,
-                                "screenshot_hash": screenshot_hash,
-                                "timestamp": timestamp,
-                                "visual_summary": scene.get("visual_summary", ""),
-                                "detected_text": scene.get("detected_text", ""),
-                                "ui_elements": scene.get("ui_elements", ""),
-                                "application_context": scene.get("application_context", ""),
-                                "inferred_activity": scene.get("inferred_activity", ""),
-                                "focus_areas": scene.get("focus_areas", ""),
-                            }
-                        )
-                    else:
-                        logger.warning(
-                            f"Invalid screenshot_index {screenshot_index} in scene (max {len(screenshot_records)-1})"
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to process scene: {e}", exc_info=True)
-                    continue
+        Returns:
+            Enriched scenes, with screenshot_index relative to the whole round
+        """
+        # Build messages (including screenshots)
+        messages = await self._build_scene_extraction_messages(
+            screenshot_records, input_usage_hint
+        )
 
-            self.stats["scenes_extracted"] += len(enriched_scenes)
-            self.stats["extraction_rounds"] += 1
+        # Call LLM directly
+        response = await self.llm_manager.chat_completion(messages, **config_params)
+        content = response.get("content", "").strip()
 
-            logger.debug(f"RawAgent: Extracted {len(enriched_scenes)} scene descriptions")
-            return enriched_scenes
+        # Parse JSON
+        result = await parse_json_from_response_async(content)
 
-        except Exception as e:
-            logger.error(f"RawAgent: Failed to extract scenes: {e}", exc_info=True)
+        if not isinstance(result, dict):
+            logger.warning(f"LLM returned incorrect format: {content[:200]}")
             return []
 
+        scenes = result.get("scenes", [])
+
+        # (hash, ISO timestamp) per screenshot index, computed on first use
+        # since several scenes may describe the same screenshot
+        screenshot_meta: Dict[int, Tuple[str, str]] = {}
+
+        # Enrich scene data with screenshot hashes and timestamps
+        enriched_scenes = []
+        for scene in scenes:
+            # Validate scene is a dictionary
+            if not isinstance(scene, dict):
+                logger.warning(f"Scene is not a dict (got {type(scene).__name__}): {scene}")
+                continue
+
+            try:
+                screenshot_index = scene.get("screenshot_index", 0)
+
+                # Validate index
+                if 0 <= screenshot_index < len(screenshot_records):
+                    meta = screenshot_meta.get(screenshot_index)
+                    if meta is None:
+                        screenshot_record = screenshot_records[screenshot_index]
+                        meta = (
+                            screenshot_record.data.get("hash", ""),
+                            screenshot_record.timestamp.isoformat(),
+                        )
+                        screenshot_meta[screenshot_index] = meta
+
+                    # Enrich the parsed scene in place instead of copying it
+                    for field in _SCENE_TEXT_FIELDS:
+                        if field not in scene:
+                            scene[field] = ""
+                    scene["screenshot_index"] = offset + screenshot_index
+                    scene["screenshot_hash"], scene["timestamp"] = meta
+
+                    enriched_scenes.append(scene)
+                else:
+                    logger.warning(
+                        f"Invalid screenshot_index {screenshot_index} in scene (max {len(screenshot_records)-1})"
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to process scene: {e}", exc_info=True)
+                continue
+
+        return enriched_scenes
+
     async def _build_scene_extraction_messages(
         self,
-        records: List[RawRecord],
+        screenshot_records: List[RawRecord],
         input_usage_hint: str,
     ) -> List[Dict[str, Any]]:
         """
         Build scene extraction messages (including system prompt, user prompt, screenshots)
 
         Args:
-            records: Record list (mainly screenshots)
+            screenshot_records: Screenshot records (already filtered by the caller)
             input_usage_hint: Keyboard/mouse activity hint
 
         Returns:
@@ -211,28 +292,24 @@ class RawAgent:
             input_usage_hint=input_usage_hint,
         )
 
-        # Build message content (text + screenshots)
-        content_items = [{"type": "text", "text": user_prompt_base}]
-
         # Add preprocessed screenshots
         # At this point, all screenshots have been filtered, optimized, and sampled by ProcessingPipeline
-        screenshot_records = [
-            r for r in records if r.type == RecordType.SCREENSHOT_RECORD
+        # (image data is already optimized by ImageFilter)
+        images = [
+            img_data
+            for img_data in map(self._get_preprocessed_image_data, screenshot_records)
+            if img_data
         ]
+        screenshot_count = len(images)
 
-        screenshot_count = 0
-        for record in screenshot_records:
-            # Get preprocessed image data (already optimized by ImageFilter)
-            img_data = self._get_preprocessed_image_data(record)
-
-            if img_data:
-                content_items.append(
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:image/jpeg;base64,{img_data}"},
-                    }
-                )
-                screenshot_count += 1
+        # Build message content (text + screenshots)
+        content_items: List[Dict[str, Any]] = [
+            {"type": "text", "text": user_prompt_base}
+        ]
+        content_items.extend(
+            {"type": "image_url", "image_url": {"url": _IMAGE_URL_PREFIX + img_data}}
+            for img_data in images
+        )
 
         logger.debug(
             f"Built scene extraction messages with {screenshot_count} preprocessed screenshots"
@@ -264,23 +341,35 @@ class RawAgent:
         context_parts = []
 
         if keyboard_records:
-            keyboard_times = [r.timestamp for r in keyboard_records]
-            if keyboard_times:
-                time_range = self._format_time_range(
-                    min(keyboard_times), max(keyboard_times)
-                )
-                context_parts.append(f"Keyboard activity: {time_range}")
+            time_range = self._format_time_range(*self._time_bounds(keyboard_records))
+            context_parts.append(f"Keyboard activity: {time_range}")
 
         if mouse_records:
-            mouse_times = [r.timestamp for r in mouse_records]
-            if mouse_times:
-                time_range = self._format_time_range(
-                    min(mouse_times), max(mouse_times)
-                )
-                context_parts.append(f"Mouse activity: {time_range}")
+            time_range = self._format_time_range(*self._time_bounds(mouse_records))
+            context_parts.append(f"Mouse activity: {time_range}")
 
         return "\n".join(context_parts) if context_parts else "No keyboard/mouse activity data available."
 
+    @staticmethod
+    def _time_bounds(records: List[RawRecord]) -> Tuple[Any, Any]:
+        """
+        Get earliest and latest timestamps of non-empty records in one pass
+
+        Args:
+            records: Non-empty record list
+
+        Returns:
+            (earliest, latest) timestamps
+        """
+        earliest = latest = records[0].timestamp
+        for record in records:
+            timestamp = record.timestamp
+            if timestamp < earliest:
+                earliest = timestamp
+            elif timestamp > latest:
+                latest = timestamp
+        return earliest, latest
+
     def _get_preprocessed_image_data(self, record: RawRecord) -> Optional[str]:
         """
         Get preprocessed image data from record
@@ -350,5 +439,5 @@ class RawAgent:
         """Get statistics information"""
         return {
             "language": self._get_language(),
-            "stats": self.stats.copy(),
+            "stats": asdict(self.stats),
         }
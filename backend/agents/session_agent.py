@@ -4,20 +4,56 @@ Aggregates Events (medium-grained work segments) into Activities (coarse-grained
 """
 
 import asyncio
+import hashlib
 import json
 import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
-
-from core.db import get_db
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple
+
+from ..core.db import get_db
+from ..core.json_parser import (
+    parse_json_from_response,
+    parse_json_from_response_async,
+)
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
 
 logger = get_logger(__name__)
 
+# Number of newly created events that triggers a session aggregation round
+# before the regular interval elapses
+WAKEUP_EVENT_THRESHOLD = 20
+
+# Up to this many events spanning at most time_window_min form one session
+# directly, without asking the LLM to cluster them
+TRIVIAL_SESSION_MAX_EVENTS = 3
+
+# Event descriptions longer than this are truncated in the clustering prompt
+CLUSTERING_DESCRIPTION_MAX_CHARS = 1000
+
+# Number of merge/split pattern analyses kept, keyed by a hash of their input
+PATTERN_CACHE_SIZE = 512
+
+# Preference types of the patterns learned from user merges/splits
+LEARNED_PATTERN_TYPES = ("merge_pattern", "split_pattern")
+
+# Merge/split analyses requested within this window (seconds) share one LLM call
+PATTERN_BATCH_WINDOW = 0.05
+
+
+@dataclass(slots=True)
+class SessionStats:
+    """SessionAgent counters"""
+
+    activities_created: int = 0
+    events_aggregated: int = 0
+    events_filtered_quality: int = 0  # Events filtered due to quality criteria
+    last_aggregation_time: Optional[datetime] = None
+
 
 class SessionAgent:
     """
@@ -70,14 +106,27 @@ class SessionAgent:
         self.is_running = False
         self.is_paused = False
         self.aggregation_task: Optional[asyncio.Task] = None
+        # Set once enough new events are waiting, to aggregate them early
+        self._wakeup = asyncio.Event()
+        self._pending_event_count = 0
+        # Pattern-learning tasks started by record_user_merge/split
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Clustering prompt per language: (system prompt, user template, config params)
+        self._clustering_prompts: Dict[str, Tuple[str, str, Dict[str, Any]]] = {}
+
+        # Learned merge/split patterns: pattern id (derived from the operation
+        # summary, see _pattern_id) -> pattern; seeded from the database on start
+        self._pattern_cache: OrderedDict[str, str] = OrderedDict()
+        # Pattern analyses waiting for the next fused LLM call:
+        # (single-operation messages, operation summary, result future)
+        self._pending_patterns: List[
+            Tuple[List[Dict[str, Any]], str, asyncio.Future]
+        ] = []
+        self._pattern_flush_scheduled = False
 
         # Statistics
-        self.stats: Dict[str, Any] = {
-            "activities_created": 0,
-            "events_aggregated": 0,
-            "events_filtered_quality": 0,  # Events filtered due to quality criteria
-            "last_aggregation_time": None,
-        }
+        self.stats = SessionStats()
 
         logger.debug(
             f"SessionAgent initialized (interval: {aggregation_interval}s, "
@@ -98,6 +147,8 @@ class SessionAgent:
 
         self.is_running = True
 
+        await self._load_learned_patterns()
+
         # Start aggregation task
         self.aggregation_task = asyncio.create_task(
             self._periodic_session_aggregation()
@@ -123,6 +174,19 @@ class SessionAgent:
             except asyncio.CancelledError:
                 pass
 
+        # Cancel pattern analyses still waiting for a flush, then the
+        # pattern-learning and flush tasks themselves
+        pending, self._pending_patterns = self._pending_patterns, []
+        self._pattern_flush_scheduled = False
+        for _, _, future in pending:
+            future.cancel()
+
+        background_tasks = list(self._background_tasks)
+        for task in background_tasks:
+            task.cancel()
+        if background_tasks:
+            await asyncio.gather(*background_tasks, return_exceptions=True)
+
         logger.info("SessionAgent stopped")
 
     def pause(self):
@@ -141,11 +205,33 @@ class SessionAgent:
         self.is_paused = False
         logger.debug("SessionAgent resumed")
 
+    def notify_events_created(self, count: int) -> None:
+        """
+        Record newly created events; wake the aggregation loop once
+        WAKEUP_EVENT_THRESHOLD of them are waiting
+
+        Args:
+            count: Number of events just created
+        """
+        self._pending_event_count += count
+        if self._pending_event_count >= WAKEUP_EVENT_THRESHOLD:
+            self._wakeup.set()
+
     async def _periodic_session_aggregation(self):
-        """Scheduled task: aggregate sessions every N minutes"""
+        """Scheduled task: aggregate sessions every N minutes, or earlier once enough events arrive"""
         while self.is_running:
             try:
-                await asyncio.sleep(self.aggregation_interval)
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.aggregation_interval
+                    )
+                    logger.debug(
+                        f"SessionAgent woken early by {self._pending_event_count} new events"
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                self._pending_event_count = 0
 
                 # Skip processing if paused (system sleep)
                 if self.is_paused:
@@ -191,34 +277,38 @@ class SessionAgent:
             # Merge with existing activities before saving
             activities_to_save, activities_to_update = await self._merge_with_existing_activities(activities)
 
+            # Collect every activity write and event assignment, then persist
+            # them in one transaction each
+            activity_rows: List[Dict[str, Any]] = []
+            assignments: Dict[str, List[str]] = {}
+
             # Update existing activities
             for update_data in activities_to_update:
-                await self.db.activities.save(
-                    activity_id=update_data["id"],
-                    title=update_data["title"],
-                    description=update_data["description"],
-                    start_time=update_data["start_time"].isoformat() if isinstance(update_data["start_time"], datetime) else update_data["start_time"],
-                    end_time=update_data["end_time"].isoformat() if isinstance(update_data["end_time"], datetime) else update_data["end_time"],
-                    source_event_ids=update_data["source_event_ids"],
-                    session_duration_minutes=update_data.get("session_duration_minutes"),
-                    topic_tags=update_data.get("topic_tags", []),
+                activity_rows.append(
+                    {
+                        "activity_id": update_data["id"],
+                        "title": update_data["title"],
+                        "description": update_data["description"],
+                        "start_time": update_data["start_time"].isoformat(),
+                        "end_time": update_data["end_time"].isoformat(),
+                        "source_event_ids": update_data["source_event_ids"],
+                        "session_duration_minutes": update_data.get("session_duration_minutes"),
+                        "topic_tags": update_data.get("topic_tags", []),
+                    }
                 )
 
                 # Mark new events as aggregated to this existing activity
                 new_event_ids = update_data.get("_new_event_ids", [])
                 if new_event_ids:
-                    await self.db.events.mark_as_aggregated(
-                        event_ids=new_event_ids,
-                        activity_id=update_data["id"],
-                    )
-                    self.stats["events_aggregated"] += len(new_event_ids)
+                    assignments[update_data["id"]] = new_event_ids
 
                 logger.debug(
-                    f"Updated existing activity {update_data['id']} with {len(new_event_ids)} new events "
+                    f"Updating existing activity {update_data['id']} with {len(new_event_ids)} new events "
                     f"(merge reason: {update_data.get('_merge_reason', 'unknown')})"
                 )
 
             # Save new activities
+            new_activity_count = 0
             for activity_data in activities_to_save:
                 activity_id = activity_data["id"]
                 source_event_ids = activity_data.get("source_event_ids", [])
@@ -227,47 +317,42 @@ class SessionAgent:
                     logger.warning(f"Activity {activity_id} has no source events, skipping")
                     continue
 
-                # Calculate session duration
-                start_time = activity_data.get("start_time")
-                end_time = activity_data.get("end_time")
-                session_duration_minutes = None
-
-                if start_time and end_time:
-                    if isinstance(start_time, str):
-                        start_time = datetime.fromisoformat(start_time)
-                    if isinstance(end_time, str):
-                        end_time = datetime.fromisoformat(end_time)
-
-                    duration = end_time - start_time
-                    session_duration_minutes = int(duration.total_seconds() / 60)
-
-                # Save activity
-                await self.db.activities.save(
-                    activity_id=activity_id,
-                    title=activity_data.get("title", ""),
-                    description=activity_data.get("description", ""),
-                    start_time=activity_data["start_time"].isoformat() if isinstance(activity_data["start_time"], datetime) else activity_data["start_time"],
-                    end_time=activity_data["end_time"].isoformat() if isinstance(activity_data["end_time"], datetime) else activity_data["end_time"],
-                    source_event_ids=source_event_ids,
-                    session_duration_minutes=session_duration_minutes,
-                    topic_tags=activity_data.get("topic_tags", []),
+                # Clustering always yields datetime start/end times
+                start_time: datetime = activity_data["start_time"]
+                end_time: datetime = activity_data["end_time"]
+                session_duration_minutes = int(
+                    (end_time - start_time).total_seconds() / 60
                 )
 
-                # Mark events as aggregated
-                await self.db.events.mark_as_aggregated(
-                    event_ids=source_event_ids,
-                    activity_id=activity_id,
+                activity_rows.append(
+                    {
+                        "activity_id": activity_id,
+                        "title": activity_data.get("title", ""),
+                        "description": activity_data.get("description", ""),
+                        "start_time": start_time.isoformat(),
+                        "end_time": end_time.isoformat(),
+                        "source_event_ids": source_event_ids,
+                        "session_duration_minutes": session_duration_minutes,
+                        "topic_tags": activity_data.get("topic_tags", []),
+                    }
                 )
 
-                self.stats["activities_created"] += 1
-                self.stats["events_aggregated"] += len(source_event_ids)
+                # Mark events as aggregated
+                assignments[activity_id] = source_event_ids
+                new_activity_count += 1
+
+            await self.db.activities.save_many(activity_rows)
+            marked_count = await self.db.events.mark_as_aggregated_many(assignments)
+
+            self.stats.activities_created += new_activity_count
+            self.stats.events_aggregated += marked_count
 
-            self.stats["last_aggregation_time"] = datetime.now()
+            self.stats.last_aggregation_time = datetime.now()
 
             logger.debug(
                 f"Session aggregation completed: created {len(activities_to_save)} new activities, "
                 f"updated {len(activities_to_update)} existing activities, "
-                f"from {self.stats['events_aggregated']} events"
+                f"from {self.stats.events_aggregated} events"
             )
 
         except Exception as e:
@@ -290,62 +375,22 @@ class SessionAgent:
             start_time = since or datetime.now() - timedelta(hours=2)
             end_time = datetime.now()
 
-            # Get events in timeframe
-            events = await self.db.events.get_in_timeframe(
-                start_time.isoformat(), end_time.isoformat()
+            # Aggregation state and quality thresholds are filtered in SQL
+            result, quality_filtered_count = (
+                await self.db.events.get_unaggregated_in_timeframe(
+                    start_time.isoformat(),
+                    end_time.isoformat(),
+                    min_actions=self.min_event_actions,
+                    min_duration_seconds=self.min_event_duration_seconds,
+                )
             )
 
-            # Filter out already aggregated events and apply quality filters
-            result: List[Dict[str, Any]] = []
-            filtered_count = 0
-            quality_filtered_count = 0
-
-            for event in events:
-                # Skip already aggregated events (using aggregated_into_activity_id field)
-                if event.get("aggregated_into_activity_id"):
-                    filtered_count += 1
-                    continue
-
-                # Quality filter 1: Check minimum number of actions
-                source_action_ids = event.get("source_action_ids", [])
-                if len(source_action_ids) < self.min_event_actions:
-                    quality_filtered_count += 1
-                    logger.debug(
-                        f"Filtering out event {event.get('id')} - insufficient actions "
-                        f"({len(source_action_ids)} < {self.min_event_actions})"
-                    )
-                    continue
-
-                # Quality filter 2: Check minimum duration
-                start_time_str = event.get("start_time")
-                end_time_str = event.get("end_time")
-
-                if start_time_str and end_time_str:
-                    try:
-                        event_start = datetime.fromisoformat(start_time_str) if isinstance(start_time_str, str) else start_time_str
-                        event_end = datetime.fromisoformat(end_time_str) if isinstance(end_time_str, str) else end_time_str
-                        duration_seconds = (event_end - event_start).total_seconds()
-
-                        if duration_seconds < self.min_event_duration_seconds:
-                            quality_filtered_count += 1
-                            logger.debug(
-                                f"Filtering out event {event.get('id')} - too short "
-                                f"({duration_seconds:.1f}s < {self.min_event_duration_seconds}s)"
-                            )
-                            continue
-                    except Exception as parse_error:
-                        logger.warning(f"Failed to parse event timestamps: {parse_error}")
-                        # If we can't parse timestamps, allow the event through
-                        pass
-
-                result.append(event)
-
             # Update statistics
-            self.stats["events_filtered_quality"] += quality_filtered_count
+            self.stats.events_filtered_quality += quality_filtered_count
 
             logger.debug(
-                f"Event filtering: {len(events)} total, {filtered_count} already aggregated, "
-                f"{quality_filtered_count} quality-filtered, {len(result)} remaining"
+                f"Event filtering: {quality_filtered_count} quality-filtered, "
+                f"{len(result)} remaining"
             )
 
             return result
@@ -370,6 +415,13 @@ class SessionAgent:
             return []
 
         try:
+            trivial_session = self._build_trivial_session(events)
+            if trivial_session is not None:
+                logger.debug(
+                    f"Clustering skipped: {len(events)} events form a single session"
+                )
+                return [trivial_session]
+
             logger.debug(f"Clustering {len(events)} events into sessions")
 
             # Build events JSON with index
@@ -377,32 +429,42 @@ class SessionAgent:
                 {
                     "index": i + 1,
                     "title": event.get("title", ""),
-                    "description": event.get("description", ""),
+                    "description": (event.get("description") or "")[
+                        :CLUSTERING_DESCRIPTION_MAX_CHARS
+                    ],
                     "start_time": event.get("start_time", ""),
                     "end_time": event.get("end_time", ""),
                 }
                 for i, event in enumerate(events)
             ]
-            events_json = json.dumps(events_with_index, ensure_ascii=False, indent=2)
+            # Compact separators: indentation only costs prompt tokens
+            events_json = json.dumps(
+                events_with_index, ensure_ascii=False, separators=(",", ":")
+            )
 
-            # Get current language and prompt manager
-            language = self._get_language()
-            prompt_manager = get_prompt_manager(language)
+            system_prompt, user_template, config_params = self._get_clustering_prompt(
+                self._get_language()
+            )
 
             # Build messages
-            messages = prompt_manager.build_messages(
-                "session_aggregation", "user_prompt_template", events_json=events_json
-            )
+            try:
+                user_prompt = user_template.format(events_json=events_json)
+            except KeyError as e:
+                logger.error(f"Failed to format prompt, missing parameter: {e}")
+                user_prompt = user_template
 
-            # Get configuration parameters
-            config_params = prompt_manager.get_config_params("session_aggregation")
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            if user_prompt:
+                messages.append({"role": "user", "content": user_prompt})
 
             # Call LLM
             response = await self.llm_manager.chat_completion(messages, **config_params)
             content = response.get("content", "").strip()
 
             # Parse JSON
-            result = parse_json_from_response(content)
+            result = await parse_json_from_response_async(content)
 
             if not isinstance(result, dict):
                 logger.warning(f"Session clustering result format error: {content[:200]}")
@@ -410,6 +472,10 @@ class SessionAgent:
 
             activities_data = result.get("activities", [])
 
+            # (start, end) per event index, parsed on first use since the
+            # same event may be referenced by several activities
+            event_times: Dict[int, Tuple[Any, Any]] = {}
+
             # Convert to complete activity objects
             activities = []
             for activity_data in activities_data:
@@ -422,40 +488,28 @@ class SessionAgent:
                     continue
 
                 source_event_ids: List[str] = []
-                source_events: List[Dict[str, Any]] = []
+                source_times: List[Tuple[Any, Any]] = []
                 for idx in normalized_indexes:
                     event = events[idx - 1]
                     event_id = event.get("id")
                     if event_id:
                         source_event_ids.append(event_id)
-                    source_events.append(event)
 
-                if not source_events:
-                    continue
+                    times = event_times.get(idx)
+                    if times is None:
+                        times = (
+                            self._to_datetime(event.get("start_time")),
+                            self._to_datetime(event.get("end_time")),
+                        )
+                        event_times[idx] = times
+                    source_times.append(times)
 
-                # Get timestamps
-                start_time = None
-                end_time = None
-                for e in source_events:
-                    st = e.get("start_time")
-                    et = e.get("end_time")
-
-                    if st:
-                        if isinstance(st, str):
-                            st = datetime.fromisoformat(st)
-                        if start_time is None or st < start_time:
-                            start_time = st
-
-                    if et:
-                        if isinstance(et, str):
-                            et = datetime.fromisoformat(et)
-                        if end_time is None or et > end_time:
-                            end_time = et
-
-                if not start_time:
-                    start_time = datetime.now()
-                if not end_time:
-                    end_time = start_time
+                start_time = min(
+                    (st for st, _ in source_times if st), default=None
+                ) or datetime.now()
+                end_time = max(
+                    (et for _, et in source_times if et), default=None
+                ) or start_time
 
                 # Extract topic tags from LLM response if provided
                 topic_tags = activity_data.get("topic_tags", [])
@@ -464,7 +518,7 @@ class SessionAgent:
                     topic_tags = []
 
                 activity = {
-                    "id": str(uuid.uuid4()),
+                    "id": str(uuid.uuid7()),
                     "title": activity_data.get("title", "Unnamed session"),
                     "description": activity_data.get("description", ""),
                     "start_time": start_time,
@@ -498,6 +552,81 @@ class SessionAgent:
             logger.error(f"Failed to cluster events to sessions: {e}", exc_info=True)
             return []
 
+    def _build_trivial_session(
+        self, events: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the only possible session for a small, short batch of events
+
+        Args:
+            events: List of event dictionaries
+
+        Returns:
+            Activity dictionary, or None if the events need LLM clustering
+        """
+        if len(events) > TRIVIAL_SESSION_MAX_EVENTS:
+            return None
+
+        start_time = None
+        end_time = None
+        for event in events:
+            st = self._to_datetime(event.get("start_time"))
+            et = self._to_datetime(event.get("end_time"))
+            if not st or not et:
+                return None
+            if start_time is None or st < start_time:
+                start_time = st
+            if end_time is None or et > end_time:
+                end_time = et
+
+        if end_time - start_time > timedelta(minutes=self.time_window_min):
+            return None
+
+        source_event_ids = [event["id"] for event in events if event.get("id")]
+        if not source_event_ids:
+            return None
+
+        titles = [event["title"] for event in events if event.get("title")]
+        descriptions = [
+            event["description"] for event in events if event.get("description")
+        ]
+
+        return {
+            "id": str(uuid.uuid7()),
+            "title": "; ".join(dict.fromkeys(titles)) or "Unnamed session",
+            "description": "\n\n".join(descriptions),
+            "start_time": start_time,
+            "end_time": end_time,
+            "source_event_ids": source_event_ids,
+            "topic_tags": [],
+            "created_at": datetime.now(),
+        }
+
+    def _get_clustering_prompt(self, language: str) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Get the session clustering prompt for a language
+
+        The system prompt, the user template (shared references already
+        resolved) and the LLM config params are looked up once per language
+        and reused by later aggregation rounds.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Tuple of (system prompt, user prompt template, config params)
+        """
+        prompt = self._clustering_prompts.get(language)
+        if prompt is None:
+            prompt_manager = get_prompt_manager(language)
+            prompt = (
+                prompt_manager.get_system_prompt("session_aggregation"),
+                prompt_manager.get_user_prompt("session_aggregation"),
+                dict(prompt_manager.get_config_params("session_aggregation")),
+            )
+            self._clustering_prompts[language] = prompt
+        return prompt
+
     async def _validate_activities_with_supervisor(
         self,
         activities: List[Dict[str, Any]],
@@ -519,7 +648,7 @@ class SessionAgent:
             return activities
 
         try:
-            from agents.supervisor import ActivitySupervisor
+            from .supervisor import ActivitySupervisor
 
             language = self._get_language()
             supervisor = ActivitySupervisor(language=language)
@@ -719,32 +848,34 @@ class SessionAgent:
         if len(activities) <= 1:
             return activities
 
-        # Sort by start_time
-        sorted_activities = sorted(
-            activities,
-            key=lambda a: a.get("start_time") or datetime.min
+        # Parse every timestamp once, then sort by start_time
+        parsed = sorted(
+            (
+                (
+                    self._to_datetime(activity.get("start_time")),
+                    self._to_datetime(activity.get("end_time")),
+                    activity,
+                )
+                for activity in activities
+            ),
+            key=lambda item: item[0] or datetime.min,
         )
 
         merged: List[Dict[str, Any]] = []
-        current = sorted_activities[0].copy()
-
-        for i in range(1, len(sorted_activities)):
-            next_activity = sorted_activities[i]
-
-            # Check for time overlap or proximity
-            current_end = current.get("end_time")
-            next_start = next_activity.get("start_time")
-
+        current_start, current_end, first = parsed[0]
+        current = first.copy()
+        # Event ids and tags of the running activity, grown in place on each
+        # merge and written back to it only when needed
+        current_events = set(current.get("source_event_ids", []))
+        current_tags = set(current.get("topic_tags", []))
+        current_dirty = False
+
+        for next_start, next_end, next_activity in parsed[1:]:
             should_merge = False
             merge_reason = ""
 
+            # Check for time overlap or proximity
             if current_end and next_start:
-                # Convert to datetime if needed
-                if isinstance(current_end, str):
-                    current_end = datetime.fromisoformat(current_end)
-                if isinstance(next_start, str):
-                    next_start = datetime.fromisoformat(next_start)
-
                 # Calculate time gap between activities
                 time_gap = (next_start - current_end).total_seconds()
 
@@ -755,6 +886,9 @@ class SessionAgent:
 
                 # Case 2: Adjacent or small gap with semantic similarity
                 elif 0 <= time_gap <= self.merge_time_gap_tolerance:
+                    if current_dirty:
+                        current["topic_tags"] = list(current_tags)
+
                     # Calculate semantic similarity
                     similarity = self._calculate_activity_similarity(current, next_activity)
 
@@ -762,99 +896,98 @@ class SessionAgent:
                         should_merge = True
                         merge_reason = f"proximity_similarity (gap: {time_gap:.0f}s, similarity: {similarity:.2f})"
 
-                # Perform merge if criteria met
-                if should_merge:
-                    logger.debug(
-                        f"Merging activities (reason: {merge_reason}): '{current.get('title')}' and '{next_activity.get('title')}'"
-                    )
+            if not should_merge:
+                # No overlap, save current and move to next
+                if current_dirty:
+                    current["source_event_ids"] = list(current_events)
+                    current["topic_tags"] = list(current_tags)
+                merged.append(current)
+
+                current_start, current_end = next_start, next_end
+                current = next_activity.copy()
+                current_events = set(current.get("source_event_ids", []))
+                current_tags = set(current.get("topic_tags", []))
+                current_dirty = False
+                continue
 
-                    # Merge source_event_ids (remove duplicates)
-                    current_events = set(current.get("source_event_ids", []))
-                    next_events = set(next_activity.get("source_event_ids", []))
-                    merged_events = list(current_events | next_events)
-
-                    # Update end_time to the latest
-                    next_end = next_activity.get("end_time")
-                    if isinstance(next_end, str):
-                        next_end = datetime.fromisoformat(next_end)
-                    if next_end and next_end > current_end:
-                        current["end_time"] = next_end
-
-                    # Merge topic_tags
-                    current_tags = set(current.get("topic_tags", []))
-                    next_tags = set(next_activity.get("topic_tags", []))
-                    merged_tags = list(current_tags | next_tags)
-
-                    # Update current with merged data
-                    current["source_event_ids"] = merged_events
-                    current["topic_tags"] = merged_tags
-
-                    # Merge titles and descriptions based on duration
-                    # Calculate durations to determine primary activity
-                    current_start = current.get("start_time")
-                    if isinstance(current_start, str):
-                        current_start = datetime.fromisoformat(current_start)
-                    next_start_dt = next_activity.get("start_time")
-                    if isinstance(next_start_dt, str):
-                        next_start_dt = datetime.fromisoformat(next_start_dt)
-
-                    current_duration = (current_end - current_start).total_seconds() if current_start and current_end else 0
-                    next_duration = (next_end - next_start_dt).total_seconds() if next_start_dt and next_end else 0
-
-                    current_title = current.get("title", "")
-                    next_title = next_activity.get("title", "")
-                    current_desc = current.get("description", "")
-                    next_desc = next_activity.get("description", "")
-
-                    # Select title from the longer-duration activity (primary activity)
-                    if next_title and next_title != current_title:
-                        if next_duration > current_duration:
-                            # Next activity is primary, use its title
-                            logger.debug(
-                                f"Selected '{next_title}' as primary (duration: {next_duration:.0f}s > {current_duration:.0f}s)"
-                            )
-                            current["title"] = next_title
-                            # Add current as secondary context in description if needed
-                            if current_desc and current_title:
-                                current["description"] = f"{next_desc}\n\n[Related: {current_title}]\n{current_desc}" if next_desc else current_desc
-                            elif next_desc:
-                                current["description"] = next_desc
-                        else:
-                            # Current activity is primary, keep its title
-                            logger.debug(
-                                f"Kept '{current_title}' as primary (duration: {current_duration:.0f}s >= {next_duration:.0f}s)"
-                            )
-                            # Keep current title, add next as secondary context
-                            if next_desc and next_title:
-                                if current_desc:
-                                    current["description"] = f"{current_desc}\n\n[Related: {next_title}]\n{next_desc}"
-                                else:
-                                    current["description"] = next_desc
-                            # If only next has description, use it
-                            elif next_desc and not current_desc:
-                                current["description"] = next_desc
-                    else:
-                        # Same title or one is empty, just merge descriptions
-                        if next_desc and next_desc != current_desc:
-                            if current_desc:
-                                current["description"] = f"{current_desc}\n\n{next_desc}"
-                            else:
-                                current["description"] = next_desc
+            logger.debug(
+                f"Merging activities (reason: {merge_reason}): '{current.get('title')}' and '{next_activity.get('title')}'"
+            )
 
+            # Merge source_event_ids and topic_tags (duplicates removed by the sets)
+            current_events.update(next_activity.get("source_event_ids", []))
+            current_tags.update(next_activity.get("topic_tags", []))
+            current_dirty = True
+
+            # Calculate durations to determine primary activity
+            current_duration = (current_end - current_start).total_seconds() if current_start and current_end else 0
+            next_duration = (next_end - next_start).total_seconds() if next_start and next_end else 0
+
+            # Update end_time to the latest
+            if next_end and next_end > current_end:
+                current["end_time"] = next_end
+                current_end = next_end
+
+            # Merge titles and descriptions based on duration
+            current_title = current.get("title", "")
+            next_title = next_activity.get("title", "")
+            current_desc = current.get("description", "")
+            next_desc = next_activity.get("description", "")
+
+            # Select title from the longer-duration activity (primary activity)
+            if next_title and next_title != current_title:
+                if next_duration > current_duration:
+                    # Next activity is primary, use its title
                     logger.debug(
-                        f"Merged into: '{current.get('title')}' with {len(merged_events)} events"
+                        f"Selected '{next_title}' as primary (duration: {next_duration:.0f}s > {current_duration:.0f}s)"
                     )
-                    continue
+                    current["title"] = next_title
+                    # Add current as secondary context in description if needed
+                    if current_desc and current_title:
+                        current["description"] = f"{next_desc}\n\n[Related: {current_title}]\n{current_desc}" if next_desc else current_desc
+                    elif next_desc:
+                        current["description"] = next_desc
+                else:
+                    # Current activity is primary, keep its title
+                    logger.debug(
+                        f"Kept '{current_title}' as primary (duration: {current_duration:.0f}s >= {next_duration:.0f}s)"
+                    )
+                    # Keep current title, add next as secondary context
+                    if next_desc and next_title:
+                        if current_desc:
+                            current["description"] = f"{current_desc}\n\n[Related: {next_title}]\n{next_desc}"
+                        else:
+                            current["description"] = next_desc
+                    # If only next has description, use it
+                    elif next_desc and not current_desc:
+                        current["description"] = next_desc
+            else:
+                # Same title or one is empty, just merge descriptions
+                if next_desc and next_desc != current_desc:
+                    if current_desc:
+                        current["description"] = f"{current_desc}\n\n{next_desc}"
+                    else:
+                        current["description"] = next_desc
 
-            # No overlap, save current and move to next
-            merged.append(current)
-            current = next_activity.copy()
+            logger.debug(
+                f"Merged into: '{current.get('title')}' with {len(current_events)} events"
+            )
 
         # Don't forget the last activity
+        if current_dirty:
+            current["source_event_ids"] = list(current_events)
+            current["topic_tags"] = list(current_tags)
         merged.append(current)
 
         return merged
 
+    @staticmethod
+    def _to_datetime(value: Any) -> Any:
+        """Parse ISO timestamp strings; datetimes and empty values pass through"""
+        if value and isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
+
     async def _get_recent_activities_for_merge(
         self, lookback_hours: int = 2
     ) -> List[Dict[str, Any]]:
@@ -996,10 +1129,11 @@ class SessionAgent:
                         )
 
                         # Merge source_event_ids
-                        existing_events = set(existing_activity.get("source_event_ids", []))
+                        merged_events = set(existing_activity.get("source_event_ids", []))
                         new_events = set(new_activity.get("source_event_ids", []))
-                        all_events = list(existing_events | new_events)
-                        new_event_ids_only = list(new_events - existing_events)
+                        new_event_ids_only = list(new_events - merged_events)
+                        merged_events.update(new_event_ids_only)
+                        all_events = list(merged_events)
 
                         # Update time range
                         merged_start = min(existing_start, new_start)
@@ -1009,9 +1143,9 @@ class SessionAgent:
                         duration_minutes = int((merged_end - merged_start).total_seconds() / 60)
 
                         # Merge topic tags
-                        existing_tags = set(existing_activity.get("topic_tags", []))
-                        new_tags = set(new_activity.get("topic_tags", []))
-                        merged_tags = list(existing_tags | new_tags)
+                        tags = set(existing_activity.get("topic_tags", []))
+                        tags.update(new_activity.get("topic_tags", []))
+                        merged_tags = list(tags)
 
                         # Determine primary title/description based on duration
                         existing_duration = (existing_end - existing_start).total_seconds()
@@ -1059,13 +1193,13 @@ class SessionAgent:
                         if existing_update is not None:
                             # Merge with previous update
                             prev_update = activities_to_update[existing_update]
-                            prev_events = set(prev_update["source_event_ids"])
-                            combined_events = list(prev_events | set(all_events))
-                            prev_new_events = set(prev_update.get("_new_event_ids", []))
-                            combined_new_events = list(prev_new_events | set(new_event_ids_only))
+                            combined_events = set(prev_update["source_event_ids"])
+                            combined_events.update(all_events)
+                            combined_new_events = set(prev_update.get("_new_event_ids", []))
+                            combined_new_events.update(new_event_ids_only)
 
-                            prev_update["source_event_ids"] = combined_events
-                            prev_update["_new_event_ids"] = combined_new_events
+                            prev_update["source_event_ids"] = list(combined_events)
+                            prev_update["_new_event_ids"] = list(combined_new_events)
                             prev_update["end_time"] = max(prev_update["end_time"], merged_end)
                             prev_update["session_duration_minutes"] = int(
                                 (prev_update["end_time"] - prev_update["start_time"]).total_seconds() / 60
@@ -1121,6 +1255,12 @@ class SessionAgent:
 
         return normalized
 
+    def _spawn_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine as a tracked background task (kept referenced until done)"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def record_user_merge(
         self,
         merged_activity_id: str,
@@ -1130,34 +1270,35 @@ class SessionAgent:
         """
         Record user manual merge operation and learn from it
 
+        The pattern analysis (an LLM call) runs in the background, so the
+        caller's request returns right away.
+
         Args:
             merged_activity_id: ID of the newly created merged activity
             original_activity_ids: IDs of the original activities that were merged
             original_activities: Full data of original activities
         """
-        try:
-            logger.debug(
-                f"Recording user merge: {len(original_activity_ids)} activities -> {merged_activity_id}"
-            )
+        logger.debug(
+            f"Recording user merge: {len(original_activity_ids)} activities -> {merged_activity_id}"
+        )
+        self._spawn_background(
+            self._learn_merge_pattern(merged_activity_id, original_activities)
+        )
 
+    async def _learn_merge_pattern(
+        self, merged_activity_id: str, original_activities: List[Dict[str, Any]]
+    ) -> None:
+        """Analyze a user merge and save the learned pattern"""
+        try:
             # Analyze merge pattern using LLM
-            pattern = await self._analyze_merge_pattern(
+            result = await self._analyze_merge_pattern(
                 merged_activity_id, original_activities
             )
 
-            if pattern:
-                # Save learned pattern to database
-                pattern_id = str(uuid.uuid4())
-                await self.db.session_preferences.save_pattern(
-                    pattern_id=pattern_id,
-                    preference_type="merge_pattern",
-                    pattern_description=pattern,
-                    confidence_score=0.6,  # Initial confidence
-                    times_observed=1,
-                    last_observed=datetime.now().isoformat(),
-                )
-
-                logger.info(f"Learned new merge pattern: {pattern}")
+            if result:
+                pattern_id, pattern = result
+                if await self._store_pattern("merge_pattern", pattern_id, pattern):
+                    logger.info(f"Learned new merge pattern: {pattern}")
 
         except Exception as e:
             logger.error(f"Failed to record user merge: {e}", exc_info=True)
@@ -1172,42 +1313,46 @@ class SessionAgent:
         """
         Record user manual split operation and learn from it
 
+        The pattern analysis (an LLM call) runs in the background, so the
+        caller's request returns right away.
+
         Args:
             original_activity_id: ID of the original activity that was split
             new_activity_ids: IDs of the new activities created from split
             original_activity: Full data of original activity
             source_events: Source events of the original activity
         """
-        try:
-            logger.debug(
-                f"Recording user split: {original_activity_id} -> {len(new_activity_ids)} activities"
-            )
+        logger.debug(
+            f"Recording user split: {original_activity_id} -> {len(new_activity_ids)} activities"
+        )
+        self._spawn_background(
+            self._learn_split_pattern(original_activity, new_activity_ids, source_events)
+        )
 
+    async def _learn_split_pattern(
+        self,
+        original_activity: Dict[str, Any],
+        new_activity_ids: List[str],
+        source_events: List[Dict[str, Any]],
+    ) -> None:
+        """Analyze a user split and save the learned pattern"""
+        try:
             # Analyze split pattern using LLM
-            pattern = await self._analyze_split_pattern(
+            result = await self._analyze_split_pattern(
                 original_activity, new_activity_ids, source_events
             )
 
-            if pattern:
-                # Save learned pattern to database
-                pattern_id = str(uuid.uuid4())
-                await self.db.session_preferences.save_pattern(
-                    pattern_id=pattern_id,
-                    preference_type="split_pattern",
-                    pattern_description=pattern,
-                    confidence_score=0.6,  # Initial confidence
-                    times_observed=1,
-                    last_observed=datetime.now().isoformat(),
-                )
-
-                logger.info(f"Learned new split pattern: {pattern}")
+            if result:
+                pattern_id, pattern = result
+                if await self._store_pattern("split_pattern", pattern_id, pattern):
+                    logger.info(f"Learned new split pattern: {pattern}")
 
         except Exception as e:
             logger.error(f"Failed to record user split: {e}", exc_info=True)
 
     async def _analyze_merge_pattern(
         self, merged_activity_id: str, original_activities: List[Dict[str, Any]]
-    ) -> Optional[str]:
+    ) -> Optional[Tuple[str, str]]:
         """
         Analyze why user merged these activities to extract pattern
 
@@ -1216,7 +1361,7 @@ class SessionAgent:
             original_activities: Original activities that were merged
 
         Returns:
-            Pattern description or None
+            Tuple of (pattern id, pattern description) or None
         """
         try:
             # Build analysis prompt
@@ -1231,7 +1376,10 @@ class SessionAgent:
                     }
                 )
 
-            import json
+            pattern_id = self._pattern_id("merge", activities_summary)
+            known = await self._get_known_pattern(pattern_id)
+            if known is not None:
+                return pattern_id, known
 
             activities_json = json.dumps(activities_summary, ensure_ascii=False, indent=2)
 
@@ -1247,13 +1395,13 @@ class SessionAgent:
                 },
             ]
 
-            # Call LLM
-            response = await self.llm_manager.chat_completion(
-                messages, max_tokens=200, temperature=0.3
+            pattern = await self._request_pattern_analysis(
+                messages, f"User merged these activities:\n{activities_json}"
             )
+            if not pattern:
+                return None
 
-            pattern = response.get("content", "").strip()
-            return pattern if pattern else None
+            return pattern_id, pattern
 
         except Exception as e:
             logger.error(f"Failed to analyze merge pattern: {e}", exc_info=True)
@@ -1264,7 +1412,7 @@ class SessionAgent:
         original_activity: Dict[str, Any],
         new_activity_ids: List[str],
         source_events: List[Dict[str, Any]],
-    ) -> Optional[str]:
+    ) -> Optional[Tuple[str, str]]:
         """
         Analyze why user split this activity to extract pattern
 
@@ -1274,7 +1422,7 @@ class SessionAgent:
             source_events: Source events of the activity
 
         Returns:
-            Pattern description or None
+            Tuple of (pattern id, pattern description) or None
         """
         try:
             # Build analysis prompt
@@ -1285,7 +1433,12 @@ class SessionAgent:
                 "num_events": len(source_events),
             }
 
-            import json
+            pattern_id = self._pattern_id(
+                "split", {**activity_summary, "num_splits": len(new_activity_ids)}
+            )
+            known = await self._get_known_pattern(pattern_id)
+            if known is not None:
+                return pattern_id, known
 
             activity_json = json.dumps(activity_summary, ensure_ascii=False, indent=2)
 
@@ -1301,18 +1454,194 @@ class SessionAgent:
                 },
             ]
 
-            # Call LLM
-            response = await self.llm_manager.chat_completion(
-                messages, max_tokens=200, temperature=0.3
+            pattern = await self._request_pattern_analysis(
+                messages,
+                f"User split this activity into {len(new_activity_ids)} separate activities:\n{activity_json}",
             )
+            if not pattern:
+                return None
 
-            pattern = response.get("content", "").strip()
-            return pattern if pattern else None
+            return pattern_id, pattern
 
         except Exception as e:
             logger.error(f"Failed to analyze split pattern: {e}", exc_info=True)
             return None
 
+    async def _request_pattern_analysis(
+        self, messages: List[Dict[str, Any]], operation: str
+    ) -> Optional[str]:
+        """
+        Queue a merge/split pattern analysis for the next fused LLM call
+
+        Args:
+            messages: Prompt used when this is the only pending analysis
+            operation: Summary of the user operation used in a fused prompt
+
+        Returns:
+            Pattern description or None
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_patterns.append((messages, operation, future))
+        if not self._pattern_flush_scheduled:
+            self._pattern_flush_scheduled = True
+            self._spawn_background(self._flush_pattern_requests())
+        return await future
+
+    async def _flush_pattern_requests(self) -> None:
+        """Analyze every pattern request queued during the batch window at once"""
+        await asyncio.sleep(PATTERN_BATCH_WINDOW)
+        pending, self._pending_patterns = self._pending_patterns, []
+        self._pattern_flush_scheduled = False
+
+        try:
+            if len(pending) == 1:
+                response = await self.llm_manager.chat_completion(
+                    pending[0][0], max_tokens=200, temperature=0.3
+                )
+                patterns = [response.get("content", "").strip() or None]
+            else:
+                patterns = await self._analyze_patterns_batch(
+                    [operation for _, operation, _ in pending]
+                )
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), pattern in zip(pending, patterns):
+            if not future.done():
+                future.set_result(pattern)
+
+    async def _analyze_patterns_batch(
+        self, operations: List[str]
+    ) -> List[Optional[str]]:
+        """
+        Extract patterns for several user merge/split operations in one LLM call
+
+        Args:
+            operations: Summaries of the user operations
+
+        Returns:
+            Pattern description (or None) per operation, in the same order
+        """
+        operations_text = "\n\n".join(
+            f"Operation {i}:\n{operation}"
+            for i, operation in enumerate(operations, start=1)
+        )
+        messages = [
+            {
+                "role": "system",
+                "content": "You are an expert at analyzing user behavior patterns. For each user operation, analyze why the user merged or split the activities and extract a reusable pattern description (max 100 words).",
+            },
+            {
+                "role": "user",
+                "content": f"{operations_text}\n\nWhat pattern or rule can we learn from each operation? Describe each in one concise sentence. Respond with a JSON array of {len(operations)} strings, one per operation, in order.",
+            },
+        ]
+
+        response = await self.llm_manager.chat_completion(
+            messages, max_tokens=200 * len(operations), temperature=0.3
+        )
+        content = response.get("content", "").strip()
+        result = parse_json_from_response(content)
+
+        if isinstance(result, dict):
+            result = result.get("patterns")
+        if not isinstance(result, list) or len(result) != len(operations):
+            logger.warning(
+                f"Pattern analysis returned unexpected format for {len(operations)} operations: {content[:200]}"
+            )
+            return [None] * len(operations)
+
+        logger.debug(f"Analyzed {len(operations)} merge/split patterns in one call")
+        return [
+            (pattern.strip() or None) if isinstance(pattern, str) else None
+            for pattern in result
+        ]
+
+    @staticmethod
+    def _pattern_id(kind: str, summary: Any) -> str:
+        """
+        Derive the pattern id from a normalized (key-sorted) operation summary
+
+        The same operation always maps to the same session_preferences row,
+        so repeated operations update that row instead of adding new ones.
+        """
+        payload = json.dumps(summary, ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return str(uuid.uuid5(uuid.NAMESPACE_OID, f"{kind}:{digest}"))
+
+    async def _load_learned_patterns(self) -> None:
+        """Seed the pattern cache with the merge/split patterns already saved"""
+        self._pattern_cache.clear()
+        for preference_type in LEARNED_PATTERN_TYPES:
+            rows = await self.db.session_preferences.get_by_type(preference_type)
+            # Rows come most confident first; insert them last so they are
+            # the ones kept if there are more than the cache holds
+            for row in reversed(rows):
+                if row["pattern_description"]:
+                    self._cache_pattern(row["id"], row["pattern_description"])
+
+        logger.debug(f"Loaded {len(self._pattern_cache)} learned session patterns")
+
+    async def _get_known_pattern(self, pattern_id: str) -> Optional[str]:
+        """Return the pattern already learned for the same operation, if any"""
+        pattern = self._pattern_cache.get(pattern_id)
+        if pattern is None:
+            # Evicted from the cache, but possibly still saved
+            row = await self.db.session_preferences.get_by_id(pattern_id)
+            pattern = row["pattern_description"] if row else None
+            if pattern is None:
+                return None
+            self._cache_pattern(pattern_id, pattern)
+
+        self._pattern_cache.move_to_end(pattern_id)
+        logger.debug(f"Reusing learned pattern {pattern_id}")
+        return pattern
+
+    async def _store_pattern(
+        self, preference_type: str, pattern_id: str, pattern: str
+    ) -> bool:
+        """
+        Save a learned pattern, or count another observation of a known one
+
+        Args:
+            preference_type: merge_pattern | split_pattern
+            pattern_id: Pattern id from _pattern_id
+            pattern: Pattern description
+
+        Returns:
+            True if the pattern was new
+        """
+        now = datetime.now().isoformat()
+        known = (
+            pattern_id in self._pattern_cache
+            or await self.db.session_preferences.get_by_id(pattern_id) is not None
+        )
+        self._cache_pattern(pattern_id, pattern)
+
+        if known:
+            await self.db.session_preferences.increment_observation(pattern_id, now)
+            return False
+
+        await self.db.session_preferences.save_pattern(
+            pattern_id=pattern_id,
+            preference_type=preference_type,
+            pattern_description=pattern,
+            confidence_score=0.6,  # Initial confidence
+            times_observed=1,
+            last_observed=now,
+        )
+        return True
+
+    def _cache_pattern(self, pattern_id: str, pattern: str) -> None:
+        """Remember a learned pattern, evicting the least recently used entry"""
+        self._pattern_cache[pattern_id] = pattern
+        self._pattern_cache.move_to_end(pattern_id)
+        while len(self._pattern_cache) > PATTERN_CACHE_SIZE:
+            self._pattern_cache.popitem(last=False)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics information"""
         return {
@@ -1321,5 +1650,5 @@ class SessionAgent:
             "time_window_min": self.time_window_min,
             "time_window_max": self.time_window_max,
             "language": self._get_language(),
-            "stats": self.stats.copy(),
+            "stats": asdict(self.stats),
         }
@@ -2,242 +2,195 @@
 Simple agent implementations
 """
 
-import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
-from core.logger import get_logger
-from core.models import AgentConfig, AgentTask
-from llm.manager import get_llm_manager
+from ..core.logger import get_logger
+from ..core.models import AgentConfig, AgentTask
+from ..llm.manager import get_llm_manager
 
 from .base import BaseAgent, TaskResult
 
 logger = get_logger(__name__)
 
+def _compile_keywords(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """Compile keywords into one pattern matching any of them as a substring"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
 
 class SimpleAgent(BaseAgent):
     """Simple agent implementation"""
 
+    # Result messages; subclasses override them along with _build_messages
+    success_message = "Task executed successfully"
+    failure_message = "Task execution failed"
+
+    # Keywords a task description must contain for this agent to handle it,
+    # compiled once per class; without a pattern any task is accepted
+    keywords: Tuple[str, ...] = ()
+    _keyword_pattern: Optional[Pattern[str]] = None
+
     def __init__(self, agent_type: str = "SimpleAgent"):
         super().__init__(agent_type)
         self.llm_manager = get_llm_manager()
 
     def can_handle(self, task: AgentTask) -> bool:
         """Determine if this task can be handled"""
-        # Simple agent can handle all tasks
-        return True
+        if self._keyword_pattern is None:
+            # Simple agent can handle all tasks
+            return True
+        return self._keyword_pattern.search(task.plan_description) is not None
+
+    def _build_messages(self, task: AgentTask) -> List[Dict[str, Any]]:
+        """Build LLM messages for a task"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a general intelligent assistant, good at handling various tasks. Please provide detailed solutions and results according to user needs.",
+            },
+            {
+                "role": "user",
+                "content": f"Task: {task.plan_description}\n\nPlease analyze this task and provide detailed execution plan and results.",
+            },
+        ]
 
     async def execute(self, task: AgentTask) -> TaskResult:
         """Execute task"""
         try:
-            logger.debug(f"Starting task execution: {task.id} - {task.plan_description}")
+            logger.debug(
+                f"{self.agent_type} starting task execution: {task.id} - {task.plan_description}"
+            )
 
-            # Build prompt
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a general intelligent assistant, good at handling various tasks. Please provide detailed solutions and results according to user needs.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Task: {task.plan_description}\n\nPlease analyze this task and provide detailed execution plan and results.",
-                },
-            ]
+            messages = self._build_messages(task)
 
             # Call LLM (manager ensures latest activated model is used)
+            started = time.perf_counter()
             result = await self.llm_manager.chat_completion(messages)
-            content = result.get("content", "Task execution failed")
+            execution_time = time.perf_counter() - started
+            content = result.get("content", self.failure_message)
 
-            logger.debug(f"Task execution completed: {task.id}")
+            logger.debug(f"{self.agent_type} task execution completed: {task.id}")
 
             return TaskResult(
                 success=True,
-                message="Task executed successfully",
+                message=self.success_message,
                 data={
                     "result": {"type": "text", "content": content},
-                    "execution_time": 0,
+                    "execution_time": execution_time,
                 },
             )
 
         except Exception as e:
             logger.error(
-                f"Task execution failed: {task.id}, error: {str(e)}", exc_info=True
+                f"{self.agent_type} task execution failed: {task.id}, error: {str(e)}",
+                exc_info=True,
             )
             return TaskResult(
-                success=False, message=f"Task execution failed: {str(e)}", data={}
+                success=False, message=f"{self.failure_message}: {str(e)}", data={}
             )
 
 
 class WritingAgent(SimpleAgent):
     """Writing assistant agent"""
 
-    def __init__(self):
-        super().__init__("WritingAgent")
+    success_message = "Writing task completed"
+    failure_message = "Writing task execution failed"
+
+    keywords = (
+        "write",
+        "article",
+        "document",
+        "blog",
+        "report",
+        "summary",
+        "content",
+    )
+    _keyword_pattern = _compile_keywords(keywords)
+
+    def __init__(self, agent_type: str = "WritingAgent"):
+        super().__init__(agent_type)
 
-    def can_handle(self, task: AgentTask) -> bool:
-        """Determine if this writing-related task can be handled"""
-        writing_keywords = [
-            "write",
-            "article",
-            "document",
-            "blog",
-            "report",
-            "summary",
-            "content",
+    def _build_messages(self, task: AgentTask) -> List[Dict[str, Any]]:
+        """Build LLM messages for a writing task"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a professional writing assistant, good at writing various types of documents, articles and reports. Please provide high-quality writing content according to user needs.",
+            },
+            {
+                "role": "user",
+                "content": f"Writing task: {task.plan_description}\n\nPlease provide detailed writing plan and content outline.",
+            },
         ]
-        return any(keyword in task.plan_description for keyword in writing_keywords)
-
-    async def execute(self, task: AgentTask) -> TaskResult:
-        """Execute writing task"""
-        try:
-            logger.debug(f"Writing assistant starting task execution: {task.id}")
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a professional writing assistant, good at writing various types of documents, articles and reports. Please provide high-quality writing content according to user needs.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Writing task: {task.plan_description}\n\nPlease provide detailed writing plan and content outline.",
-                },
-            ]
-
-            result = await self.llm_manager.chat_completion(messages)
-            content = result.get("content", "Writing task execution failed")
-
-            await asyncio.sleep(3)  # Writing tasks need more time
-
-            return TaskResult(
-                success=True,
-                message="Writing task completed",
-                data={
-                    "result": {"type": "text", "content": content},
-                    "execution_time": 3,
-                },
-            )
-
-        except Exception as e:
-            logger.error(f"Writing task execution failed: {task.id}, error: {str(e)}")
-            return TaskResult(
-                success=False,
-                message=f"Writing task execution failed: {str(e)}",
-                data={},
-            )
 
 
 class ResearchAgent(SimpleAgent):
     """Research assistant agent"""
 
-    def __init__(self):
-        super().__init__("ResearchAgent")
+    success_message = "Research task completed"
+    failure_message = "Research task execution failed"
+
+    keywords = (
+        "research",
+        "collect",
+        "materials",
+        "investigate",
+        "analyze",
+        "survey",
+        "search",
+    )
+    _keyword_pattern = _compile_keywords(keywords)
+
+    def __init__(self, agent_type: str = "ResearchAgent"):
+        super().__init__(agent_type)
 
-    def can_handle(self, task: AgentTask) -> bool:
-        """Determine if this research-related task can be handled"""
-        research_keywords = [
-            "research",
-            "collect",
-            "materials",
-            "investigate",
-            "analyze",
-            "survey",
-            "search",
+    def _build_messages(self, task: AgentTask) -> List[Dict[str, Any]]:
+        """Build LLM messages for a research task"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a professional research assistant, good at collecting, organizing and analyzing various information. Please provide detailed research plans and results according to user needs.",
+            },
+            {
+                "role": "user",
+                "content": f"Research task: {task.plan_description}\n\nPlease provide detailed research plan and expected results.",
+            },
         ]
-        return any(keyword in task.plan_description for keyword in research_keywords)
-
-    async def execute(self, task: AgentTask) -> TaskResult:
-        """Execute research task"""
-        try:
-            logger.debug(f"Research assistant starting task execution: {task.id}")
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a professional research assistant, good at collecting, organizing and analyzing various information. Please provide detailed research plans and results according to user needs.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Research task: {task.plan_description}\\n\\nPlease provide detailed research plan and expected results.",
-                },
-            ]
-
-            result = await self.llm_manager.chat_completion(messages)
-            content = result.get("content", "Research task execution failed")
-
-            await asyncio.sleep(4)  # Research tasks need more time
-
-            return TaskResult(
-                success=True,
-                message="Research task completed",
-                data={
-                    "result": {"type": "text", "content": content},
-                    "execution_time": 4,
-                },
-            )
-
-        except Exception as e:
-            logger.error(f"Research task execution failed: {task.id}, error: {str(e)}")
-            return TaskResult(
-                success=False,
-                message=f"Research task execution failed: {str(e)}",
-                data={},
-            )
 
 
 class AnalysisAgent(SimpleAgent):
     """Analysis assistant agent"""
 
-    def __init__(self):
-        super().__init__("AnalysisAgent")
+    success_message = "Analysis task completed"
+    failure_message = "Analysis task execution failed"
+
+    keywords = (
+        "analyze",
+        "statistics",
+        "data",
+        "trend",
+        "report",
+        "evaluate",
+        "compare",
+    )
+    _keyword_pattern = _compile_keywords(keywords)
+
+    def __init__(self, agent_type: str = "AnalysisAgent"):
+        super().__init__(agent_type)
 
-    def can_handle(self, task: AgentTask) -> bool:
-        """Determine if this analysis-related task can be handled"""
-        analysis_keywords = [
-            "analyze",
-            "statistics",
-            "data",
-            "trend",
-            "report",
-            "evaluate",
-            "compare",
+    def _build_messages(self, task: AgentTask) -> List[Dict[str, Any]]:
+        """Build LLM messages for an analysis task"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a professional data analysis assistant, good at analyzing various data and trends. Please provide detailed analysis plans and results according to user needs.",
+            },
+            {
+                "role": "user",
+                "content": f"Analysis task: {task.plan_description}\n\nPlease provide detailed analysis plan and expected results.",
+            },
         ]
-        return any(keyword in task.plan_description for keyword in analysis_keywords)
-
-    async def execute(self, task: AgentTask) -> TaskResult:
-        """Execute analysis task"""
-        try:
-            logger.debug(f"Analysis assistant starting task execution: {task.id}")
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a professional data analysis assistant, good at analyzing various data and trends. Please provide detailed analysis plans and results according to user needs.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Analysis task: {task.plan_description}\\n\\nPlease provide detailed analysis plan and expected results.",
-                },
-            ]
-
-            result = await self.llm_manager.chat_completion(messages)
-            content = result.get("content", "Analysis task execution failed")
-
-            await asyncio.sleep(3)  # Analysis tasks need some time
-
-            return TaskResult(
-                success=True,
-                message="Analysis task completed",
-                data={
-                    "result": {"type": "text", "content": content},
-                    "execution_time": 3,
-                },
-            )
-
-        except Exception as e:
-            logger.error(f"Analysis task execution failed: {task.id}, error: {str(e)}")
-            return TaskResult(
-                success=False,
-                message=f"Analysis task execution failed: {str(e)}",
-                data={},
-            )
 
 
 # Available agent configurations
@@ -3,13 +3,16 @@ Supervisor - Quality validation for agent outputs
 Provides review and validation for TODO, Knowledge, and Diary generation
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
-from core.logger import get_logger
-from core.json_parser import parse_json_from_response
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
+from ..core.logger import get_logger
+from ..core.json_parser import parse_json_from_response_async
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
+from ..llm.validation_cache import get_validation_cache
 
 logger = get_logger(__name__)
 
@@ -51,6 +54,9 @@ class SupervisorResult:
 class BaseSupervisor(ABC):
     """Base class for content supervisors"""
 
+    # Lists longer than this are validated in chunks, concurrently
+    CHUNK_SIZE = 20
+
     def __init__(self, language: str = "zh"):
         """
         Initialize supervisor
@@ -61,6 +67,9 @@ class BaseSupervisor(ABC):
         self.language = language
         self.llm_manager = get_llm_manager()
         self.prompt_manager = get_prompt_manager(language)
+        self.validation_cache = get_validation_cache()
+        # Prompt per (language, category): (system prompt, user template, config params)
+        self._prompts: Dict[Tuple[str, str], Tuple[str, str, Dict[str, Any]]] = {}
 
     @abstractmethod
     async def validate(self, content: Any, **kwargs: Any) -> SupervisorResult:
@@ -76,6 +85,34 @@ class BaseSupervisor(ABC):
         """
         pass
 
+    def _get_prompt(self, prompt_category: str) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Get the validation prompt for a category
+
+        The system prompt, the user template (shared references already
+        resolved) and the LLM config params are looked up once per language
+        and category and reused by later validations. The prompt manager is a
+        shared singleton that other callers may switch to another language, so
+        a miss re-selects this supervisor's language before reading it.
+
+        Args:
+            prompt_category: Category in prompt configuration
+
+        Returns:
+            Tuple of (system prompt, user prompt template, config params)
+        """
+        key = (self.language, prompt_category)
+        prompt = self._prompts.get(key)
+        if prompt is None:
+            prompt_manager = get_prompt_manager(self.language)
+            prompt = (
+                prompt_manager.get_system_prompt(prompt_category),
+                prompt_manager.get_user_prompt(prompt_category),
+                dict(prompt_manager.get_config_params(prompt_category)),
+            )
+            self._prompts[key] = prompt
+        return prompt
+
     async def _call_llm_for_validation(
         self, prompt_category: str, content_json: str, **kwargs
     ) -> Dict[str, Any]:
@@ -90,29 +127,50 @@ class BaseSupervisor(ABC):
         Returns:
             Parsed validation result
         """
+        # Identical content is validated the same way, so reuse earlier results
+        cache_key = self.validation_cache.make_key(
+            self.language,
+            prompt_category,
+            content_json,
+            *(f"{name}={value}" for name, value in sorted(kwargs.items())),
+        )
+        cached = self.validation_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Reusing cached {prompt_category} validation result")
+            return cached
+
         try:
             # Build messages with additional template variables
             template_vars = {"content_json": content_json}
             template_vars.update(kwargs)
 
-            messages = self.prompt_manager.build_messages(
-                prompt_category, "user_prompt_template", **template_vars
+            system_prompt, user_template, config_params = self._get_prompt(
+                prompt_category
             )
-
-            # Get configuration parameters
-            config_params = self.prompt_manager.get_config_params(prompt_category)
+            try:
+                user_prompt = user_template.format(**template_vars)
+            except KeyError as e:
+                logger.error(f"Failed to format prompt, missing parameter: {e}")
+                user_prompt = user_template
+
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            if user_prompt:
+                messages.append({"role": "user", "content": user_prompt})
 
             # Call LLM
             response = await self.llm_manager.chat_completion(messages, **config_params)
             content = response.get("content", "").strip()
 
             # Parse JSON
-            result = parse_json_from_response(content)
+            result = await parse_json_from_response_async(content)
 
             if not isinstance(result, dict):
                 logger.warning(f"Supervisor returned invalid format: {content[:200]}")
                 return {}
 
+            self.validation_cache.set(cache_key, result)
             return result
 
         except Exception as e:
@@ -120,101 +178,125 @@ class BaseSupervisor(ABC):
             return {}
 
 
-class TodoSupervisor(BaseSupervisor):
-    """Supervisor for TODO items"""
-
-    async def validate(self, content: List[Dict[str, Any]], **kwargs: Any) -> SupervisorResult:
+    async def _call_llm_for_list_validation(
+        self, prompt_category: str, items: List[Any], revised_key: str
+    ) -> Dict[str, Any]:
         """
-        Validate TODO items
+        Validate a list in chunks of CHUNK_SIZE items and merge the results
 
         Args:
-            content: List of TODO items to validate
-            **kwargs: Additional context (unused)
+            prompt_category: Category in prompt configuration
+            items: Items to validate
+            revised_key: Result key holding the revised items
 
         Returns:
-            SupervisorResult with validation results
+            Merged validation result ({} if every chunk failed)
         """
-        if not content:
-            return SupervisorResult(
-                is_valid=True, issues=[], suggestions=[], revised_content=content
+        chunks = [
+            items[i : i + self.CHUNK_SIZE]
+            for i in range(0, len(items), self.CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._call_llm_for_validation(
+                    prompt_category,
+                    json.dumps(
+                        chunk, ensure_ascii=False, separators=(",", ":"), default=str
+                    ),
+                )
+                for chunk in chunks
             )
+        )
 
-        try:
-            import json
-
-            todos_json = json.dumps(content, ensure_ascii=False, indent=2, default=str)
-
-            # Call LLM for validation
-            result = await self._call_llm_for_validation(
-                "todo_supervisor", todos_json
-            )
+        if len(chunks) == 1:
+            return results[0]
+        if not any(results):
+            return {}
 
+        merged: Dict[str, Any] = {
+            "is_valid": True,
+            "issues": [],
+            "suggestions": [],
+            revised_key: [],
+        }
+        for chunk, result in zip(chunks, results):
+            revised = result.get(revised_key)
+            # Failed chunks (or ones without revisions) keep their items as-is
+            merged[revised_key].extend(revised if isinstance(revised, list) else chunk)
             if not result:
-                # Validation failed, but don't block
-                return SupervisorResult(
-                    is_valid=True,
-                    issues=["Supervisor validation unavailable"],
-                    suggestions=[],
-                    revised_content=content,
-                )
+                continue
+            merged["is_valid"] = merged["is_valid"] and result.get("is_valid", True)
+            merged["issues"].extend(result.get("issues", []))
+            merged["suggestions"].extend(result.get("suggestions", []))
 
-            is_valid = result.get("is_valid", True)
-            issues = result.get("issues", [])
-            suggestions = result.get("suggestions", [])
-            revised_todos = result.get("revised_todos", content)
+        logger.debug(
+            f"{prompt_category}: validated {len(items)} items in {len(chunks)} chunks"
+        )
+        return merged
 
-            logger.debug(
-                f"TodoSupervisor: valid={is_valid}, issues={len(issues)}, suggestions={len(suggestions)}"
-            )
 
-            return SupervisorResult(
-                is_valid=is_valid,
-                issues=issues,
-                suggestions=suggestions,
-                revised_content=revised_todos,
-            )
+class Supervisor(BaseSupervisor):
+    """
+    Config-driven supervisor
 
-        except Exception as e:
-            logger.error(f"TodoSupervisor validation error: {e}", exc_info=True)
-            return SupervisorResult(
-                is_valid=True,
-                issues=[f"Validation error: {str(e)}"],
-                suggestions=[],
-                revised_content=content,
-            )
+    Validates a list of items (in chunks) or a text with the prompt of
+    ``prompt_category`` and reads the revised content from ``revised_key``
+    of the LLM result.
+    """
 
+    def __init__(self, prompt_category: str, revised_key: str, language: str = "zh"):
+        """
+        Initialize supervisor
 
-class KnowledgeSupervisor(BaseSupervisor):
-    """Supervisor for Knowledge items"""
+        Args:
+            prompt_category: Category in prompt configuration
+            revised_key: Result key holding the revised content
+            language: Language setting (zh | en)
+        """
+        super().__init__(language)
+        self.prompt_category = prompt_category
+        self.revised_key = revised_key
+        self.name = type(self).__name__
 
-    async def validate(self, content: List[Dict[str, Any]], **kwargs: Any) -> SupervisorResult:
+    async def validate(self, content: Any, **kwargs: Any) -> SupervisorResult:
         """
-        Validate knowledge items
+        Validate content
 
         Args:
-            content: List of knowledge items to validate
+            content: List of items or text to validate
             **kwargs: Additional context (unused)
 
         Returns:
             SupervisorResult with validation results
         """
-        if not content:
+        is_text = isinstance(content, str)
+
+        if is_text and not content.strip():
+            kind = self.prompt_category.removesuffix("_supervisor")
             return SupervisorResult(
-                is_valid=True,
-                issues=[],
-                suggestions=[],
+                is_valid=False,
+                issues=[f"Empty {kind} content"],
+                suggestions=[f"Generate meaningful {kind} content"],
                 revised_content=content,
             )
+        if not content:
+            return SupervisorResult(
+                is_valid=True, issues=[], suggestions=[], revised_content=content
+            )
 
         try:
-            import json
-
-            knowledge_json = json.dumps(content, ensure_ascii=False, indent=2, default=str)
-
             # Call LLM for validation
-            result = await self._call_llm_for_validation(
-                "knowledge_supervisor", knowledge_json
-            )
+            if is_text:
+                result = await self._call_llm_for_validation(
+                    self.prompt_category,
+                    json.dumps(
+                        {"content": content}, ensure_ascii=False, separators=(",", ":")
+                    ),
+                )
+            else:
+                result = await self._call_llm_for_list_validation(
+                    self.prompt_category, content, self.revised_key
+                )
 
             if not result:
                 # Validation failed, but don't block
@@ -228,21 +310,21 @@ class KnowledgeSupervisor(BaseSupervisor):
             is_valid = result.get("is_valid", True)
             issues = result.get("issues", [])
             suggestions = result.get("suggestions", [])
-            revised_knowledge = result.get("revised_knowledge", content)
+            revised_content = result.get(self.revised_key, content)
 
             logger.debug(
-                f"KnowledgeSupervisor: valid={is_valid}, issues={len(issues)}, suggestions={len(suggestions)}"
+                f"{self.name}: valid={is_valid}, issues={len(issues)}, suggestions={len(suggestions)}"
             )
 
             return SupervisorResult(
                 is_valid=is_valid,
                 issues=issues,
                 suggestions=suggestions,
-                revised_content=revised_knowledge,
+                revised_content=revised_content,
             )
 
         except Exception as e:
-            logger.error(f"KnowledgeSupervisor validation error: {e}", exc_info=True)
+            logger.error(f"{self.name} validation error: {e}", exc_info=True)
             return SupervisorResult(
                 is_valid=True,
                 issues=[f"Validation error: {str(e)}"],
@@ -251,73 +333,25 @@ class KnowledgeSupervisor(BaseSupervisor):
             )
 
 
-class DiarySupervisor(BaseSupervisor):
-    """Supervisor for Diary entries"""
-
-    async def validate(self, content: str, **kwargs: Any) -> SupervisorResult:
-        """
-        Validate diary content
-
-        Args:
-            content: Diary text to validate
-            **kwargs: Additional context (unused)
-
-        Returns:
-            SupervisorResult with validation results
-        """
-        if not content or not content.strip():
-            return SupervisorResult(
-                is_valid=False,
-                issues=["Empty diary content"],
-                suggestions=["Generate meaningful diary content"],
-                revised_content=content,
-            )
-
-        try:
-            import json
+class TodoSupervisor(Supervisor):
+    """Supervisor for TODO items"""
 
-            content_json = json.dumps(
-                {"content": content}, ensure_ascii=False, indent=2
-            )
+    def __init__(self, language: str = "zh"):
+        super().__init__("todo_supervisor", "revised_todos", language)
 
-            # Call LLM for validation
-            result = await self._call_llm_for_validation(
-                "diary_supervisor", content_json
-            )
 
-            if not result:
-                # Validation failed, but don't block
-                return SupervisorResult(
-                    is_valid=True,
-                    issues=["Supervisor validation unavailable"],
-                    suggestions=[],
-                    revised_content=content,
-                )
+class KnowledgeSupervisor(Supervisor):
+    """Supervisor for Knowledge items"""
 
-            is_valid = result.get("is_valid", True)
-            issues = result.get("issues", [])
-            suggestions = result.get("suggestions", [])
-            revised_content = result.get("revised_content", content)
+    def __init__(self, language: str = "zh"):
+        super().__init__("knowledge_supervisor", "revised_knowledge", language)
 
-            logger.debug(
-                f"DiarySupervisor: valid={is_valid}, issues={len(issues)}, suggestions={len(suggestions)}"
-            )
 
-            return SupervisorResult(
-                is_valid=is_valid,
-                issues=issues,
-                suggestions=suggestions,
-                revised_content=revised_content,
-            )
+class DiarySupervisor(Supervisor):
+    """Supervisor for Diary entries"""
 
-        except Exception as e:
-            logger.error(f"DiarySupervisor validation error: {e}", exc_info=True)
-            return SupervisorResult(
-                is_valid=True,
-                issues=[f"Validation error: {str(e)}"],
-                suggestions=[],
-                revised_content=content,
-            )
+    def __init__(self, language: str = "zh"):
+        super().__init__("diary_supervisor", "revised_content", language)
 
 
 class EventSupervisor(BaseSupervisor):
@@ -347,8 +381,6 @@ class EventSupervisor(BaseSupervisor):
             )
 
         try:
-            import json
-
             events_json = json.dumps(content, ensure_ascii=False, indent=2, default=str)
 
             # Build source actions section if provided
@@ -434,7 +466,6 @@ class ActivitySupervisor(BaseSupervisor):
             )
 
         try:
-            import json
             from datetime import datetime
 
             activities_json = json.dumps(content, ensure_ascii=False, indent=2, default=str)
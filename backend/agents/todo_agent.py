@@ -9,13 +9,13 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from core.db import get_db
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.models import RawRecord
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
+from ..core.db import get_db
+from ..core.json_parser import parse_json_from_response
+from ..core.logger import get_logger
+from ..core.models import RawRecord
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
 
 logger = get_logger(__name__)
 
@@ -66,7 +66,7 @@ class TodoAgent:
             Validated/revised TODO list
         """
         try:
-            from agents.supervisor import TodoSupervisor
+            from .supervisor import TodoSupervisor
 
             language = self._get_language()
             supervisor = TodoSupervisor(language=language)
@@ -13,17 +13,12 @@ Usage:
     uv run python app.py
 """
 
-import sys
 from contextlib import asynccontextmanager
-from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-# Add backend directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 from backend.config.loader import get_config
 from backend.core.logger import get_logger
 from backend.handlers import register_fastapi_routes
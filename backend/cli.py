@@ -7,9 +7,10 @@ from typing import Optional
 
 import typer
 import uvicorn
-from config.loader import load_config
-from core.logger import get_logger
-from system.runtime import start_runtime, stop_runtime
+from backend.config.loader import load_config
+from backend.core.logger import get_logger
+from backend.llm.client import LLMClient
+from backend.system.runtime import start_runtime, stop_runtime
 
 logger = get_logger(__name__)
 
@@ -85,14 +86,23 @@ def run(
 
             # Stop coordinator
             await stop_runtime(quiet=True)
+            await LLMClient.close_shared_client()
             logger.info("Monitoring pipeline stopped")
 
         except Exception as e:
             logger.error(f"Run failed: {e}")
             raise typer.Exit(1)
 
-    # Run async task
-    asyncio.run(run_pipeline())
+    # Run async task, on uvloop when it is installed (it ships with
+    # uvicorn[standard] except on Windows, which keeps the stock loop)
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    asyncio.run(run_pipeline(), loop_factory=loop_factory)
 
 
 def main():
@@ -7,9 +7,9 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
-from config.loader import get_config
-from core.db import get_db
-from core.logger import get_logger
+from ..config.loader import get_config
+from .db import get_db
+from .logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -192,7 +192,7 @@ class PipelineCoordinator:
     def _init_managers(self):
         """Lazy initialization of managers"""
         if self.perception_manager is None:
-            from perception.manager import PerceptionManager
+            from ..perception.manager import PerceptionManager
 
             self.perception_manager = PerceptionManager(
                 capture_interval=self.capture_interval,
@@ -202,7 +202,7 @@ class PipelineCoordinator:
             )
 
         if self.processing_pipeline is None:
-            from processing.pipeline import ProcessingPipeline
+            from ..processing.pipeline import ProcessingPipeline
 
             processing_config = self.config.get("processing", {})
             language_config = self.config.get("language", {})
@@ -235,12 +235,12 @@ class PipelineCoordinator:
             )
 
         if self.action_agent is None:
-            from agents.action_agent import ActionAgent
+            from ..agents.action_agent import ActionAgent
 
             self.action_agent = ActionAgent()
 
         if self.raw_agent is None:
-            from agents.raw_agent import RawAgent
+            from ..agents.raw_agent import RawAgent
 
             processing_config = self.config.get("processing", {})
             self.raw_agent = RawAgent(
@@ -249,19 +249,8 @@ class PipelineCoordinator:
                 )
             )
 
-        if self.event_agent is None:
-            from agents.event_agent import EventAgent
-
-            processing_config = self.config.get("processing", {})
-            self.event_agent = EventAgent(
-                aggregation_interval=processing_config.get(
-                    "event_aggregation_interval", 600
-                ),
-                time_window_hours=processing_config.get("event_time_window_hours", 1),
-            )
-
         if self.session_agent is None:
-            from agents.session_agent import SessionAgent
+            from ..agents.session_agent import SessionAgent
 
             processing_config = self.config.get("processing", {})
             self.session_agent = SessionAgent(
@@ -282,23 +271,35 @@ class PipelineCoordinator:
                 ),
             )
 
+        if self.event_agent is None:
+            from ..agents.event_agent import EventAgent
+
+            processing_config = self.config.get("processing", {})
+            self.event_agent = EventAgent(
+                aggregation_interval=processing_config.get(
+                    "event_aggregation_interval", 600
+                ),
+                time_window_hours=processing_config.get("event_time_window_hours", 1),
+                on_events_created=self.session_agent.notify_events_created,
+            )
+
         if self.todo_agent is None:
-            from agents.todo_agent import TodoAgent
+            from ..agents.todo_agent import TodoAgent
 
             self.todo_agent = TodoAgent()
 
         if self.knowledge_agent is None:
-            from agents.knowledge_agent import KnowledgeAgent
+            from ..agents.knowledge_agent import KnowledgeAgent
 
             self.knowledge_agent = KnowledgeAgent()
 
         if self.diary_agent is None:
-            from agents.diary_agent import DiaryAgent
+            from ..agents.diary_agent import DiaryAgent
 
             self.diary_agent = DiaryAgent()
 
         if self.cleanup_agent is None:
-            from agents.cleanup_agent import CleanupAgent
+            from ..agents.cleanup_agent import CleanupAgent
 
             processing_config = self.config.get("processing", {})
             # Get image manager from processing pipeline if available
@@ -460,22 +461,25 @@ class PipelineCoordinator:
                     pass
             self.processing_task = None
 
-            # Stop agents in reverse order of dependencies
-            if self.cleanup_agent:
-                await self.cleanup_agent.stop()
-                log("Cleanup agent stopped")
-
-            if self.diary_agent:
-                await self.diary_agent.stop()
-                log("Diary agent stopped")
-
-            if self.session_agent:
-                await self.session_agent.stop()
-                log("Session agent stopped")
-
-            if self.event_agent:
-                await self.event_agent.stop()
-                log("Event agent stopped")
+            # Stop agents concurrently (they are independent, like on start)
+            agents = [
+                (name, agent)
+                for name, agent in (
+                    ("Cleanup", self.cleanup_agent),
+                    ("Diary", self.diary_agent),
+                    ("Session", self.session_agent),
+                    ("Event", self.event_agent),
+                )
+                if agent
+            ]
+            results = await asyncio.gather(
+                *(agent.stop() for _, agent in agents), return_exceptions=True
+            )
+            for (name, _), result in zip(agents, results):
+                if isinstance(result, Exception):
+                    logger.error(f"{name} agent failed to stop: {result}")
+                else:
+                    log(f"{name} agent stopped")
 
             # Note: ActionAgent has no start/stop methods (it's stateless)
 
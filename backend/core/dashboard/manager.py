@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from models.base import LLMUsageResponse
+from ...models.base import LLMUsageResponse
 
 from ..db import get_db
 from ..logger import get_logger
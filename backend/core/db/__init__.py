@@ -10,8 +10,8 @@ This module provides:
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from core.logger import get_logger
-from core.sqls import queries
+from ..logger import get_logger
+from ..sqls import queries
 
 # Three-layer architecture repositories
 from .actions import ActionsRepository
@@ -80,7 +80,7 @@ class DatabaseManager:
         """
         import sqlite3
 
-        from core.sqls import migrations, schema
+        from ..sqls import migrations, schema
 
         try:
             conn = sqlite3.connect(str(self.db_path))
@@ -115,7 +115,7 @@ class DatabaseManager:
         """
         import sqlite3
 
-        from core.sqls import migrations
+        from ..sqls import migrations
 
         # List of migrations to run (column name, migration SQL)
         migration_list = [
@@ -237,35 +237,21 @@ class DatabaseManager:
             "diaries": 0,
         }
 
+        # (count key, statement, cutoff) - each statement is a single
+        # index-backed range pass over its table
+        statements = [
+            ("events", queries.SOFT_DELETE_EVENTS_BEFORE_START_TIME, cutoff_iso),
+            ("activities", queries.SOFT_DELETE_ACTIVITIES_BEFORE_START_TIME, cutoff_iso),
+            ("knowledge", queries.SOFT_DELETE_KNOWLEDGE_BEFORE_CREATED_AT, cutoff_iso),
+            ("todos", queries.SOFT_DELETE_TODOS_BEFORE_CREATED_AT, cutoff_iso),
+            ("diaries", queries.SOFT_DELETE_DIARIES_BEFORE_DATE, cutoff_date_str),
+        ]
+
         try:
+            # All statements run in one transaction on one connection
             with self.get_connection() as conn:
-                conn.execute(
-                    queries.DELETE_EVENT_IMAGES_BEFORE_TIMESTAMP, (cutoff_iso,)
-                )
-                cursor = conn.execute(
-                    queries.DELETE_EVENTS_BEFORE_TIMESTAMP, (cutoff_iso,)
-                )
-                deleted_counts["events"] = cursor.rowcount
-
-                cursor = conn.execute(
-                    queries.SOFT_DELETE_ACTIVITIES_BEFORE_START_TIME, (cutoff_iso,)
-                )
-                deleted_counts["activities"] = cursor.rowcount
-
-                cursor = conn.execute(
-                    queries.SOFT_DELETE_KNOWLEDGE_BEFORE_CREATED_AT, (cutoff_iso,)
-                )
-                deleted_counts["knowledge"] = cursor.rowcount
-
-                cursor = conn.execute(
-                    queries.SOFT_DELETE_TODOS_BEFORE_CREATED_AT, (cutoff_iso,)
-                )
-                deleted_counts["todos"] = cursor.rowcount
-
-                cursor = conn.execute(
-                    queries.SOFT_DELETE_DIARIES_BEFORE_DATE, (cutoff_date_str,)
-                )
-                deleted_counts["diaries"] = cursor.rowcount
+                for key, statement, cutoff in statements:
+                    deleted_counts[key] = conn.execute(statement, (cutoff,)).rowcount
 
                 conn.commit()
 
@@ -291,7 +277,7 @@ def get_db() -> DatabaseManager:
         DatabaseManager instance with all repositories
 
     Example:
-        from core.db import get_db
+        from backend.core.db import get_db
 
         db = get_db()
         activities = db.activities.get_recent(limit=10)
@@ -300,8 +286,8 @@ def get_db() -> DatabaseManager:
     global _db_manager
 
     if _db_manager is None:
-        from config.loader import get_config
-        from core.paths import get_db_path
+        from ...config.loader import get_config
+        from ..paths import get_db_path
 
         config = get_config()
 
@@ -334,7 +320,7 @@ def switch_database(new_db_path: str) -> bool:
         True if switch successful, False otherwise
 
     Example:
-        from core.db import switch_database
+        from backend.core.db import switch_database
 
         if switch_database("/path/to/new/db.db"):
             print("Database switched successfully")
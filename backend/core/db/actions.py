@@ -7,8 +7,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
-from core.sqls import queries
+from ..logger import get_logger
+from ..sqls import queries
 
 from .base import BaseRepository
 
@@ -97,6 +97,78 @@ class ActionsRepository(BaseRepository):
             logger.error(f"Failed to save action {action_id}: {e}", exc_info=True)
             raise
 
+    async def save_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save or update multiple actions in a single transaction
+
+        Args:
+            rows: Action dictionaries with the same fields as save()
+                  (action_id, title, description, keywords, timestamp,
+                  optional screenshots / extract_knowledge / knowledge_extracted)
+
+        Returns:
+            Number of actions saved
+        """
+        if not rows:
+            return 0
+
+        action_params = []
+        image_params = []
+        for row in rows:
+            action_id = row["action_id"]
+            action_params.append(
+                (
+                    action_id,
+                    row["title"],
+                    row["description"],
+                    json.dumps(row.get("keywords") or [], ensure_ascii=False),
+                    row["timestamp"],
+                    1 if row.get("extract_knowledge") else 0,
+                    1 if row.get("knowledge_extracted") else 0,
+                )
+            )
+
+            # Keep at most 6 unique screenshot hashes per action (same as save())
+            unique_hashes = list(
+                dict.fromkeys(h for h in row.get("screenshots") or [] if h)
+            )[:6]
+            image_params.extend((action_id, h) for h in unique_hashes)
+
+        try:
+            with self._get_conn() as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO actions (
+                        id, title, description, keywords, timestamp,
+                        extract_knowledge, knowledge_extracted, deleted, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, 0, CURRENT_TIMESTAMP)
+                    """,
+                    action_params,
+                )
+
+                cursor.executemany(
+                    "DELETE FROM action_images WHERE action_id = ?",
+                    [(row["action_id"],) for row in rows if row.get("screenshots")],
+                )
+
+                cursor.executemany(
+                    """
+                    INSERT OR IGNORE INTO action_images (action_id, hash, created_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    """,
+                    image_params,
+                )
+
+                conn.commit()
+                logger.debug(f"Saved {len(rows)} actions in one transaction")
+                return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} actions: {e}", exc_info=True)
+            raise
+
     async def get_recent(
         self, limit: int = 50, offset: int = 0
     ) -> List[Dict[str, Any]]:
@@ -301,6 +373,76 @@ class ActionsRepository(BaseRepository):
             logger.error(f"Failed to get actions in timeframe: {e}", exc_info=True)
             return []
 
+    async def get_unaggregated_in_timeframe(
+        self, start_time: str, end_time: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get actions within a time window that no event references yet
+
+        An event's end_time is the latest timestamp of its source actions, so
+        only events ending at or after start_time can reference actions in
+        the window; older events are never expanded.
+
+        Args:
+            start_time: ISO timestamp lower bound (inclusive)
+            end_time: ISO timestamp upper bound (inclusive)
+
+        Returns:
+            List of action dictionaries (without screenshots)
+        """
+        try:
+            with self._get_conn() as conn:
+                cursor = conn.execute(
+                    """
+                    WITH aggregated AS (
+                        SELECT j.value AS action_id
+                        FROM events e,
+                             json_each(
+                                 CASE WHEN json_valid(e.source_action_ids)
+                                      THEN e.source_action_ids ELSE '[]' END
+                             ) j
+                        WHERE e.deleted = 0
+                          AND e.end_time >= ?
+                          AND json_valid(e.source_action_ids)
+                    )
+                    SELECT a.id, a.title, a.description, a.keywords, a.timestamp,
+                           a.aggregated_into_event_id, a.extract_knowledge,
+                           a.knowledge_extracted, a.created_at
+                    FROM actions a
+                    WHERE a.timestamp >= ? AND a.timestamp <= ?
+                      AND a.deleted = 0
+                      AND NOT EXISTS (
+                          SELECT 1 FROM aggregated WHERE aggregated.action_id = a.id
+                      )
+                    ORDER BY a.timestamp ASC
+                    """,
+                    (start_time, start_time, end_time),
+                )
+                rows = cursor.fetchall()
+
+            return [
+                {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "description": row["description"],
+                    "keywords": json.loads(row["keywords"])
+                    if row["keywords"]
+                    else [],
+                    "timestamp": row["timestamp"],
+                    "aggregated_into_event_id": row["aggregated_into_event_id"],
+                    "extract_knowledge": bool(row["extract_knowledge"]),
+                    "knowledge_extracted": bool(row["knowledge_extracted"]),
+                    "created_at": row["created_at"],
+                }
+                for row in rows
+            ]
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get unaggregated actions in timeframe: {e}", exc_info=True
+            )
+            return []
+
     async def delete(self, action_id: str) -> None:
         """
         Soft delete an action
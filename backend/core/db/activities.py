@@ -7,7 +7,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
@@ -64,6 +64,62 @@ class ActivitiesRepository(BaseRepository):
             logger.error(f"Failed to save activity {activity_id}: {e}", exc_info=True)
             raise
 
+    async def save_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save or update multiple activities in a single transaction
+
+        Args:
+            rows: Activity dictionaries with the same fields as save()
+                  (activity_id, title, description, start_time, end_time,
+                  source_event_ids, optional session_duration_minutes,
+                  topic_tags, user_merged_from_ids, user_split_into_ids)
+
+        Returns:
+            Number of activities saved
+        """
+        if not rows:
+            return 0
+
+        params = [
+            (
+                row["activity_id"],
+                row["title"],
+                row["description"],
+                row["start_time"],
+                row["end_time"],
+                json.dumps(row["source_event_ids"]),
+                row.get("session_duration_minutes"),
+                json.dumps(row["topic_tags"]) if row.get("topic_tags") else None,
+                json.dumps(row["user_merged_from_ids"])
+                if row.get("user_merged_from_ids")
+                else None,
+                json.dumps(row["user_split_into_ids"])
+                if row.get("user_split_into_ids")
+                else None,
+            )
+            for row in rows
+        ]
+
+        try:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO activities (
+                        id, title, description, start_time, end_time,
+                        source_event_ids, session_duration_minutes, topic_tags,
+                        user_merged_from_ids, user_split_into_ids,
+                        created_at, updated_at, deleted
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
+                    """,
+                    params,
+                )
+                conn.commit()
+                logger.debug(f"Saved {len(rows)} activities in one transaction")
+                return len(rows)
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} activities: {e}", exc_info=True)
+            raise
+
     async def update(
         self,
         activity_id: str,
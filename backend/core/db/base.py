@@ -8,7 +8,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
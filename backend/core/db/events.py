@@ -5,9 +5,9 @@ Events are medium-grained activity segments (formerly Activities)
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
@@ -56,6 +56,52 @@ class EventsRepository(BaseRepository):
             logger.error(f"Failed to save event {event_id}: {e}", exc_info=True)
             raise
 
+    async def save_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save or update multiple events in a single transaction
+
+        Args:
+            rows: Event dictionaries with the same fields as save()
+                  (event_id, title, description, start_time, end_time,
+                  source_action_ids, optional version)
+
+        Returns:
+            Number of events saved
+        """
+        if not rows:
+            return 0
+
+        params = [
+            (
+                row["event_id"],
+                row["title"],
+                row["description"],
+                row["start_time"],
+                row["end_time"],
+                json.dumps(row["source_action_ids"]),
+                row.get("version", 1),
+            )
+            for row in rows
+        ]
+
+        try:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO events (
+                        id, title, description, start_time, end_time,
+                        source_action_ids, version, created_at, deleted
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, 0)
+                    """,
+                    params,
+                )
+                conn.commit()
+                logger.debug(f"Saved {len(rows)} events in one transaction")
+                return len(rows)
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} events: {e}", exc_info=True)
+            raise
+
     async def get_recent(
         self, limit: int = 50, offset: int = 0
     ) -> List[Dict[str, Any]]:
@@ -213,6 +259,90 @@ class EventsRepository(BaseRepository):
             logger.error(f"Failed to get events in timeframe: {e}", exc_info=True)
             return []
 
+    async def get_unaggregated_in_timeframe(
+        self,
+        start_time: str,
+        end_time: str,
+        min_actions: int = 0,
+        min_duration_seconds: float = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get events within a time window that are not aggregated into an
+        activity yet and pass the quality thresholds
+
+        Events whose timestamps SQLite cannot parse are not duration-filtered.
+
+        Args:
+            start_time: ISO timestamp lower bound (inclusive)
+            end_time: ISO timestamp upper bound (inclusive)
+            min_actions: Minimum number of source actions
+            min_duration_seconds: Minimum event duration (seconds)
+
+        Returns:
+            Tuple of (event dictionaries, number of unaggregated events in
+            the window rejected by the quality thresholds)
+        """
+        try:
+            with self._get_conn() as conn:
+                cursor = conn.execute(
+                    """
+                    SELECT id, title, description, start_time, end_time,
+                           source_action_ids, aggregated_into_activity_id, version, created_at
+                    FROM events
+                    WHERE start_time >= ? AND start_time <= ?
+                      AND deleted = 0
+                      AND COALESCE(aggregated_into_activity_id, '') = ''
+                      AND CASE WHEN json_valid(source_action_ids)
+                               THEN json_array_length(source_action_ids)
+                               ELSE 0
+                          END >= ?
+                      AND COALESCE(
+                          (julianday(end_time) - julianday(start_time)) * 86400 >= ?,
+                          1
+                      )
+                    ORDER BY start_time ASC
+                    """,
+                    (start_time, end_time, min_actions, min_duration_seconds),
+                )
+                rows = cursor.fetchall()
+
+                # Only the number of rejected events is needed, so count the
+                # unaggregated ones instead of fetching them
+                candidate_count = conn.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM events
+                    WHERE start_time >= ? AND start_time <= ?
+                      AND deleted = 0
+                      AND COALESCE(aggregated_into_activity_id, '') = ''
+                    """,
+                    (start_time, end_time),
+                ).fetchone()[0]
+
+            events = [
+                {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "description": row["description"],
+                    "start_time": row["start_time"],
+                    "end_time": row["end_time"],
+                    "source_action_ids": json.loads(row["source_action_ids"])
+                    if row["source_action_ids"]
+                    else [],
+                    "aggregated_into_activity_id": row["aggregated_into_activity_id"],
+                    "version": row["version"],
+                    "created_at": row["created_at"],
+                }
+                for row in rows
+            ]
+            return events, candidate_count - len(events)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get unaggregated events in timeframe: {e}", exc_info=True
+            )
+            return [], 0
+
     async def get_by_date(
         self, start_date: str, end_date: str
     ) -> List[Dict[str, Any]]:
@@ -326,6 +456,47 @@ class EventsRepository(BaseRepository):
             logger.error(f"Failed to mark events as aggregated: {e}", exc_info=True)
             raise
 
+    async def mark_as_aggregated_many(
+        self, assignments: Dict[str, List[str]]
+    ) -> int:
+        """
+        Mark events of several activities as aggregated in a single transaction
+
+        Args:
+            assignments: Mapping of activity ID to the event IDs aggregated into it
+
+        Returns:
+            Number of events marked
+        """
+        params = [
+            (activity_id, event_id)
+            for activity_id, event_ids in assignments.items()
+            for event_id in event_ids
+        ]
+        if not params:
+            return 0
+
+        try:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    """
+                    UPDATE events
+                    SET aggregated_into_activity_id = ?
+                    WHERE id = ?
+                    """,
+                    params,
+                )
+                conn.commit()
+                logger.debug(
+                    f"Marked {len(params)} events as aggregated into "
+                    f"{len(assignments)} activities"
+                )
+                return len(params)
+
+        except Exception as e:
+            logger.error(f"Failed to mark events as aggregated: {e}", exc_info=True)
+            raise
+
     async def delete(self, event_id: str) -> None:
         """Soft delete an event"""
         try:
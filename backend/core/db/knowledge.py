@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
@@ -56,7 +56,7 @@ class KnowledgeRepository(BaseRepository):
                 )
 
                 # Send event to frontend
-                from core.events import emit_knowledge_created
+                from ..events import emit_knowledge_created
 
                 emit_knowledge_created(
                     {
@@ -73,6 +73,72 @@ class KnowledgeRepository(BaseRepository):
             logger.error(f"Failed to save knowledge {knowledge_id}: {e}", exc_info=True)
             raise
 
+    async def save_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save or update multiple knowledge items in a single transaction
+
+        Args:
+            rows: Knowledge dictionaries with the same fields as save()
+                  (knowledge_id, title, description, keywords,
+                  optional created_at / source_action_id)
+
+        Returns:
+            Number of knowledge items saved
+        """
+        if not rows:
+            return 0
+
+        now_iso = datetime.now().isoformat()
+        records = [
+            {
+                "id": row["knowledge_id"],
+                "title": row["title"],
+                "description": row["description"],
+                "keywords": row["keywords"],
+                "created_at": row.get("created_at") or now_iso,
+                "source_action_id": row.get("source_action_id"),
+                "type": "original",
+            }
+            for row in rows
+        ]
+
+        try:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO knowledge (
+                        id, title, description, keywords,
+                        source_action_id, created_at, deleted
+                    ) VALUES (?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    [
+                        (
+                            record["id"],
+                            record["title"],
+                            record["description"],
+                            json.dumps(record["keywords"], ensure_ascii=False),
+                            record["source_action_id"],
+                            record["created_at"],
+                        )
+                        for record in records
+                    ],
+                )
+                conn.commit()
+                logger.debug(f"Saved {len(records)} knowledge items in one transaction")
+
+            # Send events to frontend
+            from ..events import emit_knowledge_created
+
+            for record in records:
+                emit_knowledge_created(record)
+
+            return len(records)
+        except Exception as e:
+            logger.error(
+                f"Failed to save {len(rows)} knowledge items: {e}", exc_info=True
+            )
+            raise
+
     async def get_list(self, include_deleted: bool = False) -> List[Dict[str, Any]]:
         """
         Get knowledge list (from knowledge table)
@@ -130,7 +196,7 @@ class KnowledgeRepository(BaseRepository):
                 logger.debug(f"Deleted knowledge: {knowledge_id}")
 
                 # Send event to frontend
-                from core.events import emit_knowledge_deleted
+                from ..events import emit_knowledge_deleted
 
                 emit_knowledge_deleted(knowledge_id)
         except Exception as e:
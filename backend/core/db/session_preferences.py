@@ -5,7 +5,7 @@ SessionPreferences Repository - Handles user preference learning for session agg
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
@@ -5,7 +5,7 @@ Settings Repository - Handles all settings-related database operations
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
+from ..logger import get_logger
 
 from .base import BaseRepository
 
@@ -63,7 +63,7 @@ class TodosRepository(BaseRepository):
                 logger.debug(f"Saved todo: {todo_id}")
 
                 # Send event to frontend
-                from core.events import emit_todo_created
+                from ..events import emit_todo_created
 
                 emit_todo_created(
                     {
@@ -225,7 +225,7 @@ class TodosRepository(BaseRepository):
                     }
 
                     # Send event to frontend
-                    from core.events import emit_todo_updated
+                    from ..events import emit_todo_updated
 
                     emit_todo_updated(updated_todo)
 
@@ -282,7 +282,7 @@ class TodosRepository(BaseRepository):
                     }
 
                     # Send event to frontend
-                    from core.events import emit_todo_updated
+                    from ..events import emit_todo_updated
 
                     emit_todo_updated(updated_todo)
 
@@ -305,7 +305,7 @@ class TodosRepository(BaseRepository):
                 logger.debug(f"Deleted todo: {todo_id}")
 
                 # Send event to frontend
-                from core.events import emit_todo_deleted
+                from ..events import emit_todo_deleted
 
                 emit_todo_deleted(todo_id)
         except Exception as e:
@@ -12,8 +12,8 @@ try:
 except ImportError:  # pragma: no cover - May not be available in non-Tauri environments (like offline scripts, tests)
     AppHandle = Any  # type: ignore[assignment]
     Emitter = None  # type: ignore[assignment]
-from core._event_state import event_state
-from core.logger import get_logger
+from ._event_state import event_state
+from .logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -222,6 +222,29 @@ def emit_monitors_changed(
     return success
 
 
+def _agent_task_update_payload(
+    task_id: str,
+    status: str,
+    progress: Optional[Dict[str, Any]] = None,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the payload describing a single agent task update"""
+    payload = {
+        "taskId": task_id,
+        "status": status,
+    }
+
+    if progress is not None:
+        payload["progress"] = progress
+    if result is not None:
+        payload["result"] = result
+    if error is not None:
+        payload["error"] = error
+
+    return payload
+
+
 def emit_agent_task_update(
     task_id: str,
     status: str,
@@ -243,17 +266,7 @@ def emit_agent_task_update(
     Returns:
         True if sent successfully, False otherwise
     """
-    payload = {
-        "taskId": task_id,
-        "status": status,
-    }
-
-    if progress is not None:
-        payload["progress"] = progress
-    if result is not None:
-        payload["result"] = result
-    if error is not None:
-        payload["error"] = error
+    payload = _agent_task_update_payload(task_id, status, progress, result, error)
 
     success = _emit("agent-task-update", payload)
     if success:
@@ -261,6 +274,27 @@ def emit_agent_task_update(
     return success
 
 
+def emit_agent_task_updates(updates: List[Dict[str, Any]]) -> bool:
+    """
+    Send several agent task updates to frontend as one "Agent task updates" event
+
+    Args:
+        updates: Update entries, each holding the keyword arguments of
+                 emit_agent_task_update (task_id, status, progress, result, error)
+
+    Returns:
+        True if sent successfully, False otherwise
+    """
+    payload = {
+        "updates": [_agent_task_update_payload(**update) for update in updates],
+    }
+
+    success = _emit("agent-task-updates", payload)
+    if success:
+        logger.debug(f"✅ Agent task updates event sent: {len(updates)} tasks")
+    return success
+
+
 def emit_chat_message_chunk(
     conversation_id: str,
     chunk: str,
@@ -3,14 +3,19 @@ JSON parsing utility functions
 Provides multi-strategy parsing for LLM returned JSON to improve parsing success rate
 """
 
+import asyncio
 import json
 import re
 from typing import Any, Optional
 
-from core.logger import get_logger
+from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Responses longer than this (characters) are parsed in a worker thread by
+# parse_json_from_response_async
+ASYNC_PARSE_THRESHOLD = 4096
+
 
 def parse_json_from_response(response: str) -> Optional[Any]:
     """
@@ -139,6 +144,25 @@ def parse_json_from_response(response: str) -> Optional[Any]:
     return None
 
 
+async def parse_json_from_response_async(response: str) -> Optional[Any]:
+    """
+    Async variant of parse_json_from_response for use inside coroutines
+
+    Large responses are parsed in a worker thread so the decode (and any
+    repair strategies) do not block the event loop; small ones are parsed
+    inline, where a thread hop would cost more than the parse.
+
+    Args:
+        response (str): LLM text response or JSON string
+
+    Returns:
+        Optional[Any]: Parsed JSON object, returns None if parsing fails
+    """
+    if isinstance(response, str) and len(response) > ASYNC_PARSE_THRESHOLD:
+        return await asyncio.to_thread(parse_json_from_response, response)
+    return parse_json_from_response(response)
+
+
 def _normalize_quotes(text: str) -> str:
     """
     Normalize various Unicode quote characters to standard ASCII quotes
@@ -138,9 +138,9 @@ class AgentTaskStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
-    """Agent task data model"""
+    """Agent task data model (slotted: the task manager keeps thousands alive)"""
 
     id: str
     agent: str
@@ -6,7 +6,7 @@ Provides reliable path finding functionality across environments (development/Ta
 from pathlib import Path
 from typing import List, Optional
 
-from core.logger import get_logger
+from .logger import get_logger
 
 logger = get_logger(__name__)
 
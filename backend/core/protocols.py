@@ -216,6 +216,10 @@ class EventsRepositoryProtocol(Protocol):
         """Mark events as aggregated into an activity"""
         ...
 
+    async def mark_as_aggregated_many(self, assignments: Dict[str, List[str]]) -> int:
+        """Mark events of several activities as aggregated in one transaction"""
+        ...
+
     async def delete(self, event_id: str) -> None:
         """Soft delete an event"""
         ...
@@ -7,9 +7,9 @@ import json
 import os
 from typing import Any, Dict, Optional, cast
 
-from core.logger import get_logger
-from core.paths import get_data_dir
-from core.protocols import DatabaseManagerProtocol
+from .logger import get_logger
+from .paths import get_data_dir
+from .protocols import DatabaseManagerProtocol
 
 logger = get_logger(__name__)
 
@@ -42,7 +42,7 @@ class SettingsManager:
         self.config_loader = config_loader
 
         if db_manager is None:
-            from core.db import get_db
+            from .db import get_db
 
             self.db = cast(DatabaseManagerProtocol, get_db())
         else:
@@ -201,7 +201,7 @@ class SettingsManager:
             logger.debug(f"✓ Database path updated: {path}")
 
             # Switch database immediately (real-time effect)
-            from core.db import switch_database
+            from .db import switch_database
 
             if switch_database(path):
                 logger.debug("✓ Switched to new database path")
@@ -236,7 +236,7 @@ class SettingsManager:
 
             # Update image manager storage directory to maintain runtime consistency
             try:
-                from perception.image_manager import get_image_manager
+                from ..perception.image_manager import get_image_manager
 
                 image_manager = get_image_manager()
                 image_manager.update_storage_path(path)
@@ -599,7 +599,7 @@ class SettingsManager:
 
             # Reinitialize image processor to apply new configuration
             try:
-                from processing.image import get_image_processor
+                from ..processing.image import get_image_processor
 
                 # Reset processor to pick up new config
                 get_image_processor(reset=True)
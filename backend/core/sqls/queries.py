@@ -174,13 +174,10 @@ SELECT_MESSAGE_COUNT = """
 """
 
 # Maintenance / cleanup queries
-DELETE_EVENT_IMAGES_BEFORE_TIMESTAMP = """
-    DELETE FROM event_images
-    WHERE event_id IN (SELECT id FROM events WHERE timestamp < ?)
-"""
-
-DELETE_EVENTS_BEFORE_TIMESTAMP = """
-    DELETE FROM events WHERE timestamp < ?
+SOFT_DELETE_EVENTS_BEFORE_START_TIME = """
+    UPDATE events
+    SET deleted = 1
+    WHERE deleted = 0 AND start_time < ?
 """
 
 SOFT_DELETE_ACTIVITIES_BEFORE_START_TIME = """
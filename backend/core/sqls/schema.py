@@ -386,6 +386,12 @@ CREATE_SESSION_PREFERENCES_CONFIDENCE_INDEX = """
     ON session_preferences(confidence_score DESC)
 """
 
+# Bounds the event scan when looking up unaggregated actions in a time window
+CREATE_EVENTS_LIVE_END_TIME_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_events_live_end_time
+    ON events(end_time) WHERE deleted = 0
+"""
+
 # All table creation statements in order
 ALL_TABLES = [
     CREATE_RAW_RECORDS_TABLE,
@@ -441,4 +447,5 @@ ALL_INDEXES = [
     CREATE_ACTION_IMAGES_HASH_INDEX,
     CREATE_SESSION_PREFERENCES_TYPE_INDEX,
     CREATE_SESSION_PREFERENCES_CONFIDENCE_INDEX,
+    CREATE_EVENTS_LIVE_END_TIME_INDEX,
 ]
@@ -13,11 +13,11 @@ import uuid
 from datetime import datetime
 from typing import Any, List, Tuple
 
-from core.coordinator import get_coordinator
-from core.db import DatabaseManager, get_db
-from core.events import emit_activity_deleted, emit_activity_merged, emit_activity_split
-from core.logger import get_logger
-from models import (
+from ..core.coordinator import get_coordinator
+from ..core.db import DatabaseManager, get_db
+from ..core.events import emit_activity_deleted, emit_activity_merged, emit_activity_split
+from ..core.logger import get_logger
+from ..models import (
     ActivityCountResponse,
     DataResponse,
     DeleteActivitiesByDateRequest,
@@ -29,12 +29,12 @@ from models import (
     IncrementalActivitiesResponse,
     TimedOperationResponse,
 )
-from models.requests import (
+from ..models.requests import (
     GetEventsByActivityRequest,
     MergeActivitiesRequest,
     SplitActivityRequest,
 )
-from models.responses import (
+from ..models.responses import (
     ActivityCountData,
     EventResponse,
     GetEventsByActivityResponse,
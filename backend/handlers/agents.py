@@ -4,10 +4,10 @@ Agent-related API handlers
 
 from typing import Any, Dict, List
 
-from agents.manager import task_manager
-from core.logger import get_logger
-from models.base import OperationDataResponse
-from models.requests import (
+from ..agents.manager import get_task_manager
+from ..core.logger import get_logger
+from ..models.base import OperationDataResponse
+from ..models.requests import (
     CreateTaskRequest,
     DeleteTaskRequest,
     ExecuteTaskInChatRequest,
@@ -43,7 +43,7 @@ async def create_task(body: CreateTaskRequest) -> AgentResponse:
     try:
         logger.debug(f"Create task request: {body.agent} - {body.plan_description}")
 
-        task = task_manager.create_task(body.agent, body.plan_description)
+        task = get_task_manager().create_task(body.agent, body.plan_description)
 
         return AgentResponse(
             success=True,
@@ -70,7 +70,7 @@ async def execute_task(body: ExecuteTaskRequest) -> AgentResponse:
     try:
         logger.debug(f"Execute task request: {body.task_id}")
 
-        success = await task_manager.execute_task(body.task_id)
+        success = await get_task_manager().execute_task(body.task_id)
 
         if success:
             return AgentResponse(success=True, message="Task execution started")
@@ -97,7 +97,7 @@ async def delete_task(body: DeleteTaskRequest) -> AgentResponse:
     try:
         logger.debug(f"Delete task request: {body.task_id}")
 
-        success = task_manager.delete_task(body.task_id)
+        success = get_task_manager().delete_task(body.task_id)
 
         if success:
             return AgentResponse(success=True, message="Task deleted successfully")
@@ -124,7 +124,7 @@ async def get_tasks(body: GetTasksRequest) -> AgentResponse:
     try:
         logger.debug(f"Get task list request: limit={body.limit}, status={body.status}")
 
-        tasks = task_manager.get_tasks(body.limit, body.status)
+        tasks = get_task_manager().get_tasks(body.limit, body.status)
         tasks_data = [task.to_dict() for task in tasks]
 
         return AgentResponse(
@@ -152,7 +152,7 @@ async def get_available_agents(body: GetAvailableAgentsRequest) -> AgentResponse
     try:
         logger.debug("Get available agent list request")
 
-        agents = task_manager.get_available_agents()
+        agents = get_task_manager().get_available_agents()
         agents_data = [agent.to_dict() for agent in agents]
 
         return AgentResponse(
@@ -182,7 +182,7 @@ async def get_task_status(body: ExecuteTaskRequest) -> AgentResponse:
     try:
         logger.debug(f"Get task status request: {body.task_id}")
 
-        task = task_manager.get_task(body.task_id)
+        task = get_task_manager().get_task(body.task_id)
 
         if task:
             return AgentResponse(
@@ -215,10 +215,10 @@ async def schedule_task(body: ScheduleTaskRequest) -> AgentResponse:
     try:
         logger.debug(f"Schedule task request: {body.task_id} to {body.scheduled_date}")
 
-        success = task_manager.schedule_task(body.task_id, body.scheduled_date)
+        success = get_task_manager().schedule_task(body.task_id, body.scheduled_date)
 
         if success:
-            task = task_manager.get_task(body.task_id)
+            task = get_task_manager().get_task(body.task_id)
             return AgentResponse(
                 success=True,
                 data=task.to_dict() if task else None,
@@ -247,10 +247,10 @@ async def unschedule_task(body: UnscheduleTaskRequest) -> AgentResponse:
     try:
         logger.debug(f"Unschedule task request: {body.task_id}")
 
-        success = task_manager.unschedule_task(body.task_id)
+        success = get_task_manager().unschedule_task(body.task_id)
 
         if success:
-            task = task_manager.get_task(body.task_id)
+            task = get_task_manager().get_task(body.task_id)
             return AgentResponse(
                 success=True,
                 data=task.to_dict() if task else None,
@@ -283,7 +283,7 @@ async def get_tasks_by_date(body: GetTasksByDateRequest) -> AgentResponse:
     try:
         logger.debug(f"Get tasks by date request: {body.scheduled_date}")
 
-        tasks = task_manager.get_tasks_by_date(body.scheduled_date)
+        tasks = get_task_manager().get_tasks_by_date(body.scheduled_date)
         tasks_data = [task.to_dict() for task in tasks]
 
         return AgentResponse(
@@ -315,7 +315,7 @@ async def execute_task_in_chat(body: ExecuteTaskInChatRequest) -> AgentResponse:
             f"Execute task in chat: {body.task_id}, conversation: {body.conversation_id}"
         )
 
-        task = task_manager.get_task(body.task_id)
+        task = get_task_manager().get_task(body.task_id)
         if not task:
             return AgentResponse(
                 success=False,
@@ -324,7 +324,7 @@ async def execute_task_in_chat(body: ExecuteTaskInChatRequest) -> AgentResponse:
             )
 
         # Import chat service to create/use conversation
-        from handlers.chat import create_conversation, send_message
+        from .chat import create_conversation, send_message
 
         conversation_id = body.conversation_id
 
@@ -334,7 +334,7 @@ async def execute_task_in_chat(body: ExecuteTaskInChatRequest) -> AgentResponse:
             title = task.plan_description[:50] + (
                 "..." if len(task.plan_description) > 50 else ""
             )
-            from backend.handlers.chat import CreateConversationRequest
+            from .chat import CreateConversationRequest
 
             conv_result = await create_conversation(
                 CreateConversationRequest(title=title)
@@ -348,7 +348,7 @@ async def execute_task_in_chat(body: ExecuteTaskInChatRequest) -> AgentResponse:
             conversation_id = conv_result["data"]["id"]
 
         # Send task description as message
-        from backend.handlers.chat import SendMessageRequest
+        from .chat import SendMessageRequest
 
         message_result = await send_message(
             SendMessageRequest(
@@ -358,7 +358,7 @@ async def execute_task_in_chat(body: ExecuteTaskInChatRequest) -> AgentResponse:
 
         if message_result.get("success"):
             # Delete the task from agents after successfully sending to chat
-            task_manager.delete_task(body.task_id)
+            get_task_manager().delete_task(body.task_id)
 
             return AgentResponse(
                 success=True,
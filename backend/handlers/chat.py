@@ -9,10 +9,10 @@ import asyncio
 from pathlib import Path
 from typing import Any, Dict, List
 
-from core.logger import get_logger
-from core.settings import get_settings
-from models.base import OperationDataResponse
-from models.requests import (
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..models.base import OperationDataResponse
+from ..models.requests import (
     CancelStreamRequest,
     CreateConversationFromActivitiesRequest,
     CreateConversationRequest,
@@ -25,8 +25,8 @@ from models.requests import (
     UpdateFriendlyChatSettingsRequest,
     UpdateLive2DSettingsRequest,
 )
-from services.chat_service import get_chat_service
-from services.friendly_chat_service import get_friendly_chat_service
+from ..services.chat_service import get_chat_service
+from ..services.friendly_chat_service import get_friendly_chat_service
 
 from . import api_handler
 
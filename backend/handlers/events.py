@@ -10,19 +10,19 @@ Handles all event-related operations including:
 from datetime import datetime
 from typing import List, Tuple
 
-from core.db import DatabaseManager, get_db
-from core.events import emit_event_deleted
-from core.logger import get_logger
-from models import (
+from ..core.db import DatabaseManager, get_db
+from ..core.events import emit_event_deleted
+from ..core.logger import get_logger
+from ..models import (
     DataResponse,
     DeleteEventRequest,
     GetEventByIdRequest,
     GetEventsRequest,
     TimedOperationResponse,
 )
-from models.requests import GetActionsByEventRequest
-from models.responses import ActionResponse, GetActionsByEventResponse
-from perception.image_manager import ImageManager, get_image_manager
+from ..models.requests import GetActionsByEventRequest
+from ..models.responses import ActionResponse, GetActionsByEventResponse
+from ..perception.image_manager import ImageManager, get_image_manager
 
 from . import api_handler
 
@@ -40,7 +40,7 @@ def _get_data_access() -> Tuple[DatabaseManager, ImageManager]:
     Returns:
         Tuple of (DatabaseManager, ImageManager)
     """
-    from core.coordinator import get_coordinator
+    from ..core.coordinator import get_coordinator
 
     coordinator = get_coordinator()
     pipeline = coordinator.processing_pipeline
@@ -107,15 +107,7 @@ async def _load_event_screenshots_base64(
     """
     hashes = await _get_event_screenshot_hashes(db, event_id)
 
-    screenshots: List[str] = []
-    for img_hash in hashes:
-        if not img_hash:
-            continue
-        data = image_manager.get_from_cache(img_hash)
-        if not data:
-            data = image_manager.load_thumbnail_base64(img_hash)
-        if data:
-            screenshots.append(data)
+    screenshots = await image_manager.load_many_base64(hashes)
 
     return hashes, screenshots
 
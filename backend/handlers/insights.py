@@ -7,10 +7,10 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
-from core.coordinator import get_coordinator
-from core.db import get_db
-from core.logger import get_logger
-from models.requests import (
+from ..core.coordinator import get_coordinator
+from ..core.db import get_db
+from ..core.logger import get_logger
+from ..models.requests import (
     DeleteItemRequest,
     GenerateDiaryRequest,
     GetDiaryListRequest,
@@ -19,14 +19,14 @@ from models.requests import (
     ScheduleTodoRequest,
     UnscheduleTodoRequest,
 )
-from models.responses import (
+from ..models.responses import (
     DeleteDiaryResponse,
     DiaryData,
     DiaryListData,
     GenerateDiaryResponse,
     GetDiaryListResponse,
 )
-from perception.image_manager import get_image_manager
+from ..perception.image_manager import get_image_manager
 
 from . import api_handler
 
@@ -84,17 +84,7 @@ async def _get_event_action_screenshot_hashes(db, event_id: str) -> List[str]:
 async def _load_event_screenshots_base64(db, image_manager, event_id: str) -> List[str]:
     hashes = await _get_event_action_screenshot_hashes(db, event_id)
 
-    screenshots: List[str] = []
-    for img_hash in hashes:
-        if not img_hash:
-            continue
-        data = image_manager.get_from_cache(img_hash)
-        if not data:
-            data = image_manager.load_thumbnail_base64(img_hash)
-        if data:
-            screenshots.append(data)
-
-    return screenshots
+    return await image_manager.load_many_base64(hashes)
 
 
 # ============ Event Related Interfaces ============
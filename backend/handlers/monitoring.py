@@ -17,18 +17,18 @@ from datetime import datetime as dt
 from typing import Any, Dict, List, Optional, Protocol, Sequence, cast
 
 import mss
-from core.events import emit_monitors_changed
-from core.logger import get_logger
-from core.settings import get_settings
-from models import GetRecordsRequest
-from models.base import BaseModel, OperationResponse
-from models.permissions import (
+from ..core.events import emit_monitors_changed
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..models import GetRecordsRequest
+from ..models.base import BaseModel, OperationResponse
+from ..models.permissions import (
     OpenSystemSettingsRequest,
     PermissionsCheckResponse,
     RestartAppRequest,
 )
 from PIL import Image
-from system.permissions import get_permission_checker
+from ..system.permissions import get_permission_checker
 
 from . import api_handler
 
@@ -426,7 +426,7 @@ class PerceptionManagerProtocol(Protocol):
 
 
 def _get_perception_manager() -> PerceptionManagerProtocol:
-    from core.coordinator import get_coordinator
+    from ..core.coordinator import get_coordinator
 
     coordinator = get_coordinator()
     manager = getattr(coordinator, "perception_manager", None)
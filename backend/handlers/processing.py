@@ -12,10 +12,10 @@ Handles processing pipeline control operations and batch data cleanup including:
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Tuple
 
-from core.coordinator import get_coordinator
-from core.db import DatabaseManager, get_db
-from core.logger import get_logger
-from models import (
+from ..core.coordinator import get_coordinator
+from ..core.db import DatabaseManager, get_db
+from ..core.logger import get_logger
+from ..models import (
     CleanupOldDataRequest,
     DataResponse,
     DeleteDiariesByDateRequest,
@@ -23,8 +23,8 @@ from models import (
     DeleteTodosByDateRequest,
     TimedOperationResponse,
 )
-from perception.image_manager import ImageManager, get_image_manager
-from processing.pipeline import ProcessingPipeline
+from ..perception.image_manager import ImageManager, get_image_manager
+from ..processing.pipeline import ProcessingPipeline
 
 from . import api_handler
 
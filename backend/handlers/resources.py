@@ -14,13 +14,13 @@ from datetime import datetime
 from typing import Any, Dict
 
 import httpx
-from core.coordinator import get_coordinator
-from core.dashboard.manager import get_dashboard_manager
-from core.db import get_db
-from core.logger import get_logger
-from core.settings import get_settings
-from models.base import OperationResponse, TimedOperationResponse
-from models.requests import (
+from ..core.coordinator import get_coordinator
+from ..core.dashboard.manager import get_dashboard_manager
+from ..core.db import get_db
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..models.base import OperationResponse, TimedOperationResponse
+from ..models.requests import (
     CleanupImagesRequest,
     CreateModelRequest,
     DeleteModelRequest,
@@ -34,7 +34,7 @@ from models.requests import (
     TestModelRequest,
     UpdateModelRequest,
 )
-from models.responses import (
+from ..models.responses import (
     CachedImagesResponse,
     CleanupImagesResponse,
     ClearMemoryCacheResponse,
@@ -44,9 +44,9 @@ from models.responses import (
     ReadImageFileResponse,
     UpdateImageOptimizationConfigResponse,
 )
-from perception.image_manager import get_image_manager
-from processing.image import get_image_processor
-from system.runtime import start_runtime, stop_runtime
+from ..perception.image_manager import get_image_manager
+from ..processing.image import get_image_processor
+from ..system.runtime import start_runtime, stop_runtime
 
 from . import api_handler
 
@@ -300,7 +300,7 @@ async def update_image_optimization_config(
         if success:
             # Reinitialize image processor to apply new configuration
             try:
-                from processing.image import get_image_processor
+                from ..processing.image import get_image_processor
 
                 get_image_processor(reset=True)
                 logger.debug("Image processor has been reinitialized")
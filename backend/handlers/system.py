@@ -13,18 +13,18 @@ Provides comprehensive system management functionality including:
 from datetime import datetime
 from pathlib import Path
 
-from core.coordinator import get_coordinator
-from core.db import get_db
-from core.logger import get_logger
-from core.settings import get_settings
-from models import Person
-from models.base import BaseModel, OperationResponse
-from models.requests import (
+from ..core.coordinator import get_coordinator
+from ..core.db import get_db
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..models import Person
+from ..models.base import BaseModel, OperationResponse
+from ..models.requests import (
     ImageCompressionConfigRequest,
     ImageOptimizationConfigRequest,
     UpdateSettingsRequest,
 )
-from models.responses import (
+from ..models.responses import (
     CheckInitialSetupResponse,
     CompleteInitialSetupResponse,
     DatabasePathData,
@@ -45,7 +45,7 @@ from models.responses import (
     UpdateImageOptimizationConfigResponseV2,
     UpdateSettingsResponse,
 )
-from system.runtime import get_runtime_stats, start_runtime, stop_runtime
+from ..system.runtime import get_runtime_stats, start_runtime, stop_runtime
 
 from . import api_handler
 
@@ -361,7 +361,7 @@ async def get_image_compression_stats() -> GetImageCompressionStatsResponse:
     @returns Image compression statistics data
     """
     try:
-        from processing.image import get_image_compressor
+        from ..processing.image import get_image_compressor
 
         compressor = get_image_compressor()
         stats = compressor.get_stats()
@@ -386,7 +386,7 @@ async def reset_image_compression_stats() -> TimedOperationResponse:
     @returns Success response
     """
     try:
-        from processing.image import get_image_compressor
+        from ..processing.image import get_image_compressor
 
         # Reset by creating a new compressor instance
         _compressor = get_image_compressor(reset=True)
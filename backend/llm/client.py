@@ -8,9 +8,9 @@ import json
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
-from core.dashboard.manager import get_dashboard_manager
-from core.db import get_db
-from core.logger import get_logger
+from ..core.dashboard.manager import get_dashboard_manager
+from ..core.db import get_db
+from ..core.logger import get_logger
 
 from .prompt_manager import get_prompt_manager
 
@@ -135,8 +135,10 @@ class LLMClient:
 
     async def _get_shared_client(self) -> httpx.AsyncClient:
         """Get or create shared AsyncClient with connection pooling"""
-        async with self._client_lock:
-            if self._shared_client is None or self._shared_client.is_closed:
+        # Stored on the class so every LLMClient instance shares one pool
+        cls = type(self)
+        async with cls._client_lock:
+            if cls._shared_client is None or cls._shared_client.is_closed:
                 # Configure connection limits for better throughput
                 limits = httpx.Limits(
                     max_connections=20,      # Total concurrent connections
@@ -144,7 +146,7 @@ class LLMClient:
                     keepalive_expiry=30.0    # Keep connections alive for 30s
                 )
 
-                self._shared_client = httpx.AsyncClient(
+                cls._shared_client = httpx.AsyncClient(
                     timeout=self.timeout,
                     verify=self.verify_ssl,
                     http2=self.use_http2,
@@ -153,7 +155,7 @@ class LLMClient:
                 )
                 logger.debug(f"Created shared AsyncClient with HTTP/2={self.use_http2}, limits={limits}")
 
-            return self._shared_client
+            return cls._shared_client
 
     @classmethod
     async def close_shared_client(cls):
@@ -352,7 +354,9 @@ class LLMClient:
                 try:
                     # Use shared client with connection pooling
                     client = await self._get_shared_client()
-                    response = await client.post(url, headers=headers, json=payload)
+                    response = await client.post(
+                        url, headers=headers, json=payload, timeout=self.timeout
+                    )
                     response.raise_for_status()
 
                     result = response.json()
@@ -510,7 +514,7 @@ class LLMClient:
             # Use shared client with connection pooling for streaming too
             client = await self._get_shared_client()
             async with client.stream(
-                "POST", url, headers=headers, json=payload
+                "POST", url, headers=headers, json=payload, timeout=self.timeout
             ) as response:
                 response.raise_for_status()
 
@@ -5,7 +5,7 @@ Ensures all services use the latest activated model configuration
 
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from core.logger import get_logger
+from ..core.logger import get_logger
 
 from .client import LLMClient
 
@@ -6,7 +6,7 @@ Reads and manages all LLM prompt templates from YAML configuration files
 import yaml
 import toml
 from typing import Dict, Any, List, Optional
-from core.logger import get_logger
+from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -0,0 +1,116 @@
+"""
+Validation cache - Shared cache of supervisor LLM validation results
+Identical content validated again within the TTL reuses the previous result
+instead of issuing another LLM request
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class ValidationCacheStats:
+    """Validation cache counters"""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class ValidationCache:
+    """
+    LRU cache with per-entry TTL for supervisor validation results
+
+    Entries are keyed by a SHA-256 digest of everything that determines the
+    validation prompt. Results are copied on the way in and out, so callers
+    may mutate what they get back.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 600.0):
+        """
+        Initialize validation cache
+
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Time (seconds) a cached result stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (monotonic expiry time, validation result)
+        self._entries: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self.stats = ValidationCacheStats()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the parts that determine the prompt"""
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached validation result
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Copy of the cached result, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Cache a validation result
+
+        Args:
+            key: Cache key from make_key
+            result: Parsed validation result
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(result))
+        self._entries.move_to_end(key)
+
+        # Remove oldest entries if cache is full
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """Drop all cached results, returning how many were removed"""
+        cleared = len(self._entries)
+        self._entries.clear()
+        return cleared
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics information"""
+        return {"size": len(self._entries), **asdict(self.stats)}
+
+
+# Global singleton instance
+_validation_cache: Optional[ValidationCache] = None
+
+
+def get_validation_cache() -> ValidationCache:
+    """
+    Get the global validation cache instance
+
+    Returns:
+        ValidationCache singleton
+    """
+    global _validation_cache
+    if _validation_cache is None:
+        _validation_cache = ValidationCache()
+    return _validation_cache
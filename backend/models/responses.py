@@ -5,7 +5,7 @@ Provides strongly typed response models for better type safety and auto-generati
 
 from typing import Any, Dict, List, Optional
 
-from models.base import BaseModel, OperationResponse, TimedOperationResponse
+from .base import BaseModel, OperationResponse, TimedOperationResponse
 
 
 # System responses
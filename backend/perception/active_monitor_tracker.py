@@ -8,7 +8,7 @@ enabling smart screenshot capture that only captures the active screen.
 import time
 from typing import Dict, List, Optional
 
-from core.logger import get_logger
+from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -6,7 +6,7 @@ Provides active window information for enriching screenshot records
 from typing import Any, Dict, List, Optional
 
 import mss
-from core.logger import get_logger
+from ..core.logger import get_logger
 
 from .base import BaseActiveWindowCapture
 
@@ -6,7 +6,7 @@ Define monitor interfaces for different types of perception components
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, Optional
 
-from core.models import RawRecord
+from ..core.models import RawRecord
 
 
 class BaseMonitor(ABC):
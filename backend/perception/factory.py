@@ -16,8 +16,8 @@ Components created:
 
 import sys
 from typing import Optional, Callable, Any
-from core.logger import get_logger
-from core.models import RawRecord
+from ..core.logger import get_logger
+from ..core.models import RawRecord
 
 from .base import BaseKeyboardMonitor, BaseMouseMonitor, BaseActiveWindowCapture, BaseEventListener
 from .platforms import (
@@ -3,6 +3,7 @@ Image manager
 Manages screenshot memory cache, thumbnail generation, compression and persistence strategies
 """
 
+import asyncio
 import base64
 import io
 from collections import OrderedDict
@@ -10,8 +11,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from core.logger import get_logger
-from core.paths import ensure_dir, get_data_dir
+from ..core.logger import get_logger
+from ..core.paths import ensure_dir, get_data_dir
 from PIL import Image
 
 logger = get_logger(__name__)
@@ -32,7 +33,7 @@ class ImageManager:
     ):
         # Try to read custom path from configuration
         try:
-            from core.settings import get_settings
+            from ..core.settings import get_settings
 
             configured = get_settings().get(
                 "image.memory_cache_size", memory_cache_size
@@ -90,7 +91,7 @@ class ImageManager:
 
         # Try to read custom path from configuration
         try:
-            from core.settings import get_settings
+            from ..core.settings import get_settings
 
             config_path = get_settings().get("image_storage_path", "")
             if config_path:
@@ -186,6 +187,34 @@ class ImageManager:
             logger.debug(f"Failed to load thumbnail: {e}")
         return None
 
+    async def load_many_base64(self, img_hashes: List[str]) -> List[str]:
+        """Load base64 data for multiple images, reading thumbnails concurrently
+
+        Memory cache hits are served directly; misses are read from disk in
+        worker threads so the file reads overlap.
+
+        Args:
+            img_hashes: List of image hash values
+
+        Returns:
+            base64-encoded image data in input order, skipping images not found
+        """
+        hashes = [img_hash for img_hash in img_hashes if img_hash]
+        results: List[Optional[str]] = [self.get_from_cache(h) for h in hashes]
+        misses = [i for i, data in enumerate(results) if not data]
+
+        if misses:
+            loaded = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self.load_thumbnail_base64, hashes[i])
+                    for i in misses
+                )
+            )
+            for i, data in zip(misses, loaded):
+                results[i] = data
+
+        return [data for data in results if data]
+
     def save_thumbnail(self, img_hash: str, thumbnail_bytes: bytes) -> None:
         """Save thumbnail to disk
 
@@ -325,13 +354,14 @@ class ImageManager:
                 # Extract hash from filename (remove .jpg extension)
                 file_hash = file_path.stem
 
-                # Skip if file is within safety window
-                if file_path.stat().st_mtime >= cutoff_timestamp:
+                # Skip if file is within safety window (single stat per file)
+                file_stat = file_path.stat()
+                if file_stat.st_mtime >= cutoff_timestamp:
                     continue
 
                 # Delete if not referenced by any action
                 if file_hash not in referenced_hashes:
-                    file_size = file_path.stat().st_size
+                    file_size = file_stat.st_size
                     file_path.unlink(missing_ok=True)
                     cleaned_count += 1
                     total_size += file_size
@@ -9,8 +9,8 @@ import asyncio
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional
 
-from core.logger import get_logger
-from core.models import RawRecord
+from ..core.logger import get_logger
+from ..core.models import RawRecord
 
 from .active_monitor_tracker import ActiveMonitorTracker
 from .factory import (
@@ -227,7 +227,7 @@ class PerceptionManager:
             self.is_paused = False
 
             # Load perception settings
-            from core.settings import get_settings
+            from ..core.settings import get_settings
 
             settings = get_settings()
             self.keyboard_enabled = settings.get("perception.keyboard_enabled", True)
@@ -393,7 +393,7 @@ class PerceptionManager:
 
     def get_records_by_type(self, event_type: str) -> list:
         """Get records by type"""
-        from core.models import RecordType
+        from ..core.models import RecordType
 
         try:
             event_type_enum = RecordType(event_type)
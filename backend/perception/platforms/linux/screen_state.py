@@ -6,8 +6,8 @@ import threading
 from importlib import import_module
 from typing import Callable, Optional
 
-from core.logger import get_logger
-from perception.base import BaseEventListener
+from ....core.logger import get_logger
+from ...base import BaseEventListener
 
 logger = get_logger(__name__)
 
@@ -5,8 +5,8 @@ Uses NSWorkspace for application info and Quartz for window geometry
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from core.logger import get_logger
-from perception.base import BaseActiveWindowCapture
+from ....core.logger import get_logger
+from ...base import BaseActiveWindowCapture
 
 logger = get_logger(__name__)
 
@@ -19,9 +19,9 @@ from importlib import import_module
 from queue import Queue
 from typing import Any, Callable, Dict, Optional
 
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from perception.base import BaseKeyboardMonitor
+from ....core.logger import get_logger
+from ....core.models import RawRecord, RecordType
+from ...base import BaseKeyboardMonitor
 
 logger = get_logger(__name__)
 
@@ -7,9 +7,9 @@ import time
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional, Tuple
 
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from perception.base import BaseMouseMonitor
+from ....core.logger import get_logger
+from ....core.models import RawRecord, RecordType
+from ...base import BaseMouseMonitor
 from pynput import mouse
 
 logger = get_logger(__name__)
@@ -5,8 +5,8 @@ Uses Win32 API for window information
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from core.logger import get_logger
-from perception.base import BaseActiveWindowCapture
+from ....core.logger import get_logger
+from ...base import BaseActiveWindowCapture
 
 logger = get_logger(__name__)
 
@@ -8,9 +8,9 @@ TODO: Consider using Windows API (pywin32) for more native monitoring in the fut
 from datetime import datetime
 from typing import Optional, Callable, Dict, Any
 from pynput import keyboard
-from core.models import RawRecord, RecordType
-from core.logger import get_logger
-from perception.base import BaseKeyboardMonitor
+from ....core.models import RawRecord, RecordType
+from ....core.logger import get_logger
+from ...base import BaseKeyboardMonitor
 
 logger = get_logger(__name__)
 
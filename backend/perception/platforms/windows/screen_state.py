@@ -5,8 +5,8 @@ Windows screen state monitor implementation
 import threading
 from typing import Callable, Optional
 
-from core.logger import get_logger
-from perception.base import BaseEventListener
+from ....core.logger import get_logger
+from ...base import BaseEventListener
 
 logger = get_logger(__name__)
 
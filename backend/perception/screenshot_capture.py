@@ -11,13 +11,13 @@ from datetime import datetime
 from typing import Any, Callable, Dict, Iterable, List, Optional, cast
 
 import mss
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from core.paths import get_tmp_dir
-from core.settings import get_settings
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
+from ..core.paths import get_tmp_dir
+from ..core.settings import get_settings
 from mss.base import MSSBase
 from PIL import Image
-from perception.image_manager import get_image_manager
+from .image_manager import get_image_manager
 
 from .base import BaseCapture
 
@@ -8,8 +8,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from collections import deque
 from threading import Lock
-from core.models import RawRecord, RecordType
-from core.logger import get_logger
+from ..core.models import RawRecord, RecordType
+from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -12,7 +12,7 @@ import io
 from typing import Dict, Tuple
 
 import numpy as np
-from core.logger import get_logger
+from ...core.logger import get_logger
 from PIL import Image, ImageFilter
 
 logger = get_logger(__name__)
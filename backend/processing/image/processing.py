@@ -16,7 +16,7 @@ import io
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from core.logger import get_logger
+from ...core.logger import get_logger
 from PIL import Image
 
 from .analysis import ImageAnalyzer
@@ -244,7 +244,8 @@ class ImageDuplicateDetector:
         """Calculate Hamming distance between two hashes"""
         if not hash1 or not hash2 or len(hash1) != len(hash2):
             return 64
-        return sum(c1 != c2 for c1, c2 in zip(hash1, hash2))
+        # XOR + popcount on the 64-bit integers instead of a per-bit Python loop
+        return (int(hash1, 2) ^ int(hash2, 2)).bit_count()
 
     def is_duplicate(self, img_bytes: bytes) -> bool:
         """
@@ -609,7 +610,7 @@ def get_image_processor(reset: bool = False) -> ImageProcessor:
 
     if _global_image_processor is None or reset:
         try:
-            from core.settings import get_settings
+            from ...core.settings import get_settings
 
             settings = get_settings()
             config = settings.get_image_optimization_config()
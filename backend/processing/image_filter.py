@@ -8,9 +8,9 @@ import io
 from collections import deque
 from typing import Any, Dict, List, Optional, Tuple
 
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from perception.image_manager import get_image_manager
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
+from ..perception.image_manager import get_image_manager
 
 logger = get_logger(__name__)
 
@@ -140,7 +140,7 @@ class ImageFilter:
             return
 
         try:
-            from processing.image.analysis import ImageAnalyzer
+            from .image.analysis import ImageAnalyzer
             self.content_analyzer = ImageAnalyzer()
             logger.debug("Content analyzer initialized")
         except Exception as e:
@@ -154,7 +154,7 @@ class ImageFilter:
             return
 
         try:
-            from processing.image.processing import ImageCompressor
+            from .image.processing import ImageCompressor
             self.compressor = ImageCompressor()
             logger.debug("Image compressor initialized")
         except Exception as e:
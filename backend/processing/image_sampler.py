@@ -5,8 +5,8 @@ Controls which images to send to LLM based on time intervals and quantity limits
 
 from typing import List
 
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
 
 logger = get_logger(__name__)
 
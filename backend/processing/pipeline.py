@@ -15,10 +15,10 @@ import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from core.db import get_db
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
-from perception.image_manager import get_image_manager
+from ..core.db import get_db
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
+from ..perception.image_manager import get_image_manager
 
 from .image_filter import ImageFilter
 from .image_sampler import ImageSampler
@@ -75,7 +75,7 @@ class ProcessingPipeline:
 
         # ImageSampler: handles sampling when sending to LLM
         # Load sampling config from settings
-        from core.settings import get_settings
+        from ..core.settings import get_settings
         settings = get_settings()
         image_config = settings.get_image_optimization_config()
 
@@ -344,30 +344,22 @@ class ProcessingPipeline:
                 f"({sum(len(s.get('visual_summary', '')) for s in scenes)} chars total)"
             )
 
-            # Step 2: Extract actions from scene descriptions (ActionAgent)
+            # Step 2: Extract actions, knowledge and TODOs in parallel from the
+            # same scenes; none of them depends on another's output
             logger.debug(
-                "Step 2: Extracting actions from scenes via ActionAgent (text-only)"
-            )
-            saved_count = await self.action_agent.extract_and_save_actions_from_scenes(
-                scenes,
-                keyboard_records=keyboard_records,
-                mouse_records=mouse_records,
-            )
-
-            # Update statistics
-            self.stats["actions_created"] += saved_count
-            self.stats["last_processing_time"] = datetime.now()
-
-            logger.debug(
-                f"ActionAgent completed: saved {saved_count} actions from {len(scenes)} scenes"
+                "Step 2: Extracting actions, knowledge and TODOs in parallel from scenes"
             )
 
-            # Step 3: Extract knowledge and TODOs in parallel from same scenes
-            logger.debug(
-                "Step 3: Extracting knowledge and TODOs in parallel from scenes"
-            )
-
-            extraction_tasks = []
+            extraction_tasks = [
+                (
+                    "action",
+                    self.action_agent.extract_and_save_actions_from_scenes(
+                        scenes,
+                        keyboard_records=keyboard_records,
+                        mouse_records=mouse_records,
+                    ),
+                )
+            ]
 
             # Add KnowledgeAgent extraction if available
             if self.knowledge_agent:
@@ -388,25 +380,30 @@ class ProcessingPipeline:
                 extraction_tasks.append(("todo", todo_task))
 
             # Execute extractions in parallel
-            if extraction_tasks:
-                results = await asyncio.gather(
-                    *[task for _, task in extraction_tasks],
-                    return_exceptions=True,
-                )
+            results = await asyncio.gather(
+                *[task for _, task in extraction_tasks],
+                return_exceptions=True,
+            )
 
-                # Process results and update statistics
-                for (agent_type, _), result in zip(extraction_tasks, results):
-                    if isinstance(result, Exception):
-                        logger.error(f"{agent_type} extraction failed: {result}", exc_info=result)
-                    elif isinstance(result, int):
-                        if agent_type == "knowledge":
-                            self.stats["knowledge_created"] += result
-                            logger.debug(f"KnowledgeAgent extracted {result} knowledge items")
-                        elif agent_type == "todo":
-                            self.stats["todos_created"] += result
-                            logger.debug(f"TodoAgent extracted {result} TODO items")
-
-            # Step 4: Scenes auto garbage-collected (memory-only, no cleanup needed)
+            # Process results and update statistics
+            for (agent_type, _), result in zip(extraction_tasks, results):
+                if isinstance(result, Exception):
+                    logger.error(f"{agent_type} extraction failed: {result}", exc_info=result)
+                elif isinstance(result, int):
+                    if agent_type == "action":
+                        self.stats["actions_created"] += result
+                        self.stats["last_processing_time"] = datetime.now()
+                        logger.debug(
+                            f"ActionAgent completed: saved {result} actions from {len(scenes)} scenes"
+                        )
+                    elif agent_type == "knowledge":
+                        self.stats["knowledge_created"] += result
+                        logger.debug(f"KnowledgeAgent extracted {result} knowledge items")
+                    elif agent_type == "todo":
+                        self.stats["todos_created"] += result
+                        logger.debug(f"TodoAgent extracted {result} TODO items")
+
+            # Step 3: Scenes auto garbage-collected (memory-only, no cleanup needed)
             logger.debug("Scene descriptions will be auto garbage-collected")
 
         except Exception as e:
@@ -416,7 +413,7 @@ class ProcessingPipeline:
     def _build_input_usage_hint(self, has_keyboard: bool, has_mouse: bool) -> str:
         """Build keyboard/mouse activity hint text"""
         # Get perception settings
-        from core.settings import get_settings
+        from ..core.settings import get_settings
 
         settings = get_settings()
         keyboard_enabled = settings.get("perception.keyboard_enabled", True)
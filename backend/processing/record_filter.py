@@ -6,8 +6,8 @@ Note: Image-level deduplication is handled by ImageFilter
 
 from typing import Any, Dict, List, Optional
 
-from core.logger import get_logger
-from core.models import RawRecord, RecordType
+from ..core.logger import get_logger
+from ..core.models import RawRecord, RecordType
 
 logger = get_logger(__name__)
 
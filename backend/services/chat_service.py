@@ -19,13 +19,13 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 # Agent task manager
-from agents.manager import task_manager
-from core.db import get_db
-from core.events import emit_chat_message_chunk
-from core.logger import get_logger
-from core.models import Conversation, Message, MessageRole
-from core.protocols import ChatDatabaseProtocol
-from llm.manager import get_llm_manager
+from ..agents.manager import get_task_manager
+from ..core.db import get_db
+from ..core.events import emit_chat_message_chunk
+from ..core.logger import get_logger
+from ..core.models import Conversation, Message, MessageRole
+from ..core.protocols import ChatDatabaseProtocol
+from ..llm.manager import get_llm_manager
 
 from .chat_stream_manager import get_stream_manager
 
@@ -450,12 +450,12 @@ class ChatService:
         """
         agent_type = self._select_agent_type(task_desc)
         try:
-            task = task_manager.create_task(agent_type, task_desc)
+            task = get_task_manager().create_task(agent_type, task_desc)
             logger.debug(
                 f"Chat -> 创建 Agent 任务: {task.id} agent={agent_type} desc={task_desc}"
             )
 
-            started = await task_manager.execute_task(task.id)
+            started = await get_task_manager().execute_task(task.id)
             if started:
                 reply = (
                     f"已创建任务 `{task.id}`，由 `{agent_type}` 执行。"
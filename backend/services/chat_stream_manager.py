@@ -6,7 +6,7 @@ Keeps streaming tasks isolated per conversation so they do not interfere.
 import asyncio
 from typing import Dict, Optional
 
-from core.logger import get_logger
+from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
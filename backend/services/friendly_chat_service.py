@@ -7,13 +7,13 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from core.db import get_db
-from core.events import _emit
-from core.json_parser import parse_json_from_response
-from core.logger import get_logger
-from core.settings import get_settings
-from llm.manager import get_llm_manager
-from llm.prompt_manager import get_prompt_manager
+from ..core.db import get_db
+from ..core.events import _emit
+from ..core.json_parser import parse_json_from_response
+from ..core.logger import get_logger
+from ..core.settings import get_settings
+from ..llm.manager import get_llm_manager
+from ..llm.prompt_manager import get_prompt_manager
 
 logger = get_logger(__name__)
 
@@ -207,7 +207,7 @@ class FriendlyChatService:
 
             # Record token usage to dashboard
             try:
-                from core.dashboard.manager import get_dashboard_manager
+                from ..core.dashboard.manager import get_dashboard_manager
 
                 dashboard = get_dashboard_manager()
                 model_info = self.llm_manager.get_active_model_info()
@@ -8,8 +8,8 @@ import sys
 from importlib import import_module
 from typing import Any, Callable, Dict, Optional, Tuple
 
-from core.logger import get_logger
-from models.permissions import (
+from ..core.logger import get_logger
+from ..models.permissions import (
     PermissionInfo,
     PermissionsCheckResponse,
     PermissionStatus,
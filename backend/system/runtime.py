@@ -11,10 +11,10 @@ import signal
 import threading
 from typing import Optional
 
-from config.loader import get_config
-from core.coordinator import PipelineCoordinator, get_coordinator
-from core.db import get_db
-from core.logger import get_logger
+from ..config.loader import get_config
+from ..core.coordinator import PipelineCoordinator, get_coordinator
+from ..core.db import get_db
+from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -131,15 +131,15 @@ async def start_runtime(config_file: Optional[str] = None) -> PipelineCoordinato
     db = get_db()
 
     # Initialize Settings manager (database persistence, TOML as fallback)
-    from core.db import switch_database
-    from core.settings import get_settings, init_settings
+    from ..core.db import switch_database
+    from ..core.settings import get_settings, init_settings
 
     init_settings(config_loader, db)
 
     # Check if different database path is configured in config.toml, switch if so
     settings = get_settings()
     try:
-        from perception.image_manager import get_image_manager
+        from ..perception.image_manager import get_image_manager
 
         image_manager = get_image_manager()
         image_manager.update_storage_path(settings.get_screenshot_path())
@@ -187,7 +187,7 @@ async def start_runtime(config_file: Optional[str] = None) -> PipelineCoordinato
 
     # Initialize friendly chat service
     try:
-        from services.friendly_chat_service import init_friendly_chat_service
+        from ..services.friendly_chat_service import init_friendly_chat_service
 
         await init_friendly_chat_service()
         logger.info("✓ Friendly chat service initialized")
@@ -204,6 +204,15 @@ async def stop_runtime(*, quiet: bool = False) -> PipelineCoordinator:
         quiet: When True, only log debug messages, avoid terminal shutdown messages.
     """
 
+    # Agent tasks run independently of the pipeline; just deliver their
+    # pending status updates before the app goes away
+    try:
+        from ..agents.manager import flush_task_updates
+
+        flush_task_updates()
+    except Exception as e:
+        logger.warning(f"Failed to flush agent task updates: {e}")
+
     coordinator = get_coordinator()
     if not coordinator.is_running:
         if not quiet:
@@ -215,7 +224,7 @@ async def stop_runtime(*, quiet: bool = False) -> PipelineCoordinator:
 
     # Stop friendly chat service first
     try:
-        from services.friendly_chat_service import get_friendly_chat_service
+        from ..services.friendly_chat_service import get_friendly_chat_service
 
         chat_service = get_friendly_chat_service()
         await chat_service.stop()
@@ -1,5 +1,6 @@
 import sys
 from importlib import import_module
+from importlib.util import find_spec
 from os import getenv
 from pathlib import Path
 
@@ -63,6 +64,11 @@ register_pytauri_commands = getattr(
 # This automatically disables in packaged applications
 PYTAURI_GEN_TS = getenv("PYTAURI_GEN_TS") == "1"
 
+# Run the backend on uvloop (winloop on Windows) when it is installed;
+# otherwise fall back to the default asyncio event loop
+_FAST_LOOP_MODULE = "winloop" if sys.platform == "win32" else "uvloop"
+PORTAL_BACKEND_OPTIONS = {"use_uvloop": find_spec(_FAST_LOOP_MODULE) is not None}
+
 # ⭐ Enable this feature first
 commands = Commands(experimental_gen_ts=PYTAURI_GEN_TS)
 
@@ -126,7 +132,7 @@ def main() -> int:
             except Exception:
                 pass
 
-    with start_blocking_portal("asyncio") as portal:
+    with start_blocking_portal("asyncio", PORTAL_BACKEND_OPTIONS) as portal:
         if PYTAURI_GEN_TS:
             # ⭐ Generate TypeScript Client to your frontend `src/client` directory
             output_dir = (
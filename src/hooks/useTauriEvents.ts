@@ -68,8 +68,15 @@ export interface TaskUpdatePayload {
   error?: string
 }
 
+export interface TaskUpdatesPayload {
+  updates: TaskUpdatePayload[]
+}
+
 export function useTaskUpdates(onUpdate: (payload: TaskUpdatePayload) => void) {
-  useTauriEvent('agent-task-update', onUpdate)
+  // The backend coalesces task updates and sends them in batches
+  useTauriEvent<TaskUpdatesPayload>('agent-task-updates', (payload) => {
+    payload.updates.forEach((update) => onUpdate(update))
+  })
 }
 
 /**